@@ -1,11 +1,23 @@
 # announce_models.py
 from pydantic import BaseModel
+from typing import List
 
 # 전기차 충전사업 공고 모델 정의   
 class Announcement(BaseModel):
     title: str
     link: str
     date: str
+
+# 아카이브된 원본 페이지 스냅샷 모델
+class AnnouncementSnapshot(BaseModel):
+    timestamp: str
+    sha256: str
+    url: str
+    size: int
+
+# 스냅샷을 현재 파서로 다시 추출한 결과 모델
+class AnnouncementReplay(AnnouncementSnapshot):
+    announcements: List[Announcement]
     
 # 서울시 전기차 충전사업 공고 모델 정의 
 class Announcement_Playwright:
@@ -1,13 +1,15 @@
 # app/api/v1/endpoints/community.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, AsyncGenerator
+from typing import List, AsyncGenerator, Optional
 from app import schemas
 from app.crud import community as crud
+from app.crud.users import get_user_posts
+from app.crud import search as search_crud
 from app.config import get_logger
-from app.database import SessionLocal
+from app.database import SessionLocal, ReadSessionLocal
 from app.core.security import get_current_user
+from app.utils.cursor import decode_cursor, next_cursor
 
 logger = get_logger()
 
@@ -21,31 +23,45 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+# Read-only AsyncSession for GET endpoints
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
+
 @router.get("", response_model=schemas.CommunityPostsResponse)
-async def read_community_posts(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)):
-    posts_with_counts, total_count = await crud.get_community_posts_with_count(db, skip=skip, limit=limit)
-    return {'items': posts_with_counts, 'total': total_count}
+async def read_community_posts(skip: int = 0, limit: int = 10, cursor: Optional[str] = None, estimate: bool = False, db: AsyncSession = Depends(get_read_db)):
+    try:
+        after = decode_cursor(cursor, 2)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    posts_with_counts, total_count = await crud.get_community_posts_with_count(db, skip=skip, limit=limit, after=after, estimate=estimate)
+    return {'items': posts_with_counts, 'total': total_count, 'next_cursor': next_cursor(posts_with_counts, limit, 'created_at', 'id')}
+
+@router.get("/search", response_model=schemas.SearchResponse[schemas.CommunityPostSearchHit])
+async def search_posts(query: str = Query(..., min_length=1), skip: int = 0, limit: int = Query(10, le=100), sort: str = Query('relevance', pattern='^(relevance|recent)$'), db: AsyncSession = Depends(get_read_db)):
+    items = await search_crud.search_community_posts(db, query, skip=skip, limit=limit, sort=sort)
+    return schemas.SearchResponse(items=items, query=query, skip=skip, limit=limit)
 
 @router.get("/user/posts", response_model=List[schemas.CommunityPost])
-async def read_user_posts(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db), current_user: schemas.User = Depends(get_current_user)):
+async def read_user_posts(response: Response, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, db: AsyncSession = Depends(get_read_db), current_user: schemas.User = Depends(get_current_user)):
+    try:
+        after = decode_cursor(cursor, 2)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     user_id = current_user.id
-    posts = await crud.get_user_posts(db, user_id=user_id, skip=skip, limit=limit)
+    posts = await get_user_posts(db, user_id=user_id, skip=skip, limit=limit, after=after)
+    # 응답 본문이 목록이므로 다음 페이지 커서는 헤더로 전달합니다.
+    cursor = next_cursor(posts, limit, 'created_at', 'id')
+    if cursor:
+        response.headers['X-Next-Cursor'] = cursor
     return posts
 
-@router.get("/{post_id}", response_model=schemas.CommunityPost)
-async def read_community_post(post_id: int, db: AsyncSession = Depends(get_db)):
-    post = await crud.get_community_post(db, post_id)
+@router.get("/{post_id}", response_model=schemas.CommunityPostDetail)
+async def read_community_post(post_id: int, db: AsyncSession = Depends(get_read_db)):
+    post = await crud.get_community_post_detail(db, post_id)
     if post is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-
-    like_count = await crud.get_like_count(db, post_id)
-    comment_count = await crud.get_comment_count(db, post_id)
-
-    post_data = jsonable_encoder(post)
-    post_data['likeCount'] = like_count
-    post_data['commentCount'] = comment_count
-    
-    return schemas.CommunityPost.parse_obj(post_data)
+    return post
 
 @router.post("", response_model=schemas.CommunityPost)
 async def create_community_post(
@@ -78,9 +94,22 @@ async def like_community_post(post_id: int, db: AsyncSession = Depends(get_db)):
 async def create_comment(post_id: int, comment: schemas.CommentCreate, db: AsyncSession = Depends(get_db)):
     return await crud.create_comment(db, post_id, comment)
 
+@router.get("/comments/counts", response_model=List[schemas.CommentCount])
+async def read_comment_counts(post_ids: List[int] = Query(..., max_length=500), db: AsyncSession = Depends(get_read_db)):
+    counts = await crud.get_comment_counts(db, list(dict.fromkeys(post_ids)))
+    return [{'post_id': post_id, 'count': count} for post_id, count in counts.items()]
+
 @router.get("/{post_id}/comments", response_model=List[schemas.Comment])
-async def read_comments(post_id: int, db: AsyncSession = Depends(get_db)):
-    comments = await crud.get_comments_by_post_id(db, post_id)
+async def read_comments(response: Response, post_id: int, limit: int = Query(50, ge=1, le=200), cursor: Optional[str] = None, db: AsyncSession = Depends(get_read_db)):
+    try:
+        after = decode_cursor(cursor, 2)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    comments = await crud.get_comments_by_post_id(db, post_id, limit=limit, after=after)
+    # 응답 본문이 목록이므로 다음 페이지 커서는 헤더로 전달합니다.
+    cursor = next_cursor(comments, limit, 'created_at', 'id')
+    if cursor:
+        response.headers['X-Next-Cursor'] = cursor
     return comments
 
 @router.delete("/comments/{comment_id}", response_model=schemas.Comment)
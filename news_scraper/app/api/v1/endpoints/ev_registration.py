@@ -1,13 +1,17 @@
 # app/api/v1/endpoints/vehicle_registration.py
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, AsyncGenerator
 from app import schemas
 from app.crud import ev_registration as crud
 from app.config import get_logger
-from app.database import SessionLocal
-from app.utils.xls_to_database import load_excel_to_db
-
+from app.database import SessionLocal, ReadSessionLocal
+from app.core.config import settings
+from app.utils.ev_timeseries import ev_timeseries
+from app.utils.exports import EXPORT_FORMATS, EXPORT_FORMAT_PATTERN, export_response, iter_query_batches
+from app.utils.jobs import jobs
+from app.utils.xls_to_database import MULTIPART_OVERHEAD_BYTES, UploadTooLargeError, save_upload, start_ev_import_job
 logger = get_logger()
 
 router = APIRouter()
@@ -20,30 +24,127 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
-@router.post("/upload-excel")
-async def upload_excel(file: UploadFile = File(...), db: AsyncSession = Depends(get_db)):
-    file_location = f"/tmp/{file.filename}"
-    with open(file_location, "wb+") as file_object:
-        file_object.write(file.file.read())
+# Read-only AsyncSession for GET endpoints
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
+
+# 업로드 요청 본문(multipart/form-data). 본문을 직접 읽으므로 OpenAPI 스키마를 따로 적습니다.
+UPLOAD_EXCEL_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"multipart/form-data": {"schema": {
+            "type": "object",
+            "properties": {"file": {"type": "string", "format": "binary"}},
+            "required": ["file"],
+        }}},
+    }
+}
 
+@router.post("/upload-excel", response_model=schemas.Job, status_code=status.HTTP_202_ACCEPTED, openapi_extra=UPLOAD_EXCEL_BODY)
+async def upload_excel(request: Request):
+    """
+    Parses the multipart body as it arrives and streams the sheet straight to a temporary file
+    (rejecting it with 413 as soon as it exceeds EV_UPLOAD_MAX_BYTES, with or without Content-Length)
+    and imports it in a background job: parsing runs in a process pool, rows are upserted in chunks.
+    Poll the returned job id for progress.
+    """
+    # Content-Length로 알 수 있으면 본문을 읽기 전에 거절합니다.
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > settings.EV_UPLOAD_MAX_BYTES + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=f"File exceeds the {settings.EV_UPLOAD_MAX_BYTES} byte upload limit")
+
+    # request.form()은 파일 파트 전체를 먼저 임시 파일에 받아 두므로, 본문 스트림을 직접 파싱합니다.
     try:
-        from app.utils.xls_to_database import load_excel_to_db
-        await load_excel_to_db(file_location, db)
-    except Exception as e:
+        file_path, filename = await save_upload(request.stream(), request.headers.get("content-type", ""), settings.EV_UPLOAD_MAX_BYTES)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    return start_ev_import_job(file_path, filename)
 
-    return {"success": True, "filename": file.filename}
+@router.get("/upload-excel/jobs/{job_id}", response_model=schemas.Job)
+async def read_import_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 @router.get("", response_model=List[schemas.EVRegistration])
-async def get_registrations(year: Optional[int] = None, month: Optional[int] = None, region: Optional[str] = None, skip: int = 0, limit: Optional[int] = None, db: AsyncSession = Depends(get_db)):
+async def get_registrations(year: Optional[int] = None, month: Optional[int] = None, region: Optional[str] = None, skip: int = 0, limit: Optional[int] = None, db: AsyncSession = Depends(get_read_db)):
     return await crud.get_ev_registrations_by_date(db, year=year, month=month, region=region, skip=skip, limit=limit)
 
+@router.get("/export", response_class=StreamingResponse, responses={200: {"content": {media_type: {} for media_type in EXPORT_FORMATS.values()}}})
+async def export_registrations(format: str = Query('ndjson', pattern=EXPORT_FORMAT_PATTERN)):
+    """Stream every registration row as NDJSON, CSV or Parquet, reading EXPORT_BATCH_SIZE rows at a time."""
+    batches = iter_query_batches(ReadSessionLocal, crud.ev_registrations_export_query(), settings.EXPORT_BATCH_SIZE)
+    return export_response(batches, crud.EV_REGISTRATION_EXPORT_COLUMNS, format, "ev_registrations")
+
+# 집계 API: 롤업 테이블에서 읽으므로 원본 행을 내려받아 합산할 필요가 없습니다.
+@router.get("/stats/regions", response_model=List[schemas.EVRegionTotal])
+async def get_totals_by_region(year: Optional[int] = None, db: AsyncSession = Depends(get_read_db)):
+    return await crud.get_totals_by_region(db, year=year)
+
+@router.get("/stats/years", response_model=List[schemas.EVYearTotal])
+async def get_totals_by_year(region: Optional[str] = None, db: AsyncSession = Depends(get_read_db)):
+    return await crud.get_totals_by_year(db, region=region)
+
+@router.get("/stats/months", response_model=List[schemas.EVMonthTotal])
+async def get_totals_by_month(year: Optional[int] = None, db: AsyncSession = Depends(get_read_db)):
+    return await crud.get_totals_by_month(db, year=year)
+
+@router.get("/stats/yoy", response_model=List[schemas.EVYearOverYear])
+async def get_year_over_year(region: Optional[str] = None, db: AsyncSession = Depends(get_read_db)):
+    return await crud.get_year_over_year(db, region=region)
+
+# 추세 분석 API: 메모리의 지역 x 월 배열로 계산하므로 요청마다 SQL을 실행하지 않습니다.
+@router.get("/analytics/trend", response_model=List[schemas.EVTrendPoint])
+async def get_trend(region: Optional[str] = None, window: int = Query(3, ge=1, le=36)):
+    try:
+        return ev_timeseries.trend(region=region, window=window)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Region not found")
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+def _arrow_stream(regions: List[str], years, months, values) -> bytes:
+    import pyarrow as pa  # 무거운 의존성은 Arrow 응답을 요청받았을 때만 로드합니다.
+
+    # 월 한 행에 지역별 열: 차트 라이브러리가 열 단위로 바로 읽을 수 있습니다.
+    columns = {'year': pa.array(years, pa.int16()), 'month': pa.array(months, pa.int8())}
+    columns.update((region, pa.array(row, pa.int32())) for region, row in zip(regions, values))
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+@router.get("/pivot", response_model=schemas.EVPivot, responses={200: {"content": {ARROW_STREAM: {}}}})
+async def get_pivot(request: Request, response: Response, region: Optional[List[str]] = Query(None), year_from: Optional[int] = None, year_to: Optional[int] = None):
+    """
+    Registrations as a region x month matrix of parallel arrays instead of one object per row.
+    Send `Accept: application/vnd.apache.arrow.stream` to get an Arrow IPC stream (one row per month, one column per region).
+    """
+    try:
+        regions, years, months, values = ev_timeseries.pivot(regions=region, year_from=year_from, year_to=year_to)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Region not found: {e.args[0]}")
+    # 같은 URL이 Accept에 따라 JSON 또는 Arrow로 응답하므로 캐시가 두 표현을 구분하도록 알립니다.
+    if ARROW_STREAM in request.headers.get("accept", ""):
+        return Response(content=_arrow_stream(regions, years, months, values), media_type=ARROW_STREAM, headers={'Vary': 'Accept'})
+    response.headers['Vary'] = 'Accept'
+    return {'regions': regions, 'years': years.tolist(), 'months': months.tolist(), 'values': values.tolist()}
+
+@router.get("/analytics/share", response_model=List[schemas.EVRegionShare])
+async def get_region_share(year: Optional[int] = None, month: Optional[int] = Query(None, ge=1, le=12)):
+    return ev_timeseries.share(year=year, month=month)
+
 @router.post("", response_model=schemas.EVRegistration)
 async def create_registration(registration: schemas.EVRegistrationCreate, db: AsyncSession = Depends(get_db)):
     return await crud.create_ev_registration(db, registration)
 
 @router.get("/{registration_id}", response_model=schemas.EVRegistration)
-async def read_registration(registration_id: int, db: AsyncSession = Depends(get_db)):
+async def read_registration(registration_id: int, db: AsyncSession = Depends(get_read_db)):
     db_registration = await crud.get_ev_registration(db, registration_id)
     if db_registration is None:
         raise HTTPException(status_code=404, detail="EV registration not found")
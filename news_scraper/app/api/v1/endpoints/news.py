@@ -1,11 +1,19 @@
 # app/api/v1/endpoints/news.py
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List, AsyncGenerator
+from typing import List, AsyncGenerator, Optional
 from app import schemas, models
 from app.crud import news as crud
-from app.database import SessionLocal
+from app.crud import search as search_crud
+from app.database import SessionLocal, ReadSessionLocal
+from app.rss_scheduler import last_feed_stats
+from app.article_pipeline import article_pipeline, decompress_body
+from app.utils.cursor import decode_cursor, next_cursor
+from app.core.security import get_optional_user_id
+from app.core.config import settings
+from app.utils.exports import EXPORT_FORMATS, EXPORT_FORMAT_PATTERN, export_response, iter_query_batches
 
 router = APIRouter()
 
@@ -14,27 +22,72 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         yield session
 
+# Read-only AsyncSession for GET endpoints
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
+
 @router.post("", response_model=schemas.News, status_code=status.HTTP_201_CREATED)
 async def create_news_item(news: schemas.NewsCreate, db: AsyncSession = Depends(get_db)):
     return await crud.create_news(db=db, news=news)
 
 @router.get("", response_model=schemas.NewsResponse[schemas.News])  # Adjust this line
-async def read_news(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)):
-    items = await crud.get_news(db=db, skip=skip, limit=limit)
-    total = await crud.get_news_count(db=db)
-    return schemas.NewsResponse(items=items, total=total)  # Adjust this line
+async def read_news(skip: int = 0, limit: int = 10, cursor: Optional[str] = None, estimate: bool = False, db: AsyncSession = Depends(get_read_db)):
+    # cursor가 있으면 skip 대신 키셋 페이지네이션을 사용합니다.
+    try:
+        after = decode_cursor(cursor, 2)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items = await crud.get_news(db=db, skip=skip, limit=limit, after=after)
+    # estimate=true면 정확한 개수 대신 통계 기반 추정치를 반환합니다.
+    total = await crud.get_news_count(db=db, estimate=estimate)
+    return schemas.NewsResponse(items=items, total=total, next_cursor=next_cursor(items, limit, 'published_at', 'id'))
 
 @router.get("/search", response_model=List[schemas.News])
-async def search_news(query: str = Query(...), db: AsyncSession = Depends(get_db)):
-    news_query = select(models.News).where(models.News.title.contains(query)).limit(10)
-    result = await db.execute(news_query)
-    news_items = result.scalars().all()
+async def search_news(query: str = Query(...), skip: int = 0, limit: int = Query(10, le=100), db: AsyncSession = Depends(get_read_db)):
+    news_items = await search_crud.search_news(db, query, skip=skip, limit=limit)
     if not news_items:
         raise HTTPException(status_code=404, detail="No news found for your search")
     return news_items
 
+@router.get("/search/snippets", response_model=schemas.SearchResponse[schemas.NewsSearchHit])
+async def search_news_snippets(query: str = Query(..., min_length=1), skip: int = 0, limit: int = Query(10, le=100), sort: str = Query('relevance', pattern='^(relevance|recent)$'), db: AsyncSession = Depends(get_read_db)):
+    """제목과 요약을 BM25 순으로 검색하고, 일치 부분을 강조한 제목과 발췌를 함께 반환합니다."""
+    items = await search_crud.search_news(db, query, skip=skip, limit=limit, sort=sort)
+    return schemas.SearchResponse(items=items, query=query, skip=skip, limit=limit)
+
+@router.get("/export", response_class=StreamingResponse, responses={200: {"content": {media_type: {} for media_type in EXPORT_FORMATS.values()}}})
+async def export_news(format: str = Query('ndjson', pattern=EXPORT_FORMAT_PATTERN)):
+    """Stream every news item as NDJSON, CSV or Parquet, reading EXPORT_BATCH_SIZE rows at a time."""
+    batches = iter_query_batches(ReadSessionLocal, crud.news_export_query(), settings.EXPORT_BATCH_SIZE)
+    return export_response(batches, crud.NEWS_EXPORT_COLUMNS, format, "news")
+
+@router.get("/feeds/stats", response_model=List[schemas.FeedStats])
+async def read_feed_stats():
+    """Per-feed latency and item counts from the most recent RSS fetch cycle."""
+    return last_feed_stats
+
+@router.get("/content/stats", response_model=schemas.ArticlePipelineStats)
+async def read_article_pipeline_stats():
+    """Throughput and progress of the article body extraction pipeline."""
+    return article_pipeline.stats()
+
+@router.get("/{news_id}/content", response_model=schemas.NewsContent)
+async def read_news_content(news_id: int, db: AsyncSession = Depends(get_read_db)):
+    content = await crud.get_news_content(db=db, news_id=news_id)
+    if content is None:
+        raise HTTPException(status_code=404, detail="News content not available yet")
+    return schemas.NewsContent(
+        news_id=content.news_id,
+        status=content.status,
+        body=decompress_body(content.body),
+        summary=content.summary,
+        image_url=content.image_url,
+        fetched_at=content.fetched_at,
+    )
+
 @router.get("/{news_id}", response_model=schemas.News)
-async def read_news_item(news_id: int, db: AsyncSession = Depends(get_db)):
+async def read_news_item(news_id: int, db: AsyncSession = Depends(get_read_db)):
     db_news = await crud.get_news_by_id(db=db, news_id=news_id)
     if db_news is None:
         raise HTTPException(status_code=404, detail="News item not found")
@@ -49,8 +102,8 @@ async def delete_news_item(news_id: int, db: AsyncSession = Depends(get_db)):
     return await crud.delete_news(db=db, news_id=news_id)
 
 @router.post("/{news_id}/vote", response_model=schemas.News)
-async def vote_on_news(news_id: int, vote: schemas.VoteCreate, db: AsyncSession = Depends(get_db)):
-    news_item = await crud.vote_news(db=db, news_id=news_id, vote_value=vote.vote_value)
+async def vote_on_news(news_id: int, vote: schemas.VoteCreate, db: AsyncSession = Depends(get_db), user_id: Optional[int] = Depends(get_optional_user_id)):
+    news_item = await crud.vote_news(db=db, news_id=news_id, vote_value=vote.vote_value, user_id=user_id)
     if not news_item:
         raise HTTPException(status_code=404, detail="News item not found")
     return news_item  # Directly return the ORM model, FastAPI will convert it based on your Pydantic schema
\ No newline at end of file
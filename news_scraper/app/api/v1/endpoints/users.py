@@ -3,17 +3,17 @@ import os
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Request
 from fastapi.responses import RedirectResponse, JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, AsyncGenerator
+from typing import List, AsyncGenerator, Optional
 from app import schemas
 from app.crud import users as crud
 from app.config import get_logger
-from app.database import SessionLocal
-from aiohttp import ClientSession
+from app.database import SessionLocal, ReadSessionLocal
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from app.core.security import create_access_token, verify_access_token, get_current_user
 from datetime import timedelta, timezone
 from fastapi_login import LoginManager
 from app.core.config import settings
+from app.utils.cursor import decode_cursor, next_cursor
 
 logger = get_logger()
 
@@ -31,6 +31,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+# Read-only AsyncSession for GET endpoints
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
+
 GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
 GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET")
 GITHUB_REDIRECT_URI = os.getenv("GITHUB_REDIRECT_URI")
@@ -86,6 +91,7 @@ def github_login():
 
 @router.get("/auth/github/callback")
 async def github_callback(code: str, db: AsyncSession = Depends(get_db)):
+    from aiohttp import ClientSession
     async with ClientSession() as session:
         token_url = "https://github.com/login/oauth/access_token"
         token_data = {
@@ -127,13 +133,21 @@ async def github_callback(code: str, db: AsyncSession = Depends(get_db)):
         return user
 
 @router.get("/{user_id}", response_model=schemas.User)
-async def read_user(user_id: int, db: AsyncSession = Depends(get_db)):
+async def read_user(user_id: int, db: AsyncSession = Depends(get_read_db)):
     user = await crud.get_user(db, user_id=user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 @router.get("/", response_model=List[schemas.User])
-async def read_all_users(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)):
-    users = await crud.get_users(db, skip=skip, limit=limit)
+async def read_all_users(response: Response, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, db: AsyncSession = Depends(get_read_db)):
+    try:
+        after = decode_cursor(cursor, 1)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    users = await crud.get_users(db, skip=skip, limit=limit, after_id=after[0] if after else None)
+    # 응답 본문이 목록이므로 다음 페이지 커서는 헤더로 전달합니다.
+    cursor = next_cursor(users, limit, 'id')
+    if cursor:
+        response.headers['X-Next-Cursor'] = cursor
     return users
@@ -1,12 +1,15 @@
 # app/api/v1/endpoints/vehicle.py
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.vehicle_scrapers.tesla_scraper import scrape_tesla_specs
+from app.vehicle_scrapers.scrape_jobs import start_vehicle_scrape_job, to_vehicle_spec
+from app.utils.jobs import jobs
+from app.core.config import settings
 from typing import List, AsyncGenerator
 from app import schemas
 from app.crud import vehicle as crud
 from app.config import get_logger
-from app.database import SessionLocal
+from app.database import SessionLocal, ReadSessionLocal
 
 logger = get_logger()
 
@@ -24,6 +27,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+# Read-only AsyncSession for GET endpoints
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
+
 @router.post("", response_model=schemas.VehicleSpec, summary="Create a new vehicle specification", description="Creates a new entry in the database for a vehicle specification.")
 async def create_vehicle_spec(
     vehicle_spec_data: schemas.VehicleSpecCreate = Body(...),
@@ -38,23 +46,39 @@ async def create_vehicle_spec(
 @router.post("/scrape", response_model=schemas.VehicleSpec)
 async def scrape_vehicle_spec(model_url: str, db: AsyncSession = Depends(get_db)):
     scraped_data = await scrape_tesla_specs(model_url)  # Now the function accepts a URL
-    vehicle_spec_data = schemas.VehicleSpecCreate(**scraped_data)
-    return await crud.create_vehicle_spec(db=db, vehicle_spec=vehicle_spec_data)
+    # 찾지 못한 행(0/빈 문자열)은 비우고, 같은 모델을 다시 스크래핑하면 갱신합니다.
+    return await crud.upsert_vehicle_spec(db=db, vehicle_spec=to_vehicle_spec(scraped_data))
+
+@router.post("/scrape/jobs", response_model=schemas.Job, status_code=status.HTTP_202_ACCEPTED, summary="Start a bulk vehicle spec scrape job")
+async def create_vehicle_scrape_job(request: schemas.VehicleScrapeRequest):
+    """
+    Scrapes the given model URLs concurrently in the background and upserts the results into
+    vehicle_specs keyed by manufacturer and model. Poll the returned job id for progress.
+    """
+    concurrency = request.concurrency or settings.VEHICLE_SCRAPE_CONCURRENCY
+    return start_vehicle_scrape_job(request.urls, concurrency)
+
+@router.get("/scrape/jobs/{job_id}", response_model=schemas.Job, summary="Get the status of a vehicle spec scrape job")
+async def read_vehicle_scrape_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 @router.get("/{manufacturer}", response_model=List[schemas.VehicleSpec])
-async def read_vehicle_specs_by_manufacturer(manufacturer: str, db: AsyncSession = Depends(get_db)):
+async def read_vehicle_specs_by_manufacturer(manufacturer: str, db: AsyncSession = Depends(get_read_db)):
     vehicle_specs = await crud.get_vehicle_specs_by_manufacturer(db, manufacturer)
     if not vehicle_specs:
         raise HTTPException(status_code=404, detail="No vehicle specifications found for this manufacturer")
     return vehicle_specs
 
 @router.get("/{model_name}", response_model=schemas.VehicleSpec)
-async def read_vehicle_spec_by_model(model_name: str, db: AsyncSession = Depends(get_db)):
+async def read_vehicle_spec_by_model(model_name: str, db: AsyncSession = Depends(get_read_db)):
     vehicle = await crud.get_vehicle_spec_by_model(db=db, model_name=model_name)
     if vehicle is None:
         raise HTTPException(status_code=404, detail="Vehicle specification not found")
     return vehicle
 
 @router.get("", response_model=List[schemas.VehicleSpec])
-async def read_all_vehicle_specs(db: AsyncSession = Depends(get_db)):
+async def read_all_vehicle_specs(db: AsyncSession = Depends(get_read_db)):
     return await crud.get_vehicle_specs(db=db)
\ No newline at end of file
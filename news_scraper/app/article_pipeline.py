@@ -0,0 +1,162 @@
+# app/article_pipeline.py
+import asyncio
+import multiprocessing
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import zstandard
+from .database import SessionLocal
+from .crud.news import get_news_without_content, save_news_contents
+from .config import get_logger
+from .core.config import settings
+from .utils.article_extractor import extract_article
+from .utils.http_client import get_http_session
+
+logger = get_logger()
+
+MAX_ARTICLE_BYTES = 5 * 1024 * 1024
+GOOGLE_NEWS_HOST = 'news.google.com'
+
+class ArticlePipeline:
+    """
+    새로 수집된 뉴스의 기사 페이지를 가져와 본문, 요약, 대표 이미지를 저장하는 백그라운드 파이프라인입니다.
+
+    - 가져오기: 호스트별 슬롯을 먼저 잡은 뒤 전체 슬롯을 잡으므로, 한 호스트를 기다리는 기사가 전체 슬롯을 차지하지 않습니다.
+    - 추출: HTML 파싱은 CPU 작업이므로 프로세스 풀에서 실행합니다.
+    - 재개: 처리 상태를 news_contents에 기록하므로, 재시작하면 남은 기사부터 이어서 처리합니다.
+      실패한 기사는 ARTICLE_RETRY_DELAY_SECONDS가 지난 뒤에 다시 시도합니다.
+
+    제한: Google News 검색 피드의 링크는 news.google.com 주소입니다. HTTP 리다이렉트는 따라가지만,
+    JavaScript로 원문에 이동하는 링크는 원문 주소를 알 수 없어 실패로 기록합니다.
+    이런 링크는 모두 같은 호스트로 취급되어 ARTICLE_PER_HOST_CONCURRENCY 안에서만 동시에 가져옵니다.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self.running = False
+        self.processed = 0
+        self.failed = 0
+        self.bytes_fetched = 0
+        self.last_batch_size = 0
+        self.last_batch_seconds = 0.0
+
+    @property
+    def articles_per_second(self) -> float:
+        if not self.last_batch_seconds:
+            return 0.0
+        return round(self.last_batch_size / self.last_batch_seconds, 2)
+
+    def stats(self) -> dict:
+        return {
+            'running': self.running,
+            'processed': self.processed,
+            'failed': self.failed,
+            'bytes_fetched': self.bytes_fetched,
+            'last_batch_size': self.last_batch_size,
+            'last_batch_seconds': round(self.last_batch_seconds, 3),
+            'articles_per_second': self.articles_per_second,
+        }
+
+    def _executor_instance(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 이벤트 루프와 스레드가 도는 서버 프로세스를 fork하지 않도록 spawn으로 작업 프로세스를 만듭니다.
+            self._executor = ProcessPoolExecutor(max_workers=settings.ARTICLE_EXTRACT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(settings.ARTICLE_PER_HOST_CONCURRENCY)
+        return self._host_semaphores[host]
+
+    async def _fetch(self, url: str, semaphore: asyncio.Semaphore) -> str:
+        session = await get_http_session()
+        async with self._host_semaphore(url), semaphore:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                if response.url.host == GOOGLE_NEWS_HOST:
+                    raise ValueError("Google News link did not redirect to the article")
+                raw = await response.content.read(MAX_ARTICLE_BYTES)
+                self.bytes_fetched += len(raw)
+                return raw.decode(response.get_encoding() or 'utf-8', errors='replace')
+
+    async def _process(self, news_id: int, url: str, semaphore: asyncio.Semaphore) -> dict:
+        try:
+            html = await self._fetch(url, semaphore)
+            loop = asyncio.get_running_loop()
+            article = await loop.run_in_executor(self._executor_instance(), extract_article, html)
+            if not article['body']:
+                raise ValueError("No article body found")
+            self.processed += 1
+            return {
+                'news_id': news_id,
+                'status': 'done',
+                'body': self._compressor.compress(article['body'].encode('utf-8')),
+                'summary': article['summary'],
+                'image_url': article['image_url'],
+            }
+        except Exception as e:
+            self.failed += 1
+            logger.warning(f"Article extraction failed for news {news_id} ({url}): {e}")
+            return {
+                'news_id': news_id,
+                'status': 'failed',
+                'error': str(e)[:500],
+                'next_attempt_at': datetime.now() + timedelta(seconds=settings.ARTICLE_RETRY_DELAY_SECONDS),
+            }
+
+    async def run_batch(self) -> int:
+        """처리할 기사 한 배치를 가져와 처리하고, 처리한 개수를 반환합니다."""
+        async with SessionLocal() as session:
+            pending = await get_news_without_content(session, settings.ARTICLE_BATCH_SIZE, settings.ARTICLE_MAX_ATTEMPTS)
+        if not pending:
+            return 0
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(settings.ARTICLE_FETCH_CONCURRENCY)
+        contents = await asyncio.gather(*(self._process(news_id, url, semaphore) for news_id, url in pending))
+        async with SessionLocal() as session:
+            await save_news_contents(session, list(contents))
+
+        self.last_batch_size = len(pending)
+        self.last_batch_seconds = time.perf_counter() - started
+        logger.info(
+            f"Article pipeline processed {len(pending)} articles in {self.last_batch_seconds:.1f}s "
+            f"({self.articles_per_second} articles/s)"
+        )
+        return len(pending)
+
+    async def run_forever(self):
+        self.running = True
+        try:
+            while True:
+                try:
+                    # 남은 기사가 있으면 쉬지 않고 다음 배치를 처리합니다. 실패한 기사는 next_attempt_at까지 제외됩니다.
+                    while await self.run_batch():
+                        pass
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"An unexpected error occurred in article pipeline: {e}")
+                await asyncio.sleep(settings.ARTICLE_PIPELINE_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            logger.info("Article pipeline cancelled")
+        finally:
+            self.running = False
+            self.shutdown()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+article_pipeline = ArticlePipeline()
+
+def decompress_body(body: Optional[bytes]) -> Optional[str]:
+    if body is None:
+        return None
+    return zstandard.ZstdDecompressor().decompress(body).decode('utf-8')
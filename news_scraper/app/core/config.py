@@ -1,4 +1,5 @@
 # app/core/config.py
+from typing import List
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -8,7 +9,39 @@ class Settings(BaseSettings):
     GITHUB_CLIENT_ID: str
     GITHUB_CLIENT_SECRET: str
     GITHUB_REDIRECT_URI: str
+    DATABASE_URL: str = "sqlite+aiosqlite:///./news.db"
+    # production: WAL + 튜닝된 PRAGMA + 읽기 전용 연결 풀, default: SQLite 기본 설정
+    DB_PROFILE: str = "production"
+    DB_ECHO: bool = False
+    DB_READ_POOL_SIZE: int = 5
+    DB_OPTIMIZE_INTERVAL_SECONDS: int = 3600
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_CACHE_SIZE: int = -64000
+    COUNT_CACHE_TTL_SECONDS: float = 5.0
+    EV_TIMESERIES_REFRESH_SECONDS: int = 300  # 다른 프로세스가 쓴 EV 등록 데이터를 메모리 배열에 반영하는 주기
     RSS_FETCH_INTERVAL_SECONDS: int = 86400
+    # Google News 검색 피드로 가져올 키워드와, 추가로 구독할 언론사 RSS URL 목록 (환경 변수에서는 JSON 배열)
+    RSS_KEYWORDS: List[str] = ["전기차", "충전소", "급속충전", "보조금"]
+    RSS_FEED_URLS: List[str] = []
+    RSS_FETCH_CONCURRENCY: int = 8
+    ARTICLE_PIPELINE_ENABLED: bool = True
+    ARTICLE_PIPELINE_INTERVAL_SECONDS: int = 300
+    ARTICLE_BATCH_SIZE: int = 50
+    ARTICLE_FETCH_CONCURRENCY: int = 16
+    ARTICLE_PER_HOST_CONCURRENCY: int = 2
+    ARTICLE_EXTRACT_WORKERS: int = 2
+    ARTICLE_MAX_ATTEMPTS: int = 3
+    ARTICLE_RETRY_DELAY_SECONDS: int = 1800  # 실패한 기사를 다시 가져오기까지 기다리는 시간
+    VEHICLE_SCRAPE_CONCURRENCY: int = 4
+    EV_UPLOAD_MAX_BYTES: int = 20 * 1024 * 1024  # 엑셀 업로드 최대 크기
+    EV_IMPORT_WORKERS: int = 1  # 엑셀 파싱 프로세스 수
+    EXPORT_BATCH_SIZE: int = 1000  # 내보내기에서 서버 측 커서로 한 번에 읽는 행 수
+    SNAPSHOT_ARCHIVE_ENABLED: bool = True
+    SNAPSHOT_ARCHIVE_DIR: str = "snapshots"
+    SNAPSHOT_RETENTION_DAYS: int = 30
+    SNAPSHOT_MAX_PER_REGION: int = 500
+    SNAPSHOT_ZSTD_LEVEL: int = 10
 
     class Config:
         env_file = ".env"
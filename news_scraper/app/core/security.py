@@ -1,7 +1,6 @@
 # app/core/security.py
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,11 +8,17 @@ from app.core.config import settings
 from app import schemas
 from app.database import SessionLocal
 from typing import List, AsyncGenerator
-from passlib.context import CryptContext
+from functools import lru_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login")
+# 로그인하지 않아도 되는 엔드포인트용. 토큰이 없으면 None을 넘깁니다.
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login", auto_error=False)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache
+def get_pwd_context():
+    # passlib과 bcrypt 백엔드는 로딩이 느리므로 처음 비밀번호를 다룰 때 생성합니다.
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 credentials_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -33,12 +38,13 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -49,6 +55,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def verify_access_token(token: str):
+    from jose import JWTError, jwt
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: int = payload.get("sub")
@@ -58,8 +65,18 @@ def verify_access_token(token: str):
     except JWTError:
         raise credentials_exception
 
+async def get_optional_user_id(token: Optional[str] = Depends(optional_oauth2_scheme)) -> Optional[int]:
+    """
+    Return the user id from the bearer token without a database lookup, or None for anonymous requests.
+    An invalid token is still rejected with 401.
+    """
+    if token is None:
+        return None
+    return int(verify_access_token(token))
+
 async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> schemas.User:
     from app.crud import users as crud  # Moved import inside function to prevent circular import
+    from jose import JWTError, jwt
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: int = payload.get("sub")
@@ -1,6 +1,7 @@
 from .community import (
     get_community_posts,
     get_community_post,
+    get_community_post_detail,
     get_community_posts_with_count,
     create_community_post,
     update_community_post,
@@ -8,10 +9,14 @@ from .community import (
     like_community_post,
     create_comment,
     get_comments_by_post_id,
+    get_comment_counts,
     delete_comment,
 )
 from .news import (
     create_news,
+    bulk_create_news,
+    get_feed_watermarks,
+    update_feed_watermarks,
     get_news,
     get_news_count,
     get_news_by_id,
@@ -31,6 +36,18 @@ from .vehicle import (
     get_vehicle_specs,
     get_vehicle_specs_by_manufacturer,
     get_vehicle_spec_by_model,
+    upsert_vehicle_spec,
     update_vehicle_spec,
     delete_vehicle_spec,
 )
+from .counters import (
+    ensure_counters,
+    increment_counter,
+    get_counter,
+    get_estimated_count,
+    get_total,
+)
+from .search import (
+    search_news,
+    search_community_posts,
+)
@@ -2,13 +2,15 @@
 from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, func, tuple_
 from sqlalchemy.exc import IntegrityError
 from app.schemas.community import CommunityPostUpdate, CommunityPostCreate, Comment, CommentCreate
 from sqlalchemy import select, func
+from sqlalchemy.orm import joinedload, selectinload
 from app.models.community import CommunityPost, CommunityPostLike, Comment
-from app.models.news import Like
+from app.crud.counters import increment_counter, get_total
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 async def get_community_posts(db: AsyncSession, skip: int = 0, limit: int = 10):
     result = await db.execute(
@@ -25,39 +27,37 @@ async def get_community_post(db: AsyncSession, post_id: int):
     )
     return result.scalars().first()
 
-async def get_community_posts_with_count(db: AsyncSession, skip: int = 0, limit: int = 10):
-    # Construct a query that calculates the count of likes and comments for each post.
+async def get_community_post_detail(db: AsyncSession, post_id: int):
+    """
+    Fetch a post with its author (joined), its persisted like/comment counts and the first page of comments
+    (selectin load of CommunityPost.first_comments). Returns None if the post does not exist.
+    """
+    result = await db.execute(
+        select(CommunityPost)
+        .where(CommunityPost.id == post_id)
+        .options(joinedload(CommunityPost.user), selectinload(CommunityPost.first_comments))
+    )
+    return result.scalars().first()
+
+async def get_community_posts_with_count(db: AsyncSession, skip: int = 0, limit: int = 10, after: Optional[Tuple[datetime, int]] = None, estimate: bool = False):
+    # Like and comment counts are persisted on the post, so the feed is a single range scan on
+    # ix_community_posts_created_at_id without joins or GROUP BY.
+    # With after (created_at, id) the page starts right after that post (keyset pagination) instead of using OFFSET.
     posts_query = (
-        select(
-            CommunityPost, 
-            func.count(CommunityPostLike.id).label('like_count'),
-            func.count(Comment.id).label('comment_count')
-        )
-        .outerjoin(CommunityPostLike, CommunityPostLike.post_id == CommunityPost.id)
-        .outerjoin(Comment, Comment.post_id == CommunityPost.id)
-        .group_by(CommunityPost.id)
-        .order_by(CommunityPost.created_at.desc())
-        .offset(skip)
+        select(CommunityPost)
+        .order_by(CommunityPost.created_at.desc(), CommunityPost.id.desc())
         .limit(limit)
     )
-
-    # Execute the query to fetch posts with like and comment counts
+    if after is not None:
+        posts_query = posts_query.where(tuple_(CommunityPost.created_at, CommunityPost.id) < tuple_(*after))
+    else:
+        posts_query = posts_query.offset(skip)
     result = await db.execute(posts_query)
-    posts_with_counts = result.all()  # Returns tuples of (CommunityPost, like_count, comment_count)
-
-    # Also fetch the total count of posts to facilitate pagination
-    total_count_query = select(func.count()).select_from(CommunityPost)
-    total_count_result = await db.execute(total_count_query)
-    total_count = total_count_result.scalar_one()
+    posts = result.scalars().all()
 
-    # Formatting the results correctly
-    formatted_posts = [{
-        **jsonable_encoder(post),
-        'likeCount': like_count,
-        'commentCount': comment_count
-    } for post, like_count, comment_count in posts_with_counts]
-
-    return formatted_posts, total_count
+    # Total count of posts from the maintained counter (or the planner's estimate) to facilitate pagination
+    total_count = await get_total(db, 'community_posts', estimate=estimate)
+    return posts, total_count
 
 async def create_community_post(db: AsyncSession, post_data: CommunityPostCreate, user_id: int):
     try:
@@ -68,6 +68,7 @@ async def create_community_post(db: AsyncSession, post_data: CommunityPostCreate
             updated_at=datetime.now()   # Set updated_at to current datetime
         )
         db.add(new_post)
+        await increment_counter(db, 'community_posts')
         await db.commit()
         await db.refresh(new_post)
         return new_post
@@ -139,6 +140,7 @@ async def delete_community_post(db: AsyncSession, post_id: int):
             return {"detail": "Post not found or already deleted"}  # Idempotent response
 
         await db.delete(post_to_delete)
+        await increment_counter(db, 'community_posts', -1)
         await db.commit()  # Commit the deletion
         return {"detail": "Post deleted successfully"}
 
@@ -161,8 +163,10 @@ async def like_community_post(db: AsyncSession, post_id: int) -> CommunityPost:
         new_like = CommunityPostLike(post_id=post_id)
         db.add(new_like)
 
-        # 좋아요 수 증가
-        post.likeCount += 1
+        # 좋아요 수 증가 (같은 트랜잭션에서 원자적으로)
+        await db.execute(
+            update(CommunityPost).where(CommunityPost.id == post_id).values(like_count=CommunityPost.like_count + 1)
+        )
         await db.commit()
 
         await db.refresh(post)
@@ -181,6 +185,9 @@ async def create_comment(db: AsyncSession, post_id: int, comment_data: CommentCr
     try:
         new_comment = Comment(post_id=post_id, **comment_data.model_dump())
         db.add(new_comment)
+        await db.execute(
+            update(CommunityPost).where(CommunityPost.id == post_id).values(comment_count=CommunityPost.comment_count + 1)
+        )
         await db.commit()
         await db.refresh(new_comment)
         return new_comment
@@ -188,23 +195,50 @@ async def create_comment(db: AsyncSession, post_id: int, comment_data: CommentCr
         await db.rollback()
         raise
 
-async def get_comments_by_post_id(db: AsyncSession, post_id: int):
-    result = await db.execute(
-        select(Comment).filter(Comment.post_id == post_id)
+async def get_comments_by_post_id(db: AsyncSession, post_id: int, limit: int = 50, after: Optional[Tuple[datetime, int]] = None):
+    """
+    Fetch one page of a post's comments in (created_at, id) order.
+    With after (created_at, id) of the last comment seen, the page continues from there using
+    ix_comments_post_id_created_at_id, so later pages cost the same as the first.
+    """
+    query = (
+        select(Comment)
+        .filter(Comment.post_id == post_id)
+        .order_by(Comment.created_at, Comment.id)
+        .limit(limit)
     )
+    if after is not None:
+        query = query.where(tuple_(Comment.created_at, Comment.id) > tuple_(*after))
+    result = await db.execute(query)
     comments = result.scalars().all()
     return comments
 
+async def get_comment_counts(db: AsyncSession, post_ids: List[int]) -> Dict[int, int]:
+    """
+    Count the comments of several posts in one grouped query (an index-only scan of
+    ix_comments_post_id_created_at_id). Posts without comments map to 0.
+    """
+    result = await db.execute(
+        select(Comment.post_id, func.count())
+        .where(Comment.post_id.in_(post_ids))
+        .group_by(Comment.post_id)
+    )
+    counts = dict(result.all())
+    return {post_id: counts.get(post_id, 0) for post_id in post_ids}
+
 async def delete_comment(db: AsyncSession, comment_id: int) -> Comment:
-    async with db.execute(select(Comment).filter(Comment.id == comment_id)) as result:
-        comment = result.scalars().first()
-        if comment:
-            await db.delete(comment)
-            await db.commit()
+    result = await db.execute(select(Comment).filter(Comment.id == comment_id))
+    comment = result.scalars().first()
+    if comment:
+        await db.delete(comment)
+        await db.execute(
+            update(CommunityPost).where(CommunityPost.id == comment.post_id).values(comment_count=CommunityPost.comment_count - 1)
+        )
+        await db.commit()
     return comment
 
 async def get_like_count(db: AsyncSession, post_id: int) -> int:
-    result = await db.execute(select(func.count()).filter(Like.post_id == post_id))
+    result = await db.execute(select(func.count()).filter(CommunityPostLike.post_id == post_id))
     return result.scalar_one()
 
 async def get_comment_count(db: AsyncSession, post_id: int) -> int:
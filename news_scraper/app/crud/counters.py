@@ -0,0 +1,89 @@
+# app/crud/counters.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, text, event
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.counters import Counter
+from app.models.news import News
+from app.models.community import CommunityPost
+from app.core.config import settings
+from app.utils.cache_management import TTLCache
+from typing import Optional
+
+# 카운터 이름 -> 행 수를 세는 테이블
+COUNTED_TABLES = {
+    'news': News.__table__,
+    'community_posts': CommunityPost.__table__,
+}
+
+count_cache = TTLCache(settings.COUNT_CACHE_TTL_SECONDS)
+
+# 세션에서 바뀐 카운터 이름. 커밋 전에 캐시를 지우면 다른 요청이 커밋 전 값을 다시 캐시하므로 커밋된 뒤에 지웁니다.
+PENDING_INVALIDATIONS = 'pending_counter_invalidations'
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_counters(session):
+    for name in session.info.pop(PENDING_INVALIDATIONS, ()):
+        count_cache.invalidate(name)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session):
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+async def ensure_counters(db: AsyncSession):
+    """
+    Seed missing counters with the current row count of their table (e.g. on a freshly created database).
+    Existing counters are left untouched.
+    """
+    for name, table in COUNTED_TABLES.items():
+        total = (await db.execute(select(func.count()).select_from(table))).scalar_one()
+        await db.execute(sqlite_insert(Counter).values(name=name, value=total).on_conflict_do_nothing())
+    await db.commit()
+
+async def increment_counter(db: AsyncSession, name: str, delta: int = 1):
+    """
+    Add delta to a counter. Does not commit: call it inside the transaction that inserts or deletes the rows
+    so the counter and the table never drift apart. The cached value is dropped once that transaction commits.
+    """
+    if not delta:
+        return
+    stmt = sqlite_insert(Counter).values(name=name, value=delta)
+    stmt = stmt.on_conflict_do_update(index_elements=[Counter.name], set_={'value': Counter.value + stmt.excluded.value})
+    await db.execute(stmt)
+    db.info.setdefault(PENDING_INVALIDATIONS, set()).add(name)
+
+async def get_counter(db: AsyncSession, name: str) -> int:
+    """
+    Read a counter through the short-TTL in-process cache. Falls back to count(*) if the counter was never seeded.
+    """
+    cached = count_cache.get(name)
+    if cached is not None:
+        return cached
+    value = (await db.execute(select(Counter.value).where(Counter.name == name))).scalar_one_or_none()
+    if value is None:
+        value = (await db.execute(select(func.count()).select_from(COUNTED_TABLES[name]))).scalar_one()
+    count_cache.set(name, value)
+    return value
+
+async def get_estimated_count(db: AsyncSession, name: str) -> Optional[int]:
+    """
+    Row count estimate from the planner statistics in sqlite_stat1 (refreshed by ANALYZE, see app.database).
+    Returns None when the table has not been analyzed yet.
+    """
+    # sqlite_stat1 does not exist until the first ANALYZE
+    analyzed = await db.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"))
+    if analyzed.scalar_one_or_none() is None:
+        return None
+    result = await db.execute(text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"), {'table': COUNTED_TABLES[name].name})
+    stat = result.scalar_one_or_none()
+    return int(stat.split()[0]) if stat else None
+
+async def get_total(db: AsyncSession, name: str, estimate: bool = False) -> int:
+    """
+    Total row count for list endpoints: the maintained counter, or a planner estimate when estimate is set.
+    """
+    if estimate:
+        estimated = await get_estimated_count(db, name)
+        if estimated is not None:
+            return estimated
+    return await get_counter(db, name)
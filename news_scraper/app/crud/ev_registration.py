@@ -1,8 +1,39 @@
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional, List
-from app.models.ev_registration import EVRegistration
+from sqlalchemy import delete, insert, func, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from typing import Callable, Iterable, Optional, List
+from app.models.ev_registration import EVRegistration, EVRegistrationYearlyRollup, EVRegistrationMonthlyRollup, to_period
+from app.models.news import Region
 from app.schemas.ev_registration import EVRegistrationCreate, EVRegistrationUpdate
+from app.utils.ev_timeseries import ev_timeseries
+
+BULK_UPSERT_CHUNK_SIZE = 500  # 행당 바인드 변수 3개, SQLite 변수 한도 안쪽
+
+def _chunks(items: list, size: int = BULK_UPSERT_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+async def get_region_ids(db: AsyncSession, names: Iterable[str]) -> dict:
+    """지역 이름 -> regions.id. 처음 보는 지역은 사전에 추가합니다(커밋하지 않음)."""
+    names = sorted(set(names))
+    if not names:
+        return {}
+    await db.execute(sqlite_insert(Region).values([{'name': name} for name in names]).on_conflict_do_nothing(index_elements=[Region.name]))
+    result = await db.execute(select(Region.name, Region.id).where(Region.name.in_(names)))
+    return dict(result.all())
+
+def _region_id(name: str):
+    return select(Region.id).where(Region.name == name).scalar_subquery()
+
+def _year_range(column, year: int):
+    # yyyymm 정수이므로 연도 조회는 period 인덱스의 범위 조회가 됩니다.
+    return column.between(to_period(year, 1), to_period(year, 12))
+
+def _registration_values(region_id: int, registration) -> dict:
+    return {'region_id': region_id, 'period': to_period(registration.year, registration.month), 'count': registration.count}
 
 async def get_ev_registration(db: AsyncSession, registration_id: int) -> Optional[EVRegistration]:
     result = await db.execute(select(EVRegistration).filter(EVRegistration.id == registration_id))
@@ -12,40 +43,181 @@ async def get_ev_registrations(db: AsyncSession, skip: int = 0, limit: int = 100
     result = await db.execute(select(EVRegistration).offset(skip).limit(limit))
     return result.scalars().all()
 
+EV_REGISTRATION_EXPORT_COLUMNS = (('region', 'str'), ('year', 'int'), ('month', 'int'), ('count', 'int'))
+
+def ev_registrations_export_query():
+    """
+    All registrations as plain columns ordered by region name and period, for streaming exports.
+    Walks regions by name and each region's rows through the (region_id, period) index, so nothing is sorted.
+    """
+    return (
+        select(Region.name.label('region'), EVRegistration.year.label('year'), EVRegistration.month.label('month'), EVRegistration.count)
+        .join(Region, Region.id == EVRegistration.region_id)
+        .order_by(Region.name, EVRegistration.period)
+    )
+
 async def get_ev_registrations_by_date(db: AsyncSession, year: Optional[int] = None, month: Optional[int] = None, region: Optional[str] = None, skip: int = 0, limit: Optional[int] = None) -> List[EVRegistration]:
     query = select(EVRegistration)
-    if year is not None:
-        query = query.where(EVRegistration.year == year)
-    if month is not None:
-        query = query.where(EVRegistration.month == month)
+    if year is not None and month is not None:
+        query = query.where(EVRegistration.period == to_period(year, month))
+    elif year is not None:
+        query = query.where(_year_range(EVRegistration.period, year))
+    elif month is not None:
+        # 연도 없이 월만 주면 period 인덱스를 순서대로 훑으며 거릅니다(연도순 결과).
+        query = query.where(EVRegistration.month == month).order_by(EVRegistration.period)
     if region is not None:
-        query = query.where(EVRegistration.region == region)
+        query = query.where(EVRegistration.region_id == _region_id(region))
     if limit is not None:
         query = query.offset(skip).limit(limit)
     result = await db.execute(query)
     return result.scalars().all()
 
 async def create_ev_registration(db: AsyncSession, registration: EVRegistrationCreate):
-    db_registration = EVRegistration(**registration.dict())
+    region_ids = await get_region_ids(db, [registration.region])
+    db_registration = EVRegistration(**_registration_values(region_ids[registration.region], registration))
     db.add(db_registration)
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Registration for this region and month already exists")
+    await refresh_rollups(db, [db_registration.year])
     await db.commit()
     await db.refresh(db_registration)
+    await ev_timeseries.apply(db, [registration.dict()])
     return db_registration
 
 async def update_ev_registration(db: AsyncSession, registration_id: int, registration: EVRegistrationUpdate):
     result = await db.execute(select(EVRegistration).filter(EVRegistration.id == registration_id))
     db_registration = result.scalars().first()
     if db_registration:
-        for key, value in registration.dict().items():
+        years = {db_registration.year, registration.year}
+        # 기존 칸은 비우고 새 칸을 채웁니다(키가 같으면 새 값으로 덮어씀).
+        cells = [{'region': db_registration.region, 'year': db_registration.year, 'month': db_registration.month, 'count': 0}, registration.dict()]
+        region_ids = await get_region_ids(db, [registration.region])
+        for key, value in _registration_values(region_ids[registration.region], registration).items():
             setattr(db_registration, key, value)
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="Registration for this region and month already exists")
+        await refresh_rollups(db, years)
         await db.commit()
         await db.refresh(db_registration)
+        await ev_timeseries.apply(db, cells)
     return db_registration
 
 async def delete_ev_registration(db: AsyncSession, registration_id: int):
     result = await db.execute(select(EVRegistration).filter(EVRegistration.id == registration_id))
     db_registration = result.scalars().first()
     if db_registration:
+        cell = {'region': db_registration.region, 'year': db_registration.year, 'month': db_registration.month, 'count': 0}
         await db.delete(db_registration)
+        await db.flush()
+        await refresh_rollups(db, [cell['year']])
         await db.commit()
+        await ev_timeseries.apply(db, [cell])
     return db_registration
+
+async def bulk_upsert_ev_registrations(db: AsyncSession, rows: List[dict], on_chunk: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Insert or update registrations keyed by (region, year, month) with chunked multi-row
+    INSERT ... ON CONFLICT statements, refresh the rollups of the affected years and commit.
+    Importing the same sheet twice leaves the table unchanged. on_chunk receives the size of each written chunk.
+    """
+    if not rows:
+        return 0
+    region_ids = await get_region_ids(db, (row['region'] for row in rows))
+    values = [{'region_id': region_ids[row['region']], 'period': to_period(row['year'], row['month']), 'count': row['count']} for row in rows]
+    for chunk in _chunks(values):
+        stmt = sqlite_insert(EVRegistration).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EVRegistration.region_id, EVRegistration.period],
+            set_={'count': stmt.excluded.count},
+        )
+        await db.execute(stmt)
+        if on_chunk is not None:
+            on_chunk(len(chunk))
+    await refresh_rollups(db, {row['year'] for row in rows})
+    await db.commit()
+    await ev_timeseries.apply(db, rows)
+    return len(rows)
+
+async def refresh_rollups(db: AsyncSession, years: Iterable[int]):
+    """
+    Recompute the yearly and monthly rollups of the given years from ev_registrations
+    (period range scans on ix_ev_registrations_period). Does not commit: call it in the transaction that
+    wrote the registrations so the rollups never drift from the raw rows.
+    """
+    years = sorted({year for year in years if year is not None})
+    if not years:
+        return
+    await db.execute(delete(EVRegistrationYearlyRollup).where(EVRegistrationYearlyRollup.year.in_(years)))
+    await db.execute(delete(EVRegistrationMonthlyRollup).where(EVRegistrationMonthlyRollup.year.in_(years)))
+    total = func.coalesce(func.sum(EVRegistration.count), 0)
+    in_years = or_(*(_year_range(EVRegistration.period, year) for year in years))
+    await db.execute(insert(EVRegistrationYearlyRollup).from_select(
+        ['region_id', 'year', 'total'],
+        select(EVRegistration.region_id, EVRegistration.year, total)
+        .where(in_years)
+        .group_by(EVRegistration.region_id, EVRegistration.year),
+    ))
+    await db.execute(insert(EVRegistrationMonthlyRollup).from_select(
+        ['year', 'month', 'total'],
+        select(EVRegistration.year, EVRegistration.month, total)
+        .where(in_years)
+        .group_by(EVRegistration.period),
+    ))
+
+async def get_totals_by_region(db: AsyncSession, year: Optional[int] = None) -> List[dict]:
+    total = func.sum(EVRegistrationYearlyRollup.total).label('total')
+    query = (
+        select(Region.name.label('region'), total)
+        .join(Region, Region.id == EVRegistrationYearlyRollup.region_id)
+        .group_by(EVRegistrationYearlyRollup.region_id)
+        .order_by(total.desc())
+    )
+    if year is not None:
+        query = query.where(EVRegistrationYearlyRollup.year == year)
+    result = await db.execute(query)
+    return [row._asdict() for row in result.all()]
+
+async def get_totals_by_year(db: AsyncSession, region: Optional[str] = None) -> List[dict]:
+    query = (
+        select(EVRegistrationYearlyRollup.year, func.sum(EVRegistrationYearlyRollup.total).label('total'))
+        .group_by(EVRegistrationYearlyRollup.year)
+        .order_by(EVRegistrationYearlyRollup.year)
+    )
+    if region is not None:
+        query = query.where(EVRegistrationYearlyRollup.region_id == _region_id(region))
+    result = await db.execute(query)
+    return [row._asdict() for row in result.all()]
+
+async def get_totals_by_month(db: AsyncSession, year: Optional[int] = None) -> List[dict]:
+    query = select(EVRegistrationMonthlyRollup.year, EVRegistrationMonthlyRollup.month, EVRegistrationMonthlyRollup.total).order_by(
+        EVRegistrationMonthlyRollup.year, EVRegistrationMonthlyRollup.month
+    )
+    if year is not None:
+        query = query.where(EVRegistrationMonthlyRollup.year == year)
+    result = await db.execute(query)
+    return [row._asdict() for row in result.all()]
+
+async def get_year_over_year(db: AsyncSession, region: Optional[str] = None) -> List[dict]:
+    """
+    Yearly totals with the change against the previous year. change and change_rate are None
+    for the first year or when the previous year has no registrations.
+    """
+    rows = []
+    previous = None
+    for row in await get_totals_by_year(db, region=region):
+        previous_total = previous['total'] if previous and previous['year'] == row['year'] - 1 else None
+        change = row['total'] - previous_total if previous_total is not None else None
+        rows.append({
+            **row,
+            'previous_total': previous_total,
+            'change': change,
+            'change_rate': round(change / previous_total, 4) if previous_total else None,
+        })
+        previous = row
+    return rows
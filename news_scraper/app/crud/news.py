@@ -1,39 +1,285 @@
 # app/crud/news.py
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, delete, func, or_, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from app.schemas.news import NewsCreate
-from app.models.news import News, Vote
+from app.models.news import News, NewsContent, NewsLSHBucket, NewsDuplicate, Vote, FeedWatermark
+from app.crud.counters import increment_counter, get_total
+from app.utils.link_utils import normalize_link
+from app.utils.minhash import MinHashLSH, band_buckets, find_duplicate, pack_signature, signature, unpack_signature
+from collections import defaultdict
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+BULK_INSERT_CHUNK_SIZE = 500
+
+def _chunks(items: list, size: int = BULK_INSERT_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _news_values(news: NewsCreate) -> dict:
+    values = news.model_dump()
+    # Keep the feed's publish time; fall back to the current time when it is missing
+    values['published_at'] = values.get('published_at') or datetime.now()
+    values['normalized_link'] = normalize_link(news.link)
+    values['minhash'] = pack_signature(signature(news.title))
+    return values
+
+async def _index_news(db: AsyncSession, rows: List[Tuple[int, bytes]]):
+    """
+    Register the LSH buckets of stored news items so later articles can find them.
+    """
+    bucket_rows = [
+        {'bucket': bucket, 'news_id': news_id}
+        for news_id, minhash in rows
+        for bucket in band_buckets(unpack_signature(minhash))
+    ]
+    for chunk in _chunks(bucket_rows):
+        await db.execute(sqlite_insert(NewsLSHBucket).values(chunk).on_conflict_do_nothing())
+
+async def _unindex_news(db: AsyncSession, news_id: int, minhash: Optional[bytes]):
+    """
+    Remove the LSH buckets of a news item. The bucket keys are recomputed from the stored signature
+    so the rows are deleted by primary key.
+    """
+    if minhash is None:
+        return
+    buckets = band_buckets(unpack_signature(minhash))
+    await db.execute(delete(NewsLSHBucket).where(NewsLSHBucket.bucket.in_(buckets), NewsLSHBucket.news_id == news_id))
+
+async def find_story_ids(db: AsyncSession, signatures: Dict[str, List[int]]) -> Dict[str, int]:
+    """
+    Match MinHash signatures against every stored story through the LSH bucket index.
+    Only news items sharing at least one bucket are compared, so the cost does not grow with history.
+    Returns a mapping of key -> id of the canonical news item for the keys that are near-duplicates.
+    """
+    buckets_by_key = {key: band_buckets(values) for key, values in signatures.items()}
+    all_buckets = list({bucket for buckets in buckets_by_key.values() for bucket in buckets})
+    ids_by_bucket = defaultdict(set)
+    for chunk in _chunks(all_buckets):
+        result = await db.execute(
+            select(NewsLSHBucket.bucket, NewsLSHBucket.news_id).where(NewsLSHBucket.bucket.in_(chunk))
+        )
+        for bucket, news_id in result.all():
+            ids_by_bucket[bucket].add(news_id)
+
+    candidate_ids = list(set().union(*ids_by_bucket.values())) if ids_by_bucket else []
+    stored = {}
+    for chunk in _chunks(candidate_ids):
+        result = await db.execute(select(News.id, News.minhash).where(News.id.in_(chunk)))
+        stored.update({news_id: unpack_signature(minhash) for news_id, minhash in result.all() if minhash})
+
+    matches = {}
+    for key, buckets in buckets_by_key.items():
+        candidates = set().union(*(ids_by_bucket.get(bucket, set()) for bucket in buckets))
+        story_id = find_duplicate(signatures[key], ((news_id, stored[news_id]) for news_id in candidates if news_id in stored))
+        if story_id is not None:
+            matches[key] = story_id
+    return matches
 
 async def create_news(db: AsyncSession, news: NewsCreate):
     """
     Create a new news item and add it to the database.
     """
-    # Using the current time as the publish date
-    db_news = News(published_at=datetime.now(), **news.model_dump())
+    db_news = News(**_news_values(news))
     db.add(db_news)
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="News item with this link already exists")
+    await _index_news(db, [(db_news.id, db_news.minhash)])
+    await increment_counter(db, 'news')
     await db.commit()
     await db.refresh(db_news)
     return db_news
 
-async def get_news(db: AsyncSession, skip: int = 0, limit: int = 100):
+async def bulk_create_news(db: AsyncSession, news_items: List[NewsCreate]) -> int:
+    """
+    Insert a batch of news items with INSERT ... ON CONFLICT DO NOTHING in one transaction.
+
+    Items whose normalized link already exists are skipped. Near-duplicate titles, either within the
+    batch or against the stored history (MinHash LSH), are not inserted as news; they are recorded in
+    news_duplicates and linked to the canonical story instead. Returns the number of inserted news rows.
+    """
+    if not news_items:
+        return 0
+    values_by_link = {}
+    for item in news_items:
+        values = _news_values(item)
+        values_by_link.setdefault(values['normalized_link'], values)
+
+    # Drop items that are already stored before the LSH step; otherwise they match their own buckets
+    # and get recorded as duplicates of themselves (e.g. the same article from a second keyword feed).
+    for chunk in _chunks(list(values_by_link)):
+        result = await db.execute(select(News.normalized_link).where(News.normalized_link.in_(chunk)))
+        for link in result.scalars().all():
+            del values_by_link[link]
+
+    # Near-duplicates within the batch: the first article of each story is the canonical one
+    batch_index = MinHashLSH()
+    canonical, duplicates = [], []
+    for link, values in values_by_link.items():
+        values_signature = unpack_signature(values['minhash'])
+        match = batch_index.query(values_signature)
+        if match is None:
+            batch_index.insert(link, values_signature)
+            canonical.append(values)
+        else:
+            duplicates.append((values, match))
+
+    # Near-duplicates of stories already stored
+    story_ids = await find_story_ids(
+        db, {values['normalized_link']: unpack_signature(values['minhash']) for values in canonical}
+    )
+    rows = [values for values in canonical if values['normalized_link'] not in story_ids]
+    duplicates.extend((values, values['normalized_link']) for values in canonical if values['normalized_link'] in story_ids)
+
+    # Chunk to stay under SQLite's bound-parameter limit; all chunks share one transaction
+    inserted_rows = []
+    for chunk in _chunks(rows):
+        stmt = (
+            sqlite_insert(News)
+            .values(chunk)
+            .on_conflict_do_nothing(index_elements=[News.normalized_link])
+            .returning(News.id, News.normalized_link, News.minhash)
+        )
+        result = await db.execute(stmt)
+        inserted_rows.extend(result.all())
+    await _index_news(db, [(news_id, minhash) for news_id, _, minhash in inserted_rows])
+    await increment_counter(db, 'news', len(inserted_rows))
+
+    # Resolve the canonical news id of every duplicate and link it
+    story_ids.update({link: news_id for news_id, link, _ in inserted_rows})
+    unresolved = list({link for _, link in duplicates if link not in story_ids})
+    for chunk in _chunks(unresolved):
+        result = await db.execute(select(News.normalized_link, News.id).where(News.normalized_link.in_(chunk)))
+        story_ids.update(dict(result.all()))
+    duplicate_rows = [
+        {
+            'story_id': story_ids[canonical_link],
+            'title': values['title'],
+            'source': values['source'],
+            'link': values['link'],
+            'normalized_link': values['normalized_link'],
+            'published_at': values['published_at'],
+        }
+        for values, canonical_link in duplicates
+        if canonical_link in story_ids
+    ]
+    for chunk in _chunks(duplicate_rows):
+        await db.execute(sqlite_insert(NewsDuplicate).values(chunk).on_conflict_do_nothing())
+
+    await db.commit()
+    return len(inserted_rows)
+
+async def get_news_without_content(db: AsyncSession, limit: int, max_attempts: int) -> List[Tuple[int, str]]:
+    """
+    Return (id, link) of news items whose body has not been extracted yet, newest first.
+    Items that already failed max_attempts times, or whose next_attempt_at is still in the future, are skipped.
+    """
+    query = (
+        select(News.id, News.link)
+        .outerjoin(NewsContent, NewsContent.news_id == News.id)
+        .where(or_(
+            NewsContent.news_id.is_(None),
+            (NewsContent.status != 'done') & (NewsContent.attempts < max_attempts)
+            & or_(NewsContent.next_attempt_at.is_(None), NewsContent.next_attempt_at <= datetime.now()),
+        ))
+        .order_by(News.id.desc())
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return [tuple(row) for row in result.all()]
+
+async def save_news_contents(db: AsyncSession, contents: List[dict]):
+    """
+    Upsert extracted article contents in one transaction. Each dict holds news_id, status and, when
+    available, body (compressed), summary, image_url, error and next_attempt_at. attempts is incremented on every save.
+    """
+    if not contents:
+        return
+    columns = ('news_id', 'status', 'body', 'summary', 'image_url', 'error', 'next_attempt_at')
+    rows = [{**{column: content.get(column) for column in columns}, 'attempts': 1, 'fetched_at': datetime.now()} for content in contents]
+    for chunk in _chunks(rows, 100):
+        stmt = sqlite_insert(NewsContent).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NewsContent.news_id],
+            set_={
+                'status': stmt.excluded.status,
+                'body': stmt.excluded.body,
+                'summary': stmt.excluded.summary,
+                'image_url': stmt.excluded.image_url,
+                'error': stmt.excluded.error,
+                'next_attempt_at': stmt.excluded.next_attempt_at,
+                'fetched_at': stmt.excluded.fetched_at,
+                'attempts': NewsContent.attempts + 1,
+            },
+        )
+        await db.execute(stmt)
+    await db.commit()
+
+async def get_news_content(db: AsyncSession, news_id: int):
+    """
+    Fetch the extracted content row of a news item.
+    """
+    return await db.get(NewsContent, news_id)
+
+async def get_feed_watermarks(db: AsyncSession, feed_urls: List[str]) -> Dict[str, datetime]:
     """
-    Asynchronously fetch news items from the database.
+    Fetch the last ingested publish time of each feed.
+    """
+    result = await db.execute(select(FeedWatermark).where(FeedWatermark.feed_url.in_(feed_urls)))
+    return {watermark.feed_url: watermark.last_published_at for watermark in result.scalars().all()}
+
+async def update_feed_watermarks(db: AsyncSession, watermarks: Dict[str, datetime]):
     """
-    query = select(News).order_by(News.published_at.desc()).offset(skip).limit(limit)
+    Move each feed's watermark forward to the given publish time. Watermarks never move backwards.
+    """
+    if not watermarks:
+        return
+    stmt = sqlite_insert(FeedWatermark).values(
+        [{'feed_url': url, 'last_published_at': published_at} for url, published_at in watermarks.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FeedWatermark.feed_url],
+        set_={'last_published_at': func.max(FeedWatermark.last_published_at, stmt.excluded.last_published_at)},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+async def get_news(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[Tuple[datetime, int]] = None):
+    """
+    Asynchronously fetch news items from the database, newest first.
+    When after (published_at, id) of the last item seen is given, the page is read with a keyset
+    range scan on ix_news_published_at_id instead of OFFSET, so deep pages cost the same as the first.
+    """
+    query = select(News).order_by(News.published_at.desc(), News.id.desc()).limit(limit)
+    if after is not None:
+        query = query.where(tuple_(News.published_at, News.id) < tuple_(*after))
+    else:
+        query = query.offset(skip)
     result = await db.execute(query)
     news_items = result.scalars().all()
     return news_items
 
-async def get_news_count(db: AsyncSession):
+# 내보내기 열 (이름, 타입). 타입은 app.utils.exports 참고.
+NEWS_EXPORT_COLUMNS = (('id', 'int'), ('title', 'str'), ('source', 'str'), ('link', 'str'), ('published_at', 'datetime'), ('vote_count', 'int'))
+
+def news_export_query():
     """
-    Asynchronously get the total count of news items in the database.
+    All news items as plain columns in id order, for streaming exports (matches NEWS_EXPORT_COLUMNS).
     """
-    query = select(func.count()).select_from(News)
-    result = await db.execute(query)
-    total_count = result.scalar_one()
-    return total_count
+    return select(News.id, News.title, News.source, News.link, News.published_at, News.vote_count).order_by(News.id)
+
+async def get_news_count(db: AsyncSession, estimate: bool = False):
+    """
+    Get the total count of news items from the maintained counter (cached for a few seconds),
+    or the planner's row estimate when estimate is set.
+    """
+    return await get_total(db, 'news', estimate=estimate)
 
 async def get_news_by_id(db: AsyncSession, news_id: int):
     """
@@ -54,8 +300,22 @@ async def update_news(db: AsyncSession, news_id: int, updated_news: NewsCreate):
     if db_news:
         # Apply the updates from updated_news to db_news
         update_data = updated_news.model_dump(exclude_unset=True)
+        if 'link' in update_data:
+            update_data['normalized_link'] = normalize_link(update_data['link'])
+        reindex = 'title' in update_data and update_data['title'] != db_news.title
+        if reindex:
+            # The near-duplicate check must see the new title: replace the signature and its LSH buckets
+            await _unindex_news(db, news_id, db_news.minhash)
+            update_data['minhash'] = pack_signature(signature(update_data['title']))
         for key, value in update_data.items():
             setattr(db_news, key, value)
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="News item with this link already exists")
+        if reindex:
+            await _index_news(db, [(news_id, db_news.minhash)])
         await db.commit()
         return db_news
     return None  # Return None if the news item does not exist
@@ -63,42 +323,51 @@ async def update_news(db: AsyncSession, news_id: int, updated_news: NewsCreate):
 async def delete_news(db: AsyncSession, news_id: int):
     """
     비동기 방식으로 특정 ID를 가진 뉴스 아이템을 데이터베이스에서 삭제합니다.
+    SQLite는 외래 키(ON DELETE CASCADE)를 강제하지 않으므로 하위 행을 직접 지웁니다.
+    news.id는 재사용될 수 있어, 남은 행이 있으면 새 기사가 예전 기사의 데이터를 물려받습니다.
     """
     query = select(News).where(News.id == news_id)
     result = await db.execute(query)
     db_news = result.scalars().first()
     if db_news:
+        await _unindex_news(db, news_id, db_news.minhash)
+        await db.execute(delete(NewsContent).where(NewsContent.news_id == news_id))
         await db.delete(db_news)
+        await increment_counter(db, 'news', -1)
         await db.commit()
     return db_news
 
-async def vote_news(db: AsyncSession, news_id: int, vote_value: int):
-    # Check if the news item exists
-    news_item = await db.execute(select(News).filter(News.id == news_id))
-    news_item = news_item.scalars().first()
-    if not news_item:
-        return None
-
-    # Check if a vote for this news item already exists
-    vote_item_result = await db.execute(select(Vote).filter(Vote.news_id == news_id))
-    vote_item = vote_item_result.scalars().first()
-
-    if vote_item:
-        # Update the existing vote
-        vote_item.vote_value += vote_value
-    else:
-        # Create a new vote entry
-        new_vote = Vote(news_id=news_id, vote_value=vote_value)
-        db.add(new_vote)
-
-    await db.commit()
+async def vote_news(db: AsyncSession, news_id: int, vote_value: int, user_id: Optional[int] = None):
+    """
+    Apply a vote with a single atomic UPDATE news SET vote_count = vote_count + delta ... RETURNING.
 
-    # Recalculate and update the vote count
-    vote_count_result = await db.execute(select(func.sum(Vote.vote_value)).where(Vote.news_id == news_id))
-    vote_count = vote_count_result.scalar() or 0
-    news_item.voteCount = vote_count
+    Anonymous votes only move the counter. A signed-in user's vote is kept in votes (one row per user and
+    news item) and replaces their previous vote, so delta is the difference from the stored value; the
+    UPDATE runs first so the write lock is held while the vote row is upserted in the same transaction.
+    Returns the updated news item, or None if it does not exist.
+    """
+    delta = vote_value
+    if user_id is not None:
+        previous = select(Vote.vote_value).where(Vote.news_id == news_id, Vote.user_id == user_id).scalar_subquery()
+        delta = vote_value - func.coalesce(previous, 0)
+    stmt = (
+        update(News)
+        .where(News.id == news_id)
+        .values(vote_count=News.vote_count + delta)
+        .returning(News)
+        .execution_options(synchronize_session=False)
+    )
+    news_item = (await db.execute(stmt)).scalars().first()
+    if news_item is None:
+        await db.rollback()
+        return None
 
+    if user_id is not None:
+        upsert = sqlite_insert(Vote).values(news_id=news_id, user_id=user_id, vote_value=vote_value)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[Vote.news_id, Vote.user_id],
+            set_={'vote_value': upsert.excluded.vote_value},
+        )
+        await db.execute(upsert)
     await db.commit()
-    await db.refresh(news_item)
-
-    return news_item
\ No newline at end of file
+    return news_item
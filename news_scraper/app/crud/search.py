@@ -0,0 +1,91 @@
+# app/crud/search.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+from typing import List, Optional, Tuple
+
+# trigram 토크나이저는 3글자 미만의 검색어를 색인으로 찾지 못합니다.
+MIN_TERM_LENGTH = 3
+SNIPPET_TOKENS = 16
+
+def _escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def _search_conditions(fts_table: str, columns: Tuple[str, ...], query: str) -> Tuple[Optional[str], List[str], dict]:
+    """
+    Turn user input into an FTS5 MATCH expression and LIKE conditions.
+
+    Every whitespace-separated term must match (AND). Terms are quoted so FTS5 operators in the input are
+    treated as text. Terms shorter than the trigram length cannot use the index and become LIKE filters.
+    Returns (match expression or None, extra WHERE clauses, bind parameters).
+    """
+    terms = query.split()
+    long_terms = [term for term in terms if len(term) >= MIN_TERM_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_TERM_LENGTH]
+    match = " ".join('"' + term.replace('"', '""') + '"' for term in long_terms) or None
+
+    clauses, params = [], {}
+    for index, term in enumerate(short_terms):
+        params[f'term_{index}'] = f"%{_escape_like(term)}%"
+        clauses.append(
+            "(" + " OR ".join(f"{fts_table}.{column} LIKE :term_{index} ESCAPE '\\'" for column in columns) + ")"
+        )
+    if match is not None:
+        params['match'] = match
+    return match, clauses, params
+
+async def search_news(db: AsyncSession, query: str, skip: int = 0, limit: int = 10, sort: str = 'relevance') -> List[dict]:
+    """
+    BM25-ranked full-text search over news titles and extracted summaries (news_fts).
+    Title matches weigh more than summary matches. sort='recent' orders by id instead, which avoids
+    scoring every match for very common terms.
+    """
+    match, clauses, params = _search_conditions('news_fts', ('title', 'summary'), query)
+    if match is None and not clauses:
+        return []
+    if match is not None:
+        ranked_columns = f"""
+            highlight(news_fts, 0, '<mark>', '</mark>') AS title_highlight,
+            snippet(news_fts, -1, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) AS snippet,
+            bm25(news_fts, 10.0, 1.0) AS score"""
+        clauses.insert(0, "news_fts MATCH :match")
+        order_by = "score" if sort == 'relevance' else "news_fts.rowid DESC"
+    else:
+        # 짧은 검색어만 있으면 순위를 매길 수 없으므로 최신순으로 반환합니다.
+        ranked_columns = "news_fts.title AS title_highlight, substr(news_fts.summary, 1, 120) AS snippet, NULL AS score"
+        order_by = "news_fts.rowid DESC"
+    sql = f"""
+        SELECT news.id, news.title, news.source, news.link, news.published_at, {ranked_columns}
+        FROM news_fts JOIN news ON news.id = news_fts.rowid
+        WHERE {' AND '.join(clauses)}
+        ORDER BY {order_by}
+        LIMIT :limit OFFSET :skip
+    """
+    result = await db.execute(text(sql), {**params, 'limit': limit, 'skip': skip})
+    return [dict(row) for row in result.mappings().all()]
+
+async def search_community_posts(db: AsyncSession, query: str, skip: int = 0, limit: int = 10, sort: str = 'relevance') -> List[dict]:
+    """
+    BM25-ranked (or, with sort='recent', newest first) full-text search over community post titles and contents.
+    """
+    match, clauses, params = _search_conditions('community_posts_fts', ('title', 'content'), query)
+    if match is None and not clauses:
+        return []
+    if match is not None:
+        ranked_columns = f"""
+            highlight(community_posts_fts, 0, '<mark>', '</mark>') AS title_highlight,
+            snippet(community_posts_fts, 1, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) AS snippet,
+            bm25(community_posts_fts, 5.0, 1.0) AS score"""
+        clauses.insert(0, "community_posts_fts MATCH :match")
+        order_by = "score" if sort == 'relevance' else "community_posts_fts.rowid DESC"
+    else:
+        ranked_columns = "community_posts.title AS title_highlight, substr(community_posts.content, 1, 120) AS snippet, NULL AS score"
+        order_by = "community_posts_fts.rowid DESC"
+    sql = f"""
+        SELECT community_posts.id, community_posts.title, community_posts.created_at, {ranked_columns}
+        FROM community_posts_fts JOIN community_posts ON community_posts.id = community_posts_fts.rowid
+        WHERE {' AND '.join(clauses)}
+        ORDER BY {order_by}
+        LIMIT :limit OFFSET :skip
+    """
+    result = await db.execute(text(sql), {**params, 'limit': limit, 'skip': skip})
+    return [dict(row) for row in result.mappings().all()]
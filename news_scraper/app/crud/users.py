@@ -1,11 +1,12 @@
 # app/crud/users.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from app.models.users import User
 from app.models.community import CommunityPost
 from app.schemas.users import UserCreate
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 async def get_user(db: AsyncSession, user_id: int) -> User:
     result = await db.execute(select(User).filter(User.id == user_id))
@@ -23,17 +24,24 @@ async def create_user(db: AsyncSession, user: UserCreate) -> User:
     await db.refresh(db_user)
     return db_user
 
-async def get_users(db: AsyncSession, skip: int = 0, limit: int = 10):
-    result = await db.execute(select(User).offset(skip).limit(limit))
+async def get_users(db: AsyncSession, skip: int = 0, limit: int = 10, after_id: Optional[int] = None):
+    # after_id가 있으면 OFFSET 대신 기본 키 범위 스캔으로 다음 페이지를 읽습니다.
+    query = select(User).order_by(User.id).limit(limit)
+    query = query.where(User.id > after_id) if after_id is not None else query.offset(skip)
+    result = await db.execute(query)
     return result.scalars().all()
 
-async def get_user_posts(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 10) -> List[CommunityPost]:
-    result = await db.execute(
+async def get_user_posts(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 10, after: Optional[Tuple[datetime, int]] = None) -> List[CommunityPost]:
+    query = (
         select(CommunityPost)
         .where(CommunityPost.user_id == user_id)
-        .order_by(CommunityPost.created_at.desc())
-        .offset(skip)
+        .order_by(CommunityPost.created_at.desc(), CommunityPost.id.desc())
         .limit(limit)
         .options(joinedload(CommunityPost.user))
     )
+    if after is not None:
+        query = query.where(tuple_(CommunityPost.created_at, CommunityPost.id) < tuple_(*after))
+    else:
+        query = query.offset(skip)
+    result = await db.execute(query)
     return result.scalars().all()
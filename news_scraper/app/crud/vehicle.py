@@ -2,6 +2,8 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from app.schemas.vehicle import VehicleSpec, VehicleSpecCreate
 from app.models.vehicle import VehicleSpec
 from typing import List
@@ -9,7 +11,11 @@ from typing import List
 async def create_vehicle_spec(db: AsyncSession, vehicle_spec: VehicleSpecCreate):
     vehicle = VehicleSpec(**vehicle_spec.model_dump())
     db.add(vehicle)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Vehicle spec for this manufacturer and model already exists")
     await db.refresh(vehicle)
     return vehicle
 
@@ -32,6 +38,24 @@ async def get_vehicle_spec_by_model(db: AsyncSession, model_name: str):
     else:
         raise HTTPException(status_code=404, detail="Vehicle not found")
 
+async def upsert_vehicle_spec(db: AsyncSession, vehicle_spec: VehicleSpecCreate):
+    """
+    제조사와 모델명이 같은 스펙이 있으면 갱신하고, 없으면 새로 추가합니다.
+    (manufacturer, model) 유니크 인덱스에 대한 INSERT ... ON CONFLICT 한 문장이라 동시에 실행되는 스크래핑 작업도 중복 행을 만들지 않습니다.
+    """
+    stmt = sqlite_insert(VehicleSpec).values(**vehicle_spec.model_dump())
+    # 값이 주어진 필드만 덮어씁니다.
+    changes = {key: stmt.excluded[key] for key in vehicle_spec.model_dump(exclude_unset=True) if key not in ('manufacturer', 'model')}
+    key = [VehicleSpec.manufacturer, VehicleSpec.model]
+    stmt = stmt.on_conflict_do_update(index_elements=key, set_=changes) if changes else stmt.on_conflict_do_nothing(index_elements=key)
+    await db.execute(stmt)
+    await db.commit()
+    result = await db.execute(select(VehicleSpec).where(
+        VehicleSpec.manufacturer == vehicle_spec.manufacturer,
+        VehicleSpec.model == vehicle_spec.model,
+    ).execution_options(populate_existing=True))
+    return result.scalars().first()
+
 async def update_vehicle_spec(db: AsyncSession, vehicle_id: int, spec_update: VehicleSpecCreate):
     vehicle = await db.get(VehicleSpec, vehicle_id)
     if vehicle:
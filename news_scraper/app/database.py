@@ -1,13 +1,94 @@
 # app/database.py
+import asyncio
+from typing import List, Optional
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.config import get_logger
+
+logger = get_logger()
+
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+
+def sqlite_pragmas(read_only: bool = False, profile: Optional[str] = None) -> List[str]:
+    """
+    DB_PROFILE 에 따라 모든 SQLite 연결에 적용할 PRAGMA 목록을 반환합니다.
+    production: WAL 저널(읽기가 쓰기를 기다리지 않음), synchronous=NORMAL, mmap/cache 크기, busy_timeout.
+    default: SQLite 기본값 그대로 사용합니다.
+    """
+    if (profile or settings.DB_PROFILE) != "production":
+        return []
+    pragmas = [
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    else:
+        # journal_mode는 DB 파일에 기록되므로 쓰기 연결에서만 설정합니다.
+        pragmas.insert(0, "PRAGMA journal_mode=WAL")
+    return pragmas
+
+def install_sqlite_pragmas(target_engine, pragmas: List[str]):
+    if not pragmas:
+        return
+
+    @event.listens_for(target_engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+def read_only_url(url: str):
+    """파일 DB URL을 읽기 전용(mode=ro) URI로 바꿉니다. 메모리 DB면 None."""
+    parsed = make_url(url)
+    if not parsed.drivername.startswith("sqlite") or parsed.database in (None, "", ":memory:"):
+        return None
+    return parsed.set(database=f"file:{parsed.database}", query={**parsed.query, "mode": "ro", "uri": "true"})
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./news.db"
 engine = create_async_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, echo=True
+    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, echo=settings.DB_ECHO
 )
+install_sqlite_pragmas(engine, sqlite_pragmas())
+
+# GET 엔드포인트용 읽기 전용 연결 풀. WAL 모드에서는 쓰기 트랜잭션이 진행 중이어도 막히지 않습니다.
+_read_url = read_only_url(SQLALCHEMY_DATABASE_URL) if settings.DB_PROFILE == "production" else None
+if _read_url is not None:
+    read_engine = create_async_engine(
+        _read_url,
+        connect_args={"check_same_thread": False},
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_READ_POOL_SIZE,
+    )
+    install_sqlite_pragmas(read_engine, sqlite_pragmas(read_only=True))
+else:
+    read_engine = engine
 
 SessionLocal = sessionmaker(expire_on_commit=False, autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+ReadSessionLocal = sessionmaker(expire_on_commit=False, autocommit=False, autoflush=False, bind=read_engine, class_=AsyncSession)
+
+Base = declarative_base()
+
+async def optimize_database():
+    """PRAGMA optimize 와 ANALYZE 로 쿼리 플래너 통계를 갱신합니다."""
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+        await conn.execute(text("PRAGMA optimize"))
 
-Base = declarative_base()
\ No newline at end of file
+async def start_db_maintenance():
+    while True:
+        try:
+            await asyncio.sleep(settings.DB_OPTIMIZE_INTERVAL_SECONDS)
+            await optimize_database()
+            logger.info("Database statistics refreshed (ANALYZE, PRAGMA optimize)")
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error(f"Database maintenance failed: {e}")
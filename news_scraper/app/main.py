@@ -1,46 +1,28 @@
 # app/main.py
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 from fastapi import FastAPI, Depends, HTTPException, Query, Path, Body, Request
 from app.api.v1.endpoints import news, community, vehicle, users, ev_registration
 from contextlib import asynccontextmanager
 import asyncio
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
-from .database import Base, engine  
+from .database import Base, SessionLocal, ReadSessionLocal, engine, optimize_database, start_db_maintenance
+from .crud.counters import ensure_counters
 from .rss_scheduler import start_rss_feed_scheduler
+from .article_pipeline import article_pipeline
+from .core.config import settings
 from .config import get_logger
 from fastapi.middleware.cors import CORSMiddleware
-from .announce_models import Announcement
-from .scrapers.seoul_scraper import SeoulScraper
-from .scrapers.incheon_scraper import IncheonScraper
-from .scrapers.gyeonggi_scraper import GyeonggiScraper
-from .scrapers.koroad_scraper import KoroadScraper
-from .scrapers.bucheon_scraper import BucheonScraper
-from .scrapers.ulsan_scraper import UlsanScraper
-from .scrapers.sejong_scraper import SejongScraper
-from .scrapers.wonju_scraper import WonjuScraper
-from .scrapers.goyang_scraper import GoyangScraper
-from .scrapers.gwangju_scraper import GwangjuScraper
-from .scrapers.incheon2_scraper import Incheon2Scraper
-from .scrapers.notice_scraper import EVPortalNoticeScraper
-
-SCRAPERS = {
-    'gyeonggi': GyeonggiScraper().scrape,
-    'incheon': IncheonScraper().scrape,
-    'koroad': KoroadScraper().scrape,
-    'bucheon': BucheonScraper().scrape,
-    'ulsan': UlsanScraper().scrape,
-    'sejong': SejongScraper().scrape,
-    'wonju': WonjuScraper().scrape,
-    'goyang': GoyangScraper().scrape,
-    'seoul': SeoulScraper().scrape,
-    'gwangju': GwangjuScraper().scrape,
-    'incheon2': Incheon2Scraper().scrape,
-    'evportal': EVPortalNoticeScraper().scrape
-    # 기타 지역 스크래퍼 추가...
-}
+from .announce_models import Announcement, AnnouncementSnapshot, AnnouncementReplay
+from .utils.snapshot_archive import list_snapshots, replay
+from .utils.http_client import close_http_session
+from .utils.ev_timeseries import ev_timeseries, start_ev_timeseries_refresh
+from .utils.xls_to_database import shutdown_import_executor
+from .utils.exports import EXPORT_FORMATS, EXPORT_FORMAT_PATTERN, export_response
+from .scrapers.registry import SCRAPERS
 
 logger = get_logger()
 
@@ -50,16 +32,42 @@ async def app_lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # Seed row counters that do not exist yet (fresh database)
+    async with SessionLocal() as session:
+        await ensure_counters(session)
+
+    # Load EV registrations into the in-memory time series used by the analytics endpoints
+    async with ReadSessionLocal() as session:
+        await ev_timeseries.load(session)
+    timeseries_task = asyncio.create_task(start_ev_timeseries_refresh(ReadSessionLocal))
+
+    # Refresh query planner statistics now and periodically afterwards
+    await optimize_database()
+    maintenance_task = asyncio.create_task(start_db_maintenance())
+
     # Log that the application has started
     logger.info("Application started")
 
     # Start the RSS feed scheduler in the background
     task = asyncio.create_task(start_rss_feed_scheduler())
 
+    # Start the article body extraction pipeline in the background
+    pipeline_task = asyncio.create_task(article_pipeline.run_forever()) if settings.ARTICLE_PIPELINE_ENABLED else None
+
     yield
 
     # Attempt to cancel the task on cleanup
     task.cancel()
+    maintenance_task.cancel()
+    timeseries_task.cancel()
+    if pipeline_task is not None:
+        pipeline_task.cancel()
+
+    # Stop the Excel import worker processes
+    shutdown_import_executor()
+
+    # Close the shared HTTP client
+    await close_http_session()
 
     # Log that the application has stopped
     logger.info("Application stopped")
@@ -79,6 +87,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 브라우저 스크립트가 keyset 페이지네이션 커서를 읽을 수 있도록 노출
 )
 
 @app.get("/api/v1/announcements/regions", response_model=List[str])
@@ -100,6 +109,43 @@ async def get_regional_announcements(region_name: str = Path(..., description="T
     except Exception as e:
         logger.error(f"An error occurred while fetching announcements: {str(e)}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+
+ANNOUNCEMENT_EXPORT_COLUMNS = (('title', 'str'), ('link', 'str'), ('date', 'str'))
+
+@app.get("/api/v1/announcements/{region_name}/export", response_class=StreamingResponse, responses={200: {"content": {media_type: {} for media_type in EXPORT_FORMATS.values()}}})
+async def export_regional_announcements(
+    region_name: str = Path(..., description="The name of the region"),
+    format: str = Query('ndjson', pattern=EXPORT_FORMAT_PATTERN),
+):
+    """Scrape the region's announcements and download them as NDJSON, CSV or Parquet."""
+    announcements = await get_regional_announcements(region_name)
+
+    async def batches():
+        rows = [Announcement.model_validate(item) for item in announcements]
+        yield [(row.title, row.link, row.date) for row in rows]
+
+    return export_response(batches(), ANNOUNCEMENT_EXPORT_COLUMNS, format, f"announcements_{region_name}")
+
+@app.get("/api/v1/announcements/{region_name}/snapshots", response_model=List[AnnouncementSnapshot])
+async def get_regional_snapshots(region_name: str = Path(..., description="The name of the region")):
+    if region_name not in SCRAPERS:
+        raise HTTPException(status_code=404, detail="Region not found")
+    return list_snapshots(region_name)
+
+@app.get("/api/v1/announcements/{region_name}/replay", response_model=List[AnnouncementReplay])
+async def replay_regional_announcements(
+    region_name: str = Path(..., description="The name of the region"),
+    since: Optional[datetime] = Query(None, description="Only replay snapshots taken at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only replay snapshots taken at or before this time"),
+    limit: Optional[int] = Query(1, ge=1, description="Maximum number of snapshots to replay, newest first"),
+):
+    """Re-run the current parser over archived pages without any network access."""
+    scraper = SCRAPERS.get(region_name)
+    if scraper is None:
+        raise HTTPException(status_code=404, detail="Region not found")
+    if not hasattr(scraper, "scrape_specific"):
+        raise HTTPException(status_code=400, detail="This region's scraper does not support replay")
+    return await replay(scraper, region_name, since=since, until=until, limit=limit)
     
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
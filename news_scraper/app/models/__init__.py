@@ -1,8 +1,11 @@
 # app/models/__init__.py
 from .users import User
 from .community import CommunityPost, CommunityPostLike, Comment
-from .news import News, Vote, Region
+from .news import News, NewsContent, NewsLSHBucket, NewsDuplicate, Vote, Region, FeedWatermark
 from .vehicle import VehicleSpec
+from .counters import Counter
+from .ev_registration import EVRegistration, EVRegistrationYearlyRollup, EVRegistrationMonthlyRollup
+from . import search  # FTS5 가상 테이블과 트리거 DDL 등록
 
 __all__ = [
     "User",
@@ -10,8 +13,16 @@ __all__ = [
     "CommunityPostLike",
     "Comment",
     "News",
+    "NewsContent",
+    "NewsLSHBucket",
+    "NewsDuplicate",
+    "FeedWatermark",
     "Region",
     "Vote",
     "Like",
     "VehicleSpec",
+    "Counter",
+    "EVRegistration",
+    "EVRegistrationYearlyRollup",
+    "EVRegistrationMonthlyRollup",
 ]
\ No newline at end of file
@@ -1,7 +1,8 @@
 # app/models/community.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, and_, select, func
+from sqlalchemy.orm import relationship, synonym, aliased, foreign
 from sqlalchemy.sql import func
+from datetime import datetime
 from app.database import Base
 
 class CommunityPost(Base):
@@ -9,19 +10,29 @@ class CommunityPost(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
     content = Column(String, nullable=False)
-    created_at = Column(DateTime, default=func.now())  # Default value for created_at
+    created_at = Column(DateTime, default=datetime.now)  # Python-side default keeps microseconds, matching keyset cursor values
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())  # Default value for updated_at
-    likeCount = Column(Integer, default=0)
+    # 좋아요/댓글 수. 좋아요·댓글을 추가/삭제하는 트랜잭션에서 함께 갱신하므로 목록 조회에 JOIN이 필요 없습니다.
+    like_count = Column(Integer, nullable=False, default=0, server_default='0')
+    comment_count = Column(Integer, nullable=False, default=0, server_default='0')
+    likeCount = synonym('like_count')
+    commentCount = synonym('comment_count')
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)  # Foreign key
 
     user = relationship("User", back_populates="posts")
     likes = relationship("CommunityPostLike", back_populates="post", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan", order_by="Comment.created_at")
 
+    __table_args__ = (
+        # 최신순 키셋 페이지네이션 (전체 피드, 사용자별 글 목록)
+        Index('ix_community_posts_created_at_id', 'created_at', 'id'),
+        Index('ix_community_posts_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+    )
+
 class CommunityPostLike(Base):
     __tablename__ = 'community_post_likes'
     id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey('community_posts.id'), nullable=False)
+    post_id = Column(Integer, ForeignKey('community_posts.id'), nullable=False, index=True)
     created_at = Column(DateTime, default=func.now())
     post = relationship("CommunityPost", back_populates="likes")
 
@@ -31,8 +42,33 @@ class Comment(Base):
     post_id = Column(Integer, ForeignKey('community_posts.id'), nullable=False)
     content = Column(Text, nullable=False)
     author = Column(String, nullable=True)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=datetime.now)  # 키셋 커서와 같은 형식(마이크로초 포함)으로 저장
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationships
     post = relationship("CommunityPost", back_populates="comments")
+
+    __table_args__ = (
+        Index('ix_comments_post_id_created_at_id', 'post_id', 'created_at', 'id'),  # 글별 댓글 키셋 페이지네이션, 댓글 수 집계
+    )
+
+# 상세 조회에서 함께 내려주는 첫 페이지 댓글 수
+FIRST_COMMENTS_PAGE_SIZE = 20
+
+# 글마다 (created_at, id) 순으로 앞의 FIRST_COMMENTS_PAGE_SIZE개 댓글만 담는 관계 (윈도 함수로 행 수 제한).
+# selectinload로 읽으면 글 하나에 댓글이 수천 개여도 첫 페이지만 가져옵니다.
+_ranked_comments = select(
+    Comment,
+    func.row_number().over(partition_by=Comment.post_id, order_by=(Comment.created_at, Comment.id)).label('position'),
+).subquery()
+_RankedComment = aliased(Comment, _ranked_comments)
+
+CommunityPost.first_comments = relationship(
+    _RankedComment,
+    primaryjoin=and_(
+        foreign(_RankedComment.post_id) == CommunityPost.id,
+        _ranked_comments.c.position <= FIRST_COMMENTS_PAGE_SIZE,
+    ),
+    order_by=(_RankedComment.created_at, _RankedComment.id),
+    viewonly=True,
+)
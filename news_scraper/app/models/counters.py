@@ -0,0 +1,12 @@
+# app/models/counters.py
+from sqlalchemy import Column, Integer, String
+from app.database import Base
+
+class Counter(Base):
+    """
+    테이블 행 수 등 자주 조회되는 합계를 미리 유지하는 카운터입니다.
+    행을 추가/삭제하는 트랜잭션 안에서 함께 갱신되므로 목록 조회 때 count(*)를 실행하지 않아도 됩니다.
+    """
+    __tablename__ = 'counters'
+    name = Column(String, primary_key=True)  # 예: 'news', 'community_posts'
+    value = Column(Integer, nullable=False, default=0)
@@ -1,12 +1,66 @@
 # app/models/vehicle_registration.py
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, ForeignKey, Integer, Index
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship
 from app.database import Base
 
+def to_period(year: int, month: int) -> int:
+    """(2023, 6) -> 202306"""
+    return year * 100 + month
+
 class EVRegistration(Base):
+    """
+    지역은 regions.id, 연월은 yyyymm 정수(period)로 저장합니다. 필터와 GROUP BY가 정수 비교로 처리되고 행과 인덱스가 작아집니다.
+    API가 쓰는 region, year, month는 읽기 전용 속성으로 그대로 제공합니다.
+    """
     __tablename__ = "ev_registrations"
 
     id = Column(Integer, primary_key=True, index=True)
-    region = Column(String, index=True)
-    year = Column(Integer)
-    month = Column(Integer)
+    region_id = Column(Integer, ForeignKey('regions.id'))
+    period = Column(Integer)  # yyyymm
     count = Column(Integer)
+    region_ref = relationship("Region", lazy="joined")  # 지역 사전은 작으므로 항상 함께 읽습니다.
+
+    __table_args__ = (
+        Index('ix_ev_registrations_region_id_period', 'region_id', 'period', unique=True),  # 지역(+연월) 조회, 엑셀 업로드 upsert 키
+        Index('ix_ev_registrations_period', 'period'),  # 지역 없이 연/월로 조회 (연도는 범위 조회)
+    )
+
+    @property
+    def region(self):
+        return self.region_ref.name if self.region_ref is not None else None
+
+    @hybrid_property
+    def year(self):
+        return self.period // 100 if self.period is not None else None
+
+    @year.expression
+    def year(cls):
+        return cls.period // 100
+
+    @hybrid_property
+    def month(self):
+        return self.period % 100 if self.period is not None else None
+
+    @month.expression
+    def month(cls):
+        return cls.period % 100
+
+class EVRegistrationYearlyRollup(Base):
+    """
+    지역·연도별 등록 대수 합계. ev_registrations를 쓰는 CRUD와 엑셀 업로드가 바뀐 연도만 다시 집계합니다.
+    지역별/연도별 합계와 전년 대비 증감을 원본 행을 읽지 않고 계산합니다.
+    """
+    __tablename__ = "ev_registration_yearly_rollups"
+
+    region_id = Column(Integer, ForeignKey('regions.id'), primary_key=True)
+    year = Column(Integer, primary_key=True, index=True)  # 연도별 재집계, 특정 연도의 지역별 합계
+    total = Column(Integer, nullable=False, default=0)
+
+class EVRegistrationMonthlyRollup(Base):
+    """연·월별 전체 지역 등록 대수 합계."""
+    __tablename__ = "ev_registration_monthly_rollups"
+
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
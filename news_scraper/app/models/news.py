@@ -1,6 +1,6 @@
 # app/models/news.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, LargeBinary, Text, Index, UniqueConstraint
+from sqlalchemy.orm import relationship, synonym
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -10,21 +10,71 @@ class News(Base):
     title = Column(String, index=True, nullable=False)
     source = Column(String, nullable=False)
     link = Column(String, nullable=False)
+    normalized_link = Column(String, unique=True, index=True)  # 중복 기사 방지용 정규화 링크
     published_at = Column(DateTime, server_default=func.now())
+    minhash = Column(LargeBinary)  # 제목 문자 n-gram의 MinHash 서명 (app.utils.minhash)
+    vote_count = Column(Integer, nullable=False, default=0, server_default='0')  # 투표 합계. 투표마다 원자적으로 갱신합니다.
+    voteCount = synonym('vote_count')
     votes = relationship("Vote", back_populates="news")
+    duplicates = relationship("NewsDuplicate", back_populates="story", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index('ix_news_published_at_id', 'published_at', 'id'),  # 최신순 키셋 페이지네이션
+    )
+
+class NewsContent(Base):
+    """기사 본문. 목록 조회에 실리지 않도록 news와 분리된 테이블에 저장합니다."""
+    __tablename__ = 'news_contents'
+    news_id = Column(Integer, ForeignKey('news.id', ondelete='CASCADE'), primary_key=True)
+    status = Column(String, nullable=False, default='pending', index=True)  # done / failed
+    attempts = Column(Integer, nullable=False, default=0)
+    body = Column(LargeBinary)  # zstd로 압축한 본문 텍스트
+    summary = Column(Text)
+    image_url = Column(String)
+    error = Column(String)
+    next_attempt_at = Column(DateTime)  # 실패한 기사는 이 시각 이후에 다시 시도합니다.
+    fetched_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+class NewsLSHBucket(Base):
+    __tablename__ = 'news_lsh_buckets'
+    bucket = Column(Integer, primary_key=True)  # (밴드 번호 << 32) | 밴드 해시
+    news_id = Column(Integer, ForeignKey('news.id', ondelete='CASCADE'), primary_key=True)
+
+class NewsDuplicate(Base):
+    __tablename__ = 'news_duplicates'
+    id = Column(Integer, primary_key=True, index=True)
+    story_id = Column(Integer, ForeignKey('news.id', ondelete='CASCADE'), nullable=False, index=True)  # 대표 기사
+    title = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    link = Column(String, nullable=False)
+    normalized_link = Column(String, unique=True, index=True)
+    published_at = Column(DateTime)
+    story = relationship("News", back_populates="duplicates")
+
+class FeedWatermark(Base):
+    __tablename__ = 'feed_watermarks'
+    feed_url = Column(String, primary_key=True)
+    last_published_at = Column(DateTime, nullable=False)  # 이 시각 이전에 발행된 항목은 건너뜁니다.
 
 class Vote(Base):
     __tablename__ = 'votes'
     id = Column(Integer, primary_key=True, index=True)
     news_id = Column(Integer, ForeignKey('news.id'))
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=True)  # 로그인 사용자의 투표. 익명 투표는 행을 남기지 않습니다.
     vote_value = Column(Integer, default=0)  # +1 for upvote, -1 for downvote
     news = relationship("News", back_populates="votes")
 
+    __table_args__ = (
+        UniqueConstraint('news_id', 'user_id', name='uq_votes_news_id_user_id'),  # 사용자당 기사 하나에 한 표
+    )
+
 class Like(Base):
     __tablename__ = 'likes'
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey('community_posts.id'), nullable=False)
     
 class Region(Base):
+    """지역 사전. 지역 이름은 여기에만 두고 다른 테이블은 작은 정수 id로 참조합니다."""
     __tablename__ = "regions"
-    name = Column(String, primary_key=True, index=True)
\ No newline at end of file
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, index=True, nullable=False)
\ No newline at end of file
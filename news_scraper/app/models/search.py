@@ -0,0 +1,68 @@
+# app/models/search.py
+"""
+뉴스와 커뮤니티 글의 전문 검색용 FTS5 가상 테이블과 동기화 트리거입니다.
+
+한국어는 형태소 분석 없이도 부분 문자열로 찾을 수 있도록 trigram 토크나이저를 사용합니다.
+SQLAlchemy 모델로 표현할 수 없으므로 DDL로 정의하고, create_all 뒤에 함께 생성합니다.
+
+- news_fts: rowid = news.id. 제목은 news, 요약은 news_contents에서 트리거로 채웁니다.
+- community_posts_fts: community_posts를 외부 콘텐츠 테이블로 사용합니다.
+"""
+from sqlalchemy import event
+from app.database import Base
+
+FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(title, summary, tokenize='trigram')",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news BEGIN
+        INSERT INTO news_fts(rowid, title, summary) VALUES (new.id, new.title, '');
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_au AFTER UPDATE OF title ON news BEGIN
+        UPDATE news_fts SET title = new.title WHERE rowid = new.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_ad AFTER DELETE ON news BEGIN
+        DELETE FROM news_fts WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_contents_fts_ai AFTER INSERT ON news_contents BEGIN
+        UPDATE news_fts SET summary = coalesce(new.summary, '') WHERE rowid = new.news_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_contents_fts_au AFTER UPDATE OF summary ON news_contents BEGIN
+        UPDATE news_fts SET summary = coalesce(new.summary, '') WHERE rowid = new.news_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_contents_fts_ad AFTER DELETE ON news_contents BEGIN
+        UPDATE news_fts SET summary = '' WHERE rowid = old.news_id;
+    END""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS community_posts_fts USING fts5(
+        title, content, content='community_posts', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS community_posts_fts_ai AFTER INSERT ON community_posts BEGIN
+        INSERT INTO community_posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS community_posts_fts_ad AFTER DELETE ON community_posts BEGIN
+        INSERT INTO community_posts_fts(community_posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS community_posts_fts_au AFTER UPDATE OF title, content ON community_posts BEGIN
+        INSERT INTO community_posts_fts(community_posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO community_posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+]
+
+# 이미 있는 데이터로 색인을 채웁니다 (마이그레이션, 색인 재구성).
+FTS_REBUILD = [
+    "DELETE FROM news_fts",
+    """INSERT INTO news_fts(rowid, title, summary)
+        SELECT news.id, news.title, coalesce(news_contents.summary, '')
+        FROM news LEFT JOIN news_contents ON news_contents.news_id = news.id""",
+    "INSERT INTO community_posts_fts(community_posts_fts) VALUES ('rebuild')",
+]
+
+@event.listens_for(Base.metadata, "after_create")
+def create_fts_tables(target, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'").first()
+    for statement in FTS_DDL:
+        connection.exec_driver_sql(statement)
+    # 기존 DB에 처음 만드는 경우 이미 저장된 행을 색인합니다.
+    if exists is None:
+        for statement in FTS_REBUILD:
+            connection.exec_driver_sql(statement)
@@ -1,5 +1,5 @@
 # app/models/vehicle.py
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -29,3 +29,8 @@ class VehicleSpec(Base):
     national_subsidy = Column(Integer)  # 국가 보조금
     local_subsidy = Column(Integer)  # 지자체 보조금
     final_price = Column(Integer)  # 최종 가격
+
+    __table_args__ = (
+        Index('ix_vehicle_specs_manufacturer_model', 'manufacturer', 'model', unique=True),  # 제조사 조회, 제조사+모델 upsert 키
+        Index('ix_vehicle_specs_model', 'model'),  # 모델명 조회
+    )
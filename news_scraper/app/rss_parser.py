@@ -1,26 +1,70 @@
 # app/rss_parser.py
-import feedparser
+import asyncio
 from datetime import datetime
 import time
+from typing import Dict, List, Optional, Tuple
 from .schemas import NewsCreate
+from .config import get_logger
+from .utils.http_client import get_http_session
 
-async def parse_rss_feed(url: str):
-    """
-    RSS 피드 URL을 받아 파싱하고, 각 뉴스 항목의 제목, 링크, 발행 날짜 등을 반환합니다.
-    비동기 함수로 선언되어 있지만, feedparser가 동기 라이브러리이므로, 실제 비동기 작업이 아님에 주의하세요.
-    """
-    feed = feedparser.parse(url)
+logger = get_logger()
+
+# 피드 URL별 조건부 GET 검증자 (ETag, Last-Modified)
+_feed_validators: Dict[str, Dict[str, str]] = {}
+
+def _parse_feed_body(body: bytes, url: str) -> List[NewsCreate]:
+    """워커 스레드에서 실행되는 동기 파싱 함수입니다."""
+    import feedparser  # 앱 시작 시간을 줄이기 위해 실제 파싱 시점에 로드합니다.
+
+    feed = feedparser.parse(body)
     news_items = []
 
     for entry in feed.entries:
-        # struct_time을 datetime 객체로 변환
-        published_at = datetime.fromtimestamp(time.mktime(entry.published_parsed))
+        # struct_time을 datetime 객체로 변환. 날짜가 없으면 None으로 두어 피드 워터마크 계산에서 빠지게 하고,
+        # 저장 시각은 bulk_create_news가 채웁니다.
+        published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        published_at = datetime.fromtimestamp(time.mktime(published_parsed)) if published_parsed else None
         news_items.append(NewsCreate(
             title=entry.title,
             link=entry.link,
             published_at=published_at,
             source=entry.get('source', {}).get('title', url)  # source가 없는 경우 URL을 사용
         ))
-    
+
     return news_items
 
+def save_feed_validators(validators: Dict[str, Dict[str, str]]):
+    """
+    parse_rss_feed가 돌려준 검증자를 저장합니다. 항목이 커밋된 뒤에 호출해야 합니다.
+    먼저 저장하면 파싱이나 저장이 실패한 피드도 다음 주기에 304를 받아 그 항목을 영영 수집하지 못합니다.
+    """
+    _feed_validators.update(validators)
+
+async def parse_rss_feed(url: str) -> Tuple[List[NewsCreate], Optional[Dict[str, str]]]:
+    """
+    RSS 피드 URL을 받아 파싱하고, 각 뉴스 항목의 제목, 링크, 발행 날짜 등과 응답의 검증자(ETag, Last-Modified)를 반환합니다.
+    피드는 공유 HTTP 클라이언트로 ETag/Last-Modified 조건부 요청을 보내 가져오며,
+    304 Not Modified 응답이면 파싱하지 않고 빈 목록과 None을 반환합니다.
+    검증자는 여기서 저장하지 않습니다. 호출자가 항목을 커밋한 뒤 save_feed_validators로 저장합니다.
+    XML 파싱은 이벤트 루프를 막지 않도록 워커 스레드에서 수행합니다.
+    """
+    headers = {}
+    validators = _feed_validators.get(url, {})
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+
+    session = await get_http_session()
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304:
+            logger.info(f"RSS feed not modified: {url}")
+            return [], None
+        response.raise_for_status()
+        body = await response.read()
+        validators = {
+            'etag': response.headers.get('ETag', ''),
+            'last_modified': response.headers.get('Last-Modified', ''),
+        }
+
+    return await asyncio.to_thread(_parse_feed_body, body, url), validators
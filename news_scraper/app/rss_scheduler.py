@@ -1,26 +1,111 @@
 # app/rss_scheduler.py
 import asyncio
 import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 from dotenv import load_dotenv
 from .database import SessionLocal
-from .crud import create_news
+from .crud import bulk_create_news, get_feed_watermarks, update_feed_watermarks
 from .config import get_logger
-from .rss_parser import parse_rss_feed
+from .core.config import settings
+from .rss_parser import parse_rss_feed, save_feed_validators
+from .schemas import NewsCreate
+from .utils.link_utils import normalize_link
 
 load_dotenv()  # 환경 변수 로드
 
 # 환경 변수에서 스케줄링 간격 읽기 (기본값: 86400초, 즉 24시간)
 rss_fetch_interval = int(os.getenv('RSS_FETCH_INTERVAL_SECONDS', 86400))
 
+GOOGLE_NEWS_SEARCH_URL = "https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
+
 logger = get_logger()
 
+# 마지막 수집 주기의 피드별 지연 시간과 항목 수
+last_feed_stats: List[dict] = []
+
+def build_feed_urls() -> List[str]:
+    """설정된 키워드별 Google News 검색 피드와 언론사 RSS URL을 중복 없이 반환합니다."""
+    urls = [GOOGLE_NEWS_SEARCH_URL.format(query=quote(keyword)) for keyword in settings.RSS_KEYWORDS]
+    urls.extend(settings.RSS_FEED_URLS)
+    return list(dict.fromkeys(urls))
+
+async def fetch_feed(url: str, semaphore: asyncio.Semaphore, watermark: Optional[datetime] = None) -> Tuple[List[NewsCreate], dict, Optional[dict]]:
+    async with semaphore:
+        started = time.perf_counter()
+        validators = None
+        try:
+            items, validators = await parse_rss_feed(url)
+            if watermark is not None:
+                # 이미 수집한 시점 이전에 발행된 항목은 DB에 보내지 않습니다. 날짜가 없는 항목은 링크 중복 검사에 맡깁니다.
+                items = [item for item in items if item.published_at is None or item.published_at > watermark]
+            error = None
+        except Exception as e:
+            items, validators = [], None
+            error = str(e)
+        latency_ms = (time.perf_counter() - started) * 1000
+    stats = {'url': url, 'items': len(items), 'latency_ms': round(latency_ms, 1), 'error': error}
+    if error:
+        logger.error(f"RSS feed failed after {latency_ms:.0f} ms: {url}: {error}")
+    else:
+        logger.info(f"RSS feed fetched {len(items)} items in {latency_ms:.0f} ms: {url}")
+    return items, stats, validators
+
+def merge_news_items(feeds: List[List[NewsCreate]]) -> List[NewsCreate]:
+    """여러 피드의 항목을 합치면서 링크나 제목이 같은 기사는 하나만 남깁니다."""
+    seen_links = set()
+    seen_titles = set()
+    merged = []
+    for items in feeds:
+        for item in items:
+            link = normalize_link(item.link)
+            title = item.title.strip()
+            if link in seen_links or title in seen_titles:
+                continue
+            seen_links.add(link)
+            seen_titles.add(title)
+            merged.append(item)
+    return merged
+
+def latest_published_at(items: List[NewsCreate]) -> Optional[datetime]:
+    published = [item.published_at for item in items if item.published_at]
+    return max(published) if published else None
+
+async def fetch_all_feeds(urls: List[str], watermarks: Optional[Dict[str, datetime]] = None) -> Tuple[List[NewsCreate], List[dict], Dict[str, datetime], Dict[str, dict]]:
+    """
+    모든 피드를 동시에 가져와 (병합된 항목, 피드별 통계, 새 워터마크, 조건부 GET 검증자)를 반환합니다.
+    워터마크와 검증자는 항목을 커밋한 뒤에 저장해야 합니다.
+    """
+    watermarks = watermarks or {}
+    semaphore = asyncio.Semaphore(max(1, settings.RSS_FETCH_CONCURRENCY))
+    results = await asyncio.gather(*(fetch_feed(url, semaphore, watermarks.get(url)) for url in urls))
+    news_items = merge_news_items([items for items, _, _ in results])
+    new_watermarks = {}
+    validators = {}
+    for url, (items, _, feed_validators) in zip(urls, results):
+        latest = latest_published_at(items)
+        if latest is not None:
+            new_watermarks[url] = latest
+        if feed_validators is not None:
+            validators[url] = feed_validators
+    return news_items, [stats for _, stats, _ in results], new_watermarks, validators
+
 async def fetch_and_store_rss_feed():
+    urls = build_feed_urls()
     async with SessionLocal() as session:
-        rss_url = "https://news.google.com/rss/search?q=전기차&hl=ko&gl=KR&ceid=KR:ko"
-        news_items = await parse_rss_feed(rss_url)
-        for item in news_items:
-            await create_news(session, item)
-        logger.info("RSS feed fetched and stored")
+        watermarks = await get_feed_watermarks(session, urls)
+    news_items, feed_stats, new_watermarks, validators = await fetch_all_feeds(urls, watermarks)
+    last_feed_stats[:] = feed_stats
+    async with SessionLocal() as session:
+        inserted = await bulk_create_news(session, news_items)
+        # 삽입이 커밋된 뒤에만 워터마크와 조건부 GET 검증자를 전진시킵니다.
+        await update_feed_watermarks(session, new_watermarks)
+    save_feed_validators(validators)
+    fetched = sum(stats['items'] for stats in feed_stats)
+    logger.info(f"RSS feeds fetched and stored: {len(urls)} feeds, {fetched} new items, {len(news_items)} after dedup, {inserted} inserted")
+    return feed_stats
 
 async def start_rss_feed_scheduler():
     while True:
@@ -40,5 +125,3 @@ async def start_rss_feed_scheduler():
 # 이 스크립트가 메인으로 실행될 때만 스케줄러 시작
 if __name__ == "__main__":
     asyncio.run(start_rss_feed_scheduler())
-
-
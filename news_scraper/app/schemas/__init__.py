@@ -3,11 +3,14 @@ from .community import (
     CommunityPostBase,
     CommunityPostCreate,
     CommunityPost,
+    CommunityPostDetail,
+    PostAuthor,
     CommunityPostsResponse,
     CommunityPostUpdate,
     CommentBase,
     CommentCreate,
-    Comment
+    Comment,
+    CommentCount
 )
 
 # Importing all classes and models from ev_registration.py
@@ -15,7 +18,14 @@ from .ev_registration import (
     EVRegistrationBase,
     EVRegistrationCreate,
     EVRegistrationUpdate,
-    EVRegistration
+    EVRegistration,
+    EVRegionTotal,
+    EVYearTotal,
+    EVMonthTotal,
+    EVYearOverYear,
+    EVTrendPoint,
+    EVPivot,
+    EVRegionShare
 )
 
 # Importing all classes and models from news.py
@@ -24,6 +34,9 @@ from .news import (
     NewsCreate,
     News,
     NewsResponse,
+    FeedStats,
+    NewsContent,
+    ArticlePipelineStats,
     VoteCreate
 )
 
@@ -38,5 +51,19 @@ from .users import (
 from .vehicle import (
     VehicleSpecBase,
     VehicleSpecCreate,
-    VehicleSpec
+    VehicleSpec,
+    VehicleScrapeRequest
 )
+
+# Importing all classes and models from jobs.py
+from .jobs import (
+    Job
+)
+
+
+# Importing all classes and models from search.py
+from .search import (
+    NewsSearchHit,
+    CommunityPostSearchHit,
+    SearchResponse
+)
\ No newline at end of file
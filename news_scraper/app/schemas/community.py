@@ -26,9 +26,17 @@ class CommunityPost(BaseModel):
     class Config:
         from_attributes = True
 
+class PostAuthor(BaseModel):
+    id: int
+    username: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 class CommunityPostsResponse(BaseModel):
     items: List[CommunityPost]
     total: int
+    next_cursor: Optional[str] = None
     
 class CommunityPostUpdate(BaseModel):
     title: Optional[str] = Field(None, title="The title of the post")
@@ -53,4 +61,12 @@ class Comment(CommentBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class CommentCount(BaseModel):
+    post_id: int
+    count: int
+
+class CommunityPostDetail(CommunityPost):
+    author: Optional[PostAuthor] = Field(None, validation_alias='user')
+    comments: List[Comment] = Field([], validation_alias='first_comments')  # 첫 페이지 댓글 (작성 순)
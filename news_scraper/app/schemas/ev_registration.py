@@ -1,5 +1,6 @@
 # app/schemas/ev_registration.py
 from pydantic import BaseModel
+from typing import List, Optional
 
 class EVRegistrationBase(BaseModel):
     region: str
@@ -18,3 +19,42 @@ class EVRegistration(EVRegistrationBase):
 
     class Config:
         orm_mode = True
+
+class EVRegionTotal(BaseModel):
+    region: str
+    total: int
+
+class EVYearTotal(BaseModel):
+    year: int
+    total: int
+
+class EVMonthTotal(BaseModel):
+    year: int
+    month: int
+    total: int
+
+class EVYearOverYear(EVYearTotal):
+    previous_total: Optional[int] = None
+    change: Optional[int] = None
+    change_rate: Optional[float] = None  # (total - previous_total) / previous_total
+
+class EVTrendPoint(BaseModel):
+    year: int
+    month: int
+    count: int
+    cumulative: int
+    mom: Optional[float] = None  # 전월 대비 증감률
+    yoy: Optional[float] = None  # 전년 동월 대비 증감률
+    rolling_mean: Optional[float] = None
+
+class EVPivot(BaseModel):
+    """지역 x 월 행렬. values[i][j]는 regions[i] 지역의 (years[j], months[j]) 등록 대수입니다."""
+    regions: List[str]
+    years: List[int]
+    months: List[int]
+    values: List[List[int]]
+
+class EVRegionShare(BaseModel):
+    region: str
+    total: int
+    share: float
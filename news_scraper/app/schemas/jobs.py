@@ -0,0 +1,19 @@
+# app/schemas/jobs.py
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+class Job(BaseModel):
+    id: str
+    kind: str
+    status: str
+    total: int
+    completed: int
+    failed: int
+    errors: List[str] = []
+    result: Optional[dict] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 # app/schemas/news.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import List, Generic, TypeVar, Generic, Optional
 from pydantic.generics import GenericModel
@@ -12,12 +12,12 @@ class NewsBase(BaseModel):
     link: str
 
 class NewsCreate(NewsBase):
-    pass
+    published_at: Optional[datetime] = None  # 없으면 저장 시각을 사용합니다.
 
 class News(NewsBase):
     id: int
     published_at: datetime
-    voteCount: Optional[int] = None  # Assuming this is dynamically calculated
+    voteCount: Optional[int] = None  # news.vote_count
 
     class Config:
         from_attributes = True
@@ -25,10 +25,34 @@ class News(NewsBase):
 class NewsResponse(GenericModel, Generic[DataT]):
     items: List[DataT]
     total: int
+    next_cursor: Optional[str] = None  # 다음 페이지 요청에 cursor로 넘기는 값. 마지막 페이지면 None
+
+class FeedStats(BaseModel):
+    url: str
+    items: int
+    latency_ms: float
+    error: Optional[str] = None
+
+class NewsContent(BaseModel):
+    news_id: int
+    status: str
+    body: Optional[str] = None
+    summary: Optional[str] = None
+    image_url: Optional[str] = None
+    fetched_at: Optional[datetime] = None
+
+class ArticlePipelineStats(BaseModel):
+    running: bool
+    processed: int
+    failed: int
+    bytes_fetched: int
+    last_batch_size: int
+    last_batch_seconds: float
+    articles_per_second: float
 
 # Vote
 class VoteCreate(BaseModel):
-    vote_value: int  # Can be 1 for upvote and -1 for downvote
+    vote_value: int = Field(..., ge=-1, le=1)  # 1 for upvote, -1 for downvote, 0 to withdraw a user's vote
 
     class Config:
         from_attributes = True  # To allow ORM models to be used with these schemas
\ No newline at end of file
@@ -0,0 +1,31 @@
+# app/schemas/search.py
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Generic, TypeVar, Optional
+from pydantic.generics import GenericModel
+
+DataT = TypeVar('DataT')
+
+class NewsSearchHit(BaseModel):
+    id: int
+    title: str
+    source: str
+    link: str
+    published_at: Optional[datetime] = None
+    title_highlight: str  # 일치한 부분을 <mark>...</mark>로 감싼 제목
+    snippet: str  # 일치 부분 주변의 짧은 발췌
+    score: Optional[float] = None  # BM25 점수 (낮을수록 관련도가 높음)
+
+class CommunityPostSearchHit(BaseModel):
+    id: int
+    title: str
+    created_at: Optional[datetime] = None
+    title_highlight: str
+    snippet: str
+    score: Optional[float] = None
+
+class SearchResponse(GenericModel, Generic[DataT]):
+    items: List[DataT]
+    query: str
+    skip: int
+    limit: int
@@ -39,4 +39,8 @@ class VehicleSpec(VehicleSpecCreate):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class VehicleScrapeRequest(BaseModel):
+    urls: List[str] = Field(..., min_length=1, description="Model page URLs to scrape", example=["https://www.tesla.com/ko_kr/model3"])
+    concurrency: Optional[PositiveInt] = Field(None, description="Number of pages scraped in parallel")
@@ -1,10 +1,12 @@
 # app/scrapers/base_playwright_scraper.py
-from playwright.async_api import async_playwright
+from ..utils.snapshot_archive import archive_page
 import logging
 
 logger = logging.getLogger("BasePlaywrightScraper")
 
 class BasePlaywrightScraper:
+    region = ""
+
     def __init__(self, base_url, path):
         self.base_url = base_url
         self.path = path
@@ -13,6 +15,7 @@ class BasePlaywrightScraper:
         page_content = ""
         browser = None
         try:
+            from playwright.async_api import async_playwright  # Playwright는 실제로 사용할 때만 로드합니다.
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
                 page = await browser.new_page()
@@ -23,6 +26,8 @@ class BasePlaywrightScraper:
         finally:
             if 'browser' in locals():
                 await browser.close()
+        if page_content:
+            await archive_page(self.region, f"{self.base_url}{self.path}", page_content)
         return page_content
 
     async def scrape(self):
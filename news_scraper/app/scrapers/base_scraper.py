@@ -1,9 +1,11 @@
 # app/scrapers/base_scraper.py
 from abc import ABC, abstractmethod
 from ..utils.scraping_utils import fetch_html
+from ..utils.snapshot_archive import archive_page
 import logging
 
 class BaseScraper(ABC):
+    region = ""
     base_url = ""
     path = ""
     selectors = {}
@@ -13,10 +15,12 @@ class BaseScraper(ABC):
 
     async def scrape(self):
         try:
-            html = await fetch_html(self.get_full_url())
+            url = self.get_full_url()
+            html = await fetch_html(url)
             if not html:
                 self.logger.error("Failed to fetch HTML content.")
                 return []
+            await archive_page(self.region, url, html)
             return await self.scrape_specific(html)
         except Exception as e:
             self.logger.error(f"Error during scraping: {e}")
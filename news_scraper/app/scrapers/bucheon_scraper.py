@@ -4,6 +4,8 @@ from .base_scraper import BaseScraper
 from urllib.parse import urlencode, parse_qsl, urlparse
 
 class BucheonScraper(BaseScraper):
+    region = "bucheon"
+
     def __init__(self):
         super().__init__()
         self.base_url = "http://www.bucheon.go.kr"
@@ -4,6 +4,8 @@ from .base_scraper import BaseScraper
 import re
 
 class GoyangScraper(BaseScraper):
+    region = "goyang"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.goyang.go.kr"
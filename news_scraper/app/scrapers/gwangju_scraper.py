@@ -1,16 +1,18 @@
 # app/scrapers/gwangju_scraper.py
 import asyncio
-from playwright.async_api import async_playwright
 from .base_playwright_scraper import BasePlaywrightScraper
 import logging
 import re
 from ..utils.cache_management import load_cached_data, save_data_to_cache, get_md5_hash
+from ..utils.snapshot_archive import archive_page
 
 # Setup logging for the Gwangju scraper
 logger = logging.getLogger('GwangjuScraper')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class GwangjuScraper(BasePlaywrightScraper):
+    region = "gwangju"
+
     def __init__(self):
         super().__init__("https://www.gwangju.go.kr", "/contentsView.do?pageId=www791")
         self.page_id = "www791"
@@ -22,10 +24,13 @@ class GwangjuScraper(BasePlaywrightScraper):
         logger.info(f"Navigating to {url}")
 
         try:
+            from playwright.async_api import async_playwright
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
                 page = await browser.new_page()
                 await page.goto(url, wait_until="networkidle")
+                # scrape()를 직접 구현하므로 fetch_page를 거치지 않습니다. 디버깅용으로 원본 페이지를 아카이브합니다.
+                await archive_page(self.region, url, await page.content())
 
                 await page.wait_for_selector('iframe', timeout=10000)
                 iframe_element = await page.wait_for_selector('iframe')
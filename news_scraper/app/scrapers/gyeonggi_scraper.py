@@ -4,6 +4,8 @@ from .base_scraper import BaseScraper
 import re
 
 class GyeonggiScraper(BaseScraper):
+    region = "gyeonggi"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://ggeea.or.kr"
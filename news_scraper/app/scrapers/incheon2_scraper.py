@@ -9,6 +9,8 @@ from bs4 import BeautifulSoup
 logger = logging.getLogger('Incheon2Scraper')
 
 class Incheon2Scraper(BasePlaywrightScraper):
+    region = "incheon2"
+
     def __init__(self):
         # Initialize the base class with the specific URL and path for Incheon announcements.
         super().__init__("https://announce.incheon.go.kr", "/citynet/jsp/sap/SAPGosiBizProcess.do?command=searchList&flag=gosiGL&svp=Y&sido=ic")
@@ -16,9 +18,10 @@ class Incheon2Scraper(BasePlaywrightScraper):
     async def scrape(self):
         # Use the fetch_page method from BasePlaywrightScraper to get the page content.
         page_content = await self.fetch_page()
-        # Since page_content is a raw HTML string, we may need BeautifulSoup here if required.
-        # For demonstration, assume page_content processing as if it was directly obtained.
-        
+        return await self.scrape_specific(page_content)
+
+    async def scrape_specific(self, page_content: str):
+        # Parsing is kept separate from fetching so archived snapshots can be replayed.
         announcements = []
         # Directly using BeautifulSoup or other parsing logic here to process page_content
         # Assuming BeautifulSoup is used to parse the fetched HTML content
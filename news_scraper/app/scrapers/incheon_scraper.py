@@ -6,6 +6,8 @@ from app.config import get_logger
 logger = get_logger()
 
 class IncheonScraper(BaseScraper):
+    region = "incheon"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.incheon.go.kr"
@@ -1,15 +1,17 @@
 # app/scrapers/notice_scraper.py
 import asyncio
 import logging
-from playwright.async_api import async_playwright
 from .base_playwright_scraper import BasePlaywrightScraper
 from ..utils.cache_management import load_cached_data, save_data_to_cache, get_md5_hash
+from ..utils.snapshot_archive import archive_page
 
 # Setup logging
 logger = logging.getLogger('EVPortalNoticeScraper')
 logging.basicConfig(level=logging.INFO)
 
 class EVPortalNoticeScraper(BasePlaywrightScraper):
+    region = "evportal"
+
     def __init__(self):
         base_url = "https://ev.or.kr/nportal/partcptn/initNoticeAction.do"
         super().__init__(base_url, "")
@@ -17,10 +19,13 @@ class EVPortalNoticeScraper(BasePlaywrightScraper):
     async def scrape(self):
         announcements = []
         try:
+            from playwright.async_api import async_playwright
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
                 page = await browser.new_page()
                 await page.goto(f"{self.base_url}{self.path}", wait_until="networkidle")
+                # scrape()를 직접 구현하므로 fetch_page를 거치지 않습니다. 디버깅용으로 원본 페이지를 아카이브합니다.
+                await archive_page(self.region, f"{self.base_url}{self.path}", await page.content())
                 logger.info("Page loaded")
 
                 # Adjusted to query for each 'li' under 'ul' in 'div.board_thumb'
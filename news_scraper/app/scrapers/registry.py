@@ -0,0 +1,59 @@
+# app/scrapers/registry.py
+import importlib
+from typing import Dict, Iterator, Optional
+
+# 지역 이름 -> "모듈:클래스". 모듈은 해당 지역이 처음 요청될 때 import 됩니다.
+SCRAPER_PATHS = {
+    'gyeonggi': 'gyeonggi_scraper:GyeonggiScraper',
+    'incheon': 'incheon_scraper:IncheonScraper',
+    'koroad': 'koroad_scraper:KoroadScraper',
+    'bucheon': 'bucheon_scraper:BucheonScraper',
+    'ulsan': 'ulsan_scraper:UlsanScraper',
+    'sejong': 'sejong_scraper:SejongScraper',
+    'wonju': 'wonju_scraper:WonjuScraper',
+    'goyang': 'goyang_scraper:GoyangScraper',
+    'seoul': 'seoul_scraper:SeoulScraper',
+    'gwangju': 'gwangju_scraper:GwangjuScraper',
+    'incheon2': 'incheon2_scraper:Incheon2Scraper',
+    'evportal': 'notice_scraper:EVPortalNoticeScraper',
+    # 기타 지역 스크래퍼 추가...
+}
+
+class ScraperRegistry:
+    """
+    지역별 스크래퍼를 지연 로딩하는 dict 형태의 레지스트리입니다.
+    스크래퍼 모듈은 처음 사용할 때 import 되고, 인스턴스는 한 번만 만들어집니다.
+    """
+
+    def __init__(self, paths: Dict[str, str]):
+        self._paths = dict(paths)
+        self._instances = {}
+
+    def get(self, region: str, default=None):
+        if region not in self._paths:
+            return default
+        if region not in self._instances:
+            module_name, class_name = self._paths[region].split(':')
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            self._instances[region] = getattr(module, class_name)()
+        return self._instances[region]
+
+    def __getitem__(self, region: str):
+        scraper = self.get(region)
+        if scraper is None:
+            raise KeyError(region)
+        return scraper
+
+    def __contains__(self, region: str) -> bool:
+        return region in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def keys(self):
+        return self._paths.keys()
+
+SCRAPERS = ScraperRegistry(SCRAPER_PATHS)
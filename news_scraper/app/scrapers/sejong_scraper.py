@@ -3,6 +3,8 @@ from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
 
 class SejongScraper(BaseScraper):
+    region = "sejong"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.sejong.go.kr"
@@ -2,14 +2,16 @@
 import asyncio
 import logging
 import urllib.parse
-from playwright.async_api import async_playwright
 from .base_playwright_scraper import BasePlaywrightScraper
 from ..utils.cache_management import load_cached_data, save_data_to_cache, get_md5_hash
+from ..utils.snapshot_archive import archive_page
 
 # Setup logging
 logger = logging.getLogger('SeoulScraper')
 
 class SeoulScraper(BasePlaywrightScraper):
+    region = "seoul"
+
     def __init__(self):
         search_term = urllib.parse.quote("전기차")
         super().__init__("https://www.seoul.go.kr", f"/news/news_notice.do?#list/1/cntPerPage=10&srchText={search_term}")
@@ -17,10 +19,13 @@ class SeoulScraper(BasePlaywrightScraper):
     async def scrape(self):
         announcements = []
         try:
+            from playwright.async_api import async_playwright
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
                 page = await browser.new_page()
                 await page.goto(f"{self.base_url}{self.path}", wait_until="networkidle")
+                # scrape()를 직접 구현하므로 fetch_page를 거치지 않습니다. 디버깅용으로 원본 페이지를 아카이브합니다.
+                await archive_page(self.region, f"{self.base_url}{self.path}", await page.content())
 
                 # Ensure the correct selectors based on the structure of the page
                 posts = await page.query_selector_all("//td[contains(@class,'sib-lst-type-basic-subject')]/..")
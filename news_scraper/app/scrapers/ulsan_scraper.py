@@ -3,6 +3,8 @@ from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
 
 class UlsanScraper(BaseScraper):
+    region = "ulsan"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.ulsan.go.kr"
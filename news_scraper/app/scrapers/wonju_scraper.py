@@ -4,6 +4,8 @@ from .base_scraper import BaseScraper
 from urllib.parse import urljoin
 
 class WonjuScraper(BaseScraper):
+    region = "wonju"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.wonju.go.kr"
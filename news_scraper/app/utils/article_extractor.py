@@ -0,0 +1,66 @@
+# app/utils/article_extractor.py
+"""
+기사 HTML에서 본문, 대표 이미지, 요약을 추출합니다.
+프로세스 풀에서 실행되므로 모듈 수준 함수만 사용하고, 결과는 피클 가능한 dict로 반환합니다.
+"""
+import re
+from typing import Optional
+
+SUMMARY_MAX_LENGTH = 300
+MIN_PARAGRAPH_LENGTH = 30
+
+_WHITESPACE = re.compile(r"\s+")
+_SENTENCE_END = re.compile(r"(?<=[.!?다])\s+")
+
+def _meta_content(soup, *names) -> Optional[str]:
+    for name in names:
+        tag = soup.find("meta", attrs={"property": name}) or soup.find("meta", attrs={"name": name})
+        if tag and tag.get("content"):
+            return tag["content"].strip()
+    return None
+
+def _main_text(soup) -> str:
+    for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside", "form"]):
+        tag.decompose()
+
+    article = soup.find("article")
+    if article is not None:
+        paragraphs = [p.get_text(" ", strip=True) for p in article.find_all("p")]
+        text = "\n".join(p for p in paragraphs if p)
+        if text:
+            return text
+
+    # <article>이 없으면 긴 문단을 가장 많이 가진 블록을 본문으로 봅니다.
+    best_text, best_length = "", 0
+    for block in soup.find_all(["div", "section", "td"]):
+        # 직계 <p> 문단과, <br>로 구분된 직계 텍스트 노드를 모두 문단으로 봅니다.
+        children = [p.get_text(" ", strip=True) for p in block.find_all("p", recursive=False)]
+        children += [str(node) for node in block.find_all(string=True, recursive=False)]
+        paragraphs = [_WHITESPACE.sub(" ", p).strip() for p in children]
+        paragraphs = [p for p in paragraphs if len(p) >= MIN_PARAGRAPH_LENGTH]
+        length = sum(len(p) for p in paragraphs)
+        if length > best_length:
+            best_text, best_length = "\n".join(paragraphs), length
+    return best_text
+
+def summarize(text: str, max_length: int = SUMMARY_MAX_LENGTH) -> str:
+    """본문 앞쪽 문장들을 max_length 이내로 잘라 요약으로 사용합니다."""
+    summary = ""
+    for sentence in _SENTENCE_END.split(_WHITESPACE.sub(" ", text).strip()):
+        if len(summary) + len(sentence) + 1 > max_length:
+            break
+        summary = f"{summary} {sentence}".strip()
+    return summary or text[:max_length]
+
+def extract_article(html: str) -> dict:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    image_url = _meta_content(soup, "og:image", "twitter:image")
+    description = _meta_content(soup, "og:description", "description")
+    body = _main_text(soup)
+    return {
+        "body": body,
+        "summary": description or summarize(body),
+        "image_url": image_url,
+    }
@@ -1,5 +1,6 @@
 # app/utils/cache_management.py
 import json
+import time
 import aiofiles
 from hashlib import md5
 
@@ -25,3 +26,29 @@ async def save_data_to_cache(file_path, data):
 def get_md5_hash(data):
     """Generate an MD5 hash for the given data."""
     return md5(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+class TTLCache:
+    """만료 시간이 있는 간단한 프로세스 내 캐시입니다."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+
+    def invalidate(self, key=None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
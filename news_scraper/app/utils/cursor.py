@@ -0,0 +1,37 @@
+# app/utils/cursor.py
+"""
+키셋(커서) 페이지네이션용 불투명 커서를 만들고 해석합니다.
+커서는 마지막으로 받은 행의 정렬 키(예: (published_at, id))를 JSON으로 담아 base64url로 인코딩한 문자열입니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+def encode_cursor(*key) -> str:
+    values = [{"dt": value.isoformat()} if isinstance(value, datetime) else value for value in key]
+    payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[Tuple]:
+    """커서를 정렬 키 튜플로 되돌립니다. 형식이 잘못되었거나 길이가 size와 다르면 ValueError."""
+    if not cursor:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+        key = tuple(datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value for value in values)
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if len(key) != size:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return key
+
+def next_cursor(items: list, limit: int, *attributes: str) -> Optional[str]:
+    """페이지가 가득 찼으면 마지막 항목의 정렬 키로 다음 페이지 커서를 만듭니다."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, dict):
+        return encode_cursor(*(last[attribute] for attribute in attributes))
+    return encode_cursor(*(getattr(last, attribute) for attribute in attributes))
@@ -0,0 +1,79 @@
+# app/utils/db_benchmark.py
+"""
+DB 프로필별 읽기/쓰기 처리량을 비교합니다. `python -m app.utils.db_benchmark` 로 실행하며,
+임시 SQLite 파일에 쓰기 작업자와 읽기 작업자를 동시에 돌려 초당 처리 건수를 출력합니다.
+
+- default: 롤백 저널, 단일 연결 풀 (이전 설정)
+- production: WAL + 튜닝된 PRAGMA, 읽기는 읽기 전용 연결 풀
+"""
+import argparse
+import asyncio
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.database import install_sqlite_pragmas, read_only_url, sqlite_pragmas
+from app.utils.temp_database import temporary_database
+
+PROFILES = ("default", "production")
+
+async def _writer(engine, count: int, stats: dict):
+    for i in range(count):
+        async with engine.begin() as conn:
+            await conn.execute(text("INSERT INTO bench (title, body) VALUES (:title, :body)"), {"title": f"title {i}", "body": "x" * 200})
+        stats["writes"] += 1
+
+async def _reader(engine, deadline: float, stats: dict):
+    while time.perf_counter() < deadline:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id, title FROM bench ORDER BY id DESC LIMIT 20"))
+        stats["reads"] += 1
+
+async def run_profile(profile: str, writers: int, writes: int, readers: int, seed_rows: int) -> dict:
+    async with temporary_database('bench.db', profile=profile, create_schema=False, connect_args={"check_same_thread": False}) as (engine, _):
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE bench (id INTEGER PRIMARY KEY, title TEXT, body TEXT)"))
+            await conn.execute(text("INSERT INTO bench (title, body) VALUES (:title, :body)"), [{"title": f"seed {i}", "body": "x" * 200} for i in range(seed_rows)])
+
+        read_engine = engine
+        if profile == "production":
+            read_engine = create_async_engine(read_only_url(engine.url), connect_args={"check_same_thread": False}, pool_size=readers)
+            install_sqlite_pragmas(read_engine, sqlite_pragmas(read_only=True, profile=profile))
+
+        stats = {"writes": 0, "reads": 0}
+        started = time.perf_counter()
+        write_tasks = [asyncio.create_task(_writer(engine, writes, stats)) for _ in range(writers)]
+        # 읽기 작업자는 쓰기가 끝날 때까지 계속 읽습니다.
+        read_tasks = [asyncio.create_task(_reader(read_engine, float("inf"), stats)) for _ in range(readers)]
+        await asyncio.gather(*write_tasks)
+        elapsed = time.perf_counter() - started
+        for task in read_tasks:
+            task.cancel()
+        await asyncio.gather(*read_tasks, return_exceptions=True)
+
+        if read_engine is not engine:
+            await read_engine.dispose()
+    return {
+        "profile": profile,
+        "seconds": round(elapsed, 3),
+        "writes_per_second": round(stats["writes"] / elapsed, 1),
+        "reads_per_second": round(stats["reads"] / elapsed, 1),
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare SQLite read/write throughput of the DB profiles.")
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--writes", type=int, default=500, help="transactions per writer")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seed-rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    for profile in PROFILES:
+        result = asyncio.run(run_profile(profile, args.writers, args.writes, args.readers, args.seed_rows))
+        print(
+            f"{result['profile']:>10}: {result['writes_per_second']:>8} writes/s "
+            f"{result['reads_per_second']:>8} reads/s ({result['seconds']} s)"
+        )
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+# app/utils/ev_timeseries.py
+"""
+EV 등록 대수를 지역 x 월 NumPy 배열로 메모리에 유지하고, 추세 지표를 벡터 연산으로 계산합니다.
+
+앱 시작 시 ev_registrations 전체를 한 번 읽어 배열을 만들고, 등록 데이터를 쓰는 CRUD가 바뀐 칸을 직접 갱신합니다.
+다른 워커나 가져오기 작업 프로세스가 쓴 변경은 EV_TIMESERIES_REFRESH_SECONDS 마다 다시 읽어 반영합니다.
+분석 요청은 SQL 없이 배열만 사용합니다.
+"""
+import asyncio
+from datetime import datetime
+from typing import Iterable, List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_logger
+from app.core.config import settings
+from app.models.ev_registration import EVRegistration
+from app.models.news import Region
+
+logger = get_logger()
+
+def _period(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+def _growth(np, series, lag: int):
+    """lag 개월 전 대비 증감률. 비교 대상이 없거나 0이면 NaN."""
+    growth = np.full(series.shape, np.nan)
+    if series.shape[-1] > lag:
+        previous, current = series[..., :-lag], series[..., lag:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth[..., lag:] = np.where(previous > 0, (current - previous) / previous, np.nan)
+    return growth
+
+def _rolling_mean(np, series, window: int):
+    rolling = np.full(series.shape, np.nan)
+    if series.shape[-1] >= window:
+        cumulative = np.concatenate(([0.0], np.cumsum(series)))
+        rolling[window - 1:] = (cumulative[window:] - cumulative[:-window]) / window
+    return rolling
+
+def _values(np, array) -> list:
+    # JSON에는 NaN이 없으므로 None으로 바꿉니다.
+    return [None if value != value else value for value in np.round(array, 4).tolist()]
+
+class EVTimeSeries:
+    """
+    counts[r, t]: regions[r] 지역의 (start + t) 번째 월 등록 대수. 월은 year * 12 + month - 1 로 셉니다.
+    """
+
+    def __init__(self):
+        self.regions: List[str] = []
+        self.region_index = {}
+        self.start = 0
+        self.counts = None
+        self.loaded_at: Optional[datetime] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.counts is not None
+
+    async def load(self, db: AsyncSession):
+        """ev_registrations 전체를 읽어 배열을 새로 만듭니다."""
+        import numpy as np  # 무거운 의존성은 앱 import 시점이 아니라 처음 로드할 때 가져옵니다.
+
+        names = dict((await db.execute(select(Region.id, Region.name))).all())
+        result = await db.execute(
+            select(EVRegistration.region_id, EVRegistration.period, func.coalesce(EVRegistration.count, 0))
+            .where(EVRegistration.region_id.is_not(None), EVRegistration.period.is_not(None))
+        )
+        # 지역 id, yyyymm, 등록 대수가 모두 정수이므로 한 번에 (행 수 x 3) 배열로 받습니다.
+        # Row 객체를 np.array에 바로 넘기면 값마다 시퀀스 검사를 해서 느리므로 평탄화해 fromiter로 읽습니다.
+        rows = result.all()
+        rows = np.fromiter((value for row in rows for value in row), dtype=np.int64, count=len(rows) * 3).reshape(-1, 3)
+        region_ids = np.unique(rows[:, 0])
+        regions = sorted(names[region_id] for region_id in region_ids.tolist())
+        region_index = {region: position for position, region in enumerate(regions)}
+        if len(rows):
+            periods = rows[:, 1] // 100 * 12 + rows[:, 1] % 100 - 1
+            start = int(periods.min())
+            counts = np.zeros((len(regions), int(periods.max()) - start + 1), dtype=np.int64)
+            # regions.id -> 배열 행 번호
+            positions = np.zeros(int(region_ids.max()) + 1, dtype=np.int64)
+            positions[region_ids] = [region_index[names[region_id]] for region_id in region_ids.tolist()]
+            counts[positions[rows[:, 0]], periods - start] = rows[:, 2]
+        else:
+            start, counts = 0, np.zeros((0, 0), dtype=np.int64)
+        # 요청 처리 중에 반쯤 바뀐 상태가 보이지 않도록 한꺼번에 교체합니다.
+        self.regions, self.region_index, self.start, self.counts = regions, region_index, start, counts
+        self.loaded_at = datetime.now()
+
+    async def apply(self, db: AsyncSession, rows: Iterable[dict]):
+        """
+        쓰기 트랜잭션이 커밋된 뒤 바뀐 (region, year, month, count) 칸을 반영합니다. 삭제는 count=0 으로 넘깁니다.
+        새 지역이나 배열 범위 밖의 월이 있으면 전체를 다시 읽습니다.
+        """
+        if not self.loaded:
+            return
+        cells = []
+        for row in rows:
+            position = self.region_index.get(row['region'])
+            t = _period(row['year'], row['month']) - self.start
+            if position is None or not 0 <= t < self.counts.shape[1]:
+                await self.load(db)
+                return
+            cells.append((position, t, row['count'] or 0))
+        for position, t, count in cells:
+            self.counts[position, t] = count
+
+    def _periods(self):
+        import numpy as np
+
+        periods = self.start + np.arange(self.counts.shape[1])
+        return periods // 12, periods % 12 + 1
+
+    def series(self, region: Optional[str] = None):
+        """지역의 월별 등록 대수(float). region이 없으면 전국 합계. 없는 지역이면 KeyError."""
+        if region is None:
+            return self.counts.sum(axis=0).astype(float)
+        return self.counts[self.region_index[region]].astype(float)
+
+    def trend(self, region: Optional[str] = None, window: int = 3) -> List[dict]:
+        """월별 등록 대수, 누적, 전월 대비(MoM), 전년 동월 대비(YoY) 증감률과 window 개월 이동 평균."""
+        import numpy as np
+
+        series = self.series(region)
+        years, months = self._periods()
+        columns = zip(
+            years.tolist(),
+            months.tolist(),
+            series.astype(np.int64).tolist(),
+            np.cumsum(series).astype(np.int64).tolist(),
+            _values(np, _growth(np, series, 1)),
+            _values(np, _growth(np, series, 12)),
+            _values(np, _rolling_mean(np, series, window)),
+        )
+        keys = ('year', 'month', 'count', 'cumulative', 'mom', 'yoy', 'rolling_mean')
+        return [dict(zip(keys, values)) for values in columns]
+
+    def pivot(self, regions: Optional[List[str]] = None, year_from: Optional[int] = None, year_to: Optional[int] = None):
+        """
+        지역 x 월 행렬을 잘라 (지역 목록, 연도 배열, 월 배열, 등록 대수 행렬)로 반환합니다. 없는 지역이면 KeyError.
+        """
+        import numpy as np
+
+        years, months = self._periods()
+        keep = np.ones(years.shape, dtype=bool)
+        if year_from is not None:
+            keep &= years >= year_from
+        if year_to is not None:
+            keep &= years <= year_to
+        names = list(regions) if regions else self.regions
+        positions = [self.region_index[name] for name in names]
+        return names, years[keep], months[keep], self.counts[np.ix_(positions, np.flatnonzero(keep))]
+
+    def share(self, year: Optional[int] = None, month: Optional[int] = None) -> List[dict]:
+        """
+        지역별 점유율. year와 month가 있으면 그 달, year만 있으면 그 해 합계, 둘 다 없으면 마지막 달 기준입니다.
+        """
+        import numpy as np
+
+        years, months = self._periods()
+        if year is None:
+            columns = np.arange(self.counts.shape[1])[-1:]
+        elif month is None:
+            columns = np.flatnonzero(years == year)
+        else:
+            columns = np.flatnonzero((years == year) & (months == month))
+        totals = self.counts[:, columns].sum(axis=1)
+        grand_total = int(totals.sum())
+        shares = totals / grand_total if grand_total else np.zeros(totals.shape)
+        order = np.argsort(-totals, kind='stable')
+        return [
+            {'region': self.regions[position], 'total': int(totals[position]), 'share': round(float(shares[position]), 4)}
+            for position in order.tolist()
+        ]
+
+ev_timeseries = EVTimeSeries()
+
+async def start_ev_timeseries_refresh(session_factory):
+    """다른 프로세스가 쓴 등록 데이터를 주기적으로 다시 읽어 반영합니다."""
+    while True:
+        try:
+            await asyncio.sleep(settings.EV_TIMESERIES_REFRESH_SECONDS)
+            async with session_factory() as session:
+                await ev_timeseries.load(session)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error(f"EV time series refresh failed: {e}")
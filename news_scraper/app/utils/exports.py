@@ -0,0 +1,115 @@
+# app/utils/exports.py
+"""
+데이터를 NDJSON / CSV / Parquet 으로 내보내는 스트리밍 인코더입니다.
+
+행은 서버 측 커서(AsyncSession.stream + yield_per)로 EXPORT_BATCH_SIZE 개씩 읽고 곧바로 인코딩해 보내므로,
+테이블 크기와 관계없이 메모리에는 한 배치만 올라갑니다. Parquet은 배치마다 row group 하나를 씁니다.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, Callable, List, Sequence, Tuple
+from fastapi.responses import StreamingResponse
+from sqlalchemy.sql import Select
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+    'parquet': 'application/vnd.apache.parquet',
+}
+EXPORT_FORMAT_PATTERN = f"^({'|'.join(EXPORT_FORMATS)})$"
+
+# (열 이름, 타입) 목록. 타입은 Parquet 스키마에 쓰이며 'int', 'str', 'datetime' 중 하나입니다.
+Columns = Sequence[Tuple[str, str]]
+
+async def iter_query_batches(session_factory: Callable, statement: Select, batch_size: int) -> AsyncIterator[list]:
+    """
+    statement를 서버 측 커서로 실행하고 batch_size 행씩 돌려줍니다.
+    응답 스트림이 끝날 때까지 세션이 살아 있어야 하므로 요청 의존성이 아닌 제너레이터 안에서 세션을 엽니다.
+    """
+    async with session_factory() as session:
+        result = await session.stream(statement.execution_options(yield_per=batch_size))
+        async for batch in result.partitions():
+            yield batch
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+async def _ndjson(batches: AsyncIterator[list], columns: Columns) -> AsyncIterator[bytes]:
+    names = [name for name, _ in columns]
+    async for batch in batches:
+        yield ''.join(
+            json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_json_value) + '\n' for row in batch
+        ).encode('utf-8')
+
+async def _csv(batches: AsyncIterator[list], columns: Columns) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM이 있어야 엑셀에서 한글이 깨지지 않습니다.
+    buffer.write('﻿')
+    writer.writerow([name for name, _ in columns])
+    async for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+class _ChunkSink:
+    """ParquetWriter가 쓴 바이트를 모아 두었다가 배치마다 꺼내 보내는 파일 객체입니다."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+async def _parquet(batches: AsyncIterator[list], columns: Columns) -> AsyncIterator[bytes]:
+    import pyarrow as pa  # 무거운 의존성은 Parquet 내보내기를 요청받았을 때만 로드합니다.
+    import pyarrow.parquet as pq
+
+    types = {'int': pa.int64(), 'str': pa.string(), 'datetime': pa.timestamp('us')}
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression='zstd')
+    try:
+        async for batch in batches:
+            arrays = [pa.array([row[index] for row in batch], field.type) for index, field in enumerate(schema)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()  # footer
+
+ENCODERS = {'ndjson': _ndjson, 'csv': _csv, 'parquet': _parquet}
+
+def export_response(batches: AsyncIterator[list], columns: Columns, fmt: str, filename: str) -> StreamingResponse:
+    """배치 스트림을 fmt 형식으로 인코딩해 내려보내는 다운로드 응답을 만듭니다."""
+    return StreamingResponse(
+        ENCODERS[fmt](batches, columns),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={'Content-Disposition': f'attachment; filename="{filename}.{fmt}"'},
+    )
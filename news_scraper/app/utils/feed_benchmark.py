@@ -0,0 +1,87 @@
+# app/utils/feed_benchmark.py
+"""
+커뮤니티 피드 조회 벤치마크입니다. `python -m app.utils.feed_benchmark` 로 실행합니다.
+
+좋아요와 댓글이 수백 개씩 달린 글로 임시 DB를 채운 뒤,
+예전 방식(likes, comments를 함께 OUTER JOIN 후 GROUP BY)과 저장된 like_count/comment_count를 읽는 현재 방식을 비교합니다.
+예전 방식은 글마다 likes x comments 행을 만들어 느릴 뿐 아니라 두 수치가 부풀려집니다.
+"""
+import argparse
+import asyncio
+import random
+import time
+from sqlalchemy import select, func, insert
+from app.models.community import CommunityPost, CommunityPostLike, Comment
+from app.models.users import User
+from app.crud.community import get_community_posts_with_count
+from app.utils.temp_database import temporary_database
+
+def legacy_feed_query(limit: int):
+    return (
+        select(
+            CommunityPost,
+            func.count(CommunityPostLike.id).label('like_count'),
+            func.count(Comment.id).label('comment_count'),
+        )
+        .outerjoin(CommunityPostLike, CommunityPostLike.post_id == CommunityPost.id)
+        .outerjoin(Comment, Comment.post_id == CommunityPost.id)
+        .group_by(CommunityPost.id)
+        .order_by(CommunityPost.created_at.desc())
+        .limit(limit)
+    )
+
+async def _timed(coroutine_factory, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await coroutine_factory()
+    return (time.perf_counter() - started) / repeat * 1000
+
+async def run(posts: int, max_likes: int, max_comments: int, limit: int, repeat: int) -> int:
+    async with temporary_database('feed.db', profile="production") as (_, Session):
+        random.seed(3)
+        async with Session() as db:
+            db.add(User(username="bench", email="bench@feed.test", hashed_password="-"))
+            await db.flush()
+            post_rows, like_rows, comment_rows = [], [], []
+            for post_id in range(1, posts + 1):
+                likes, comments = random.randint(max_likes // 2, max_likes), random.randint(max_comments // 2, max_comments)
+                post_rows.append({'id': post_id, 'title': f"post {post_id}", 'content': "-", 'user_id': 1, 'like_count': likes, 'comment_count': comments})
+                like_rows.extend({'post_id': post_id} for _ in range(likes))
+                comment_rows.extend({'post_id': post_id, 'content': "comment"} for _ in range(comments))
+            await db.execute(insert(CommunityPost), post_rows)
+            await db.execute(insert(CommunityPostLike), like_rows)
+            await db.execute(insert(Comment), comment_rows)
+            await db.commit()
+
+        async with Session() as db:
+            async def legacy():
+                return (await db.execute(legacy_feed_query(limit))).all()
+
+            async def current():
+                return await get_community_posts_with_count(db, limit=limit)
+
+            legacy_rows = await legacy()
+            current_posts, _ = await current()
+            legacy_ms = await _timed(legacy, repeat)
+            current_ms = await _timed(current, repeat)
+
+    expected = {row['id']: (row['like_count'], row['comment_count']) for row in post_rows}
+    inflated = sum(1 for post, likes, comments in legacy_rows if (likes, comments) != expected[post.id])
+    wrong = sum(1 for post in current_posts if (post.like_count, post.comment_count) != expected[post.id])
+    print(f"{posts} posts, {len(like_rows)} likes, {len(comment_rows)} comments, page size {limit}")
+    print(f"  legacy JOIN + GROUP BY: {legacy_ms:8.2f} ms/page, {inflated}/{len(legacy_rows)} posts with wrong counts")
+    print(f"  persisted counts:       {current_ms:8.2f} ms/page, {wrong}/{len(current_posts)} posts with wrong counts")
+    return 1 if wrong else 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare community feed queries on posts with many likes and comments.")
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--max-likes", type=int, default=300)
+    parser.add_argument("--max-comments", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    return asyncio.run(run(args.posts, args.max_likes, args.max_comments, args.limit, args.repeat))
+
+if __name__ == "__main__":
+    raise SystemExit(main())
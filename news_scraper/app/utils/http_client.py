@@ -0,0 +1,30 @@
+# app/utils/http_client.py
+import asyncio
+from typing import Optional
+
+_session = None
+_session_lock: Optional[asyncio.Lock] = None
+
+DEFAULT_TIMEOUT_SECONDS = 30
+
+async def get_http_session():
+    """
+    앱 전체에서 공유하는 aiohttp ClientSession을 반환합니다.
+    커넥션 풀을 재사용하기 위해 처음 호출될 때 한 번만 생성하며, 종료 시 close_http_session()으로 닫습니다.
+    """
+    global _session, _session_lock
+    if _session is not None and not _session.closed:
+        return _session
+    if _session_lock is None:
+        _session_lock = asyncio.Lock()
+    async with _session_lock:
+        if _session is None or _session.closed:
+            import aiohttp  # aiohttp는 첫 요청 시점에 로드합니다.
+            _session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_SECONDS))
+    return _session
+
+async def close_http_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,59 @@
+# app/utils/import_budget.py
+"""
+앱 import 시간 예산을 검사합니다. CI에서 `python -m app.utils.import_budget` 로 실행하며,
+예산을 넘거나 무거운 모듈이 import 시점에 로드되면 0이 아닌 코드로 종료합니다.
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 1000
+
+# 호출 시점에 로드되어야 하는 무거운 의존성
+DEFERRED_MODULES = ("pandas", "pyarrow", "playwright", "feedparser", "passlib", "jose", "bs4")
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+def measure(target: str = "app.main") -> dict:
+    """`-X importtime` 으로 target을 새 인터프리터에서 import 하고 모듈별 누적 시간(us)을 반환합니다."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Failed to import {target}:\n{completed.stderr}")
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative
+
+def check(target: str = "app.main", budget_ms: int = DEFAULT_BUDGET_MS) -> list:
+    cumulative = measure(target)
+    problems = []
+    total_ms = cumulative.get(target, 0) / 1000
+    if total_ms > budget_ms:
+        problems.append(f"import {target} took {total_ms:.0f} ms (budget {budget_ms} ms)")
+    for module in DEFERRED_MODULES:
+        if module in cumulative:
+            problems.append(f"{module} is imported eagerly ({cumulative[module] / 1000:.0f} ms)")
+    return problems
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail if importing the app exceeds the import-time budget.")
+    parser.add_argument("--target", default="app.main")
+    parser.add_argument("--budget-ms", type=int, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    problems = check(args.target, args.budget_ms)
+    for problem in problems:
+        print(problem)
+    if not problems:
+        print(f"import {args.target} is within the {args.budget_ms} ms budget")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
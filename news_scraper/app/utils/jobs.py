@@ -0,0 +1,80 @@
+# app/utils/jobs.py
+import asyncio
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+from app.config import get_logger
+
+logger = get_logger()
+
+class Job:
+    """백그라운드 작업의 진행 상태를 담는 객체입니다."""
+
+    def __init__(self, kind: str, total: int = 0):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "pending"  # pending -> running -> completed / failed
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self.result: Optional[dict] = None
+        self.created_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+
+    def mark_done(self):
+        self.completed += 1
+
+    def mark_failed(self, error: str):
+        self.failed += 1
+        self.errors.append(error)
+
+class JobRegistry:
+    """
+    프로세스 내 메모리에 작업을 보관하고 asyncio 태스크로 실행합니다.
+    오래된 완료 작업은 max_jobs 개를 넘으면 먼저 제거됩니다.
+    """
+
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def create(self, kind: str, total: int = 0) -> Job:
+        job = Job(kind, total)
+        self._jobs[job.id] = job
+        self._evict()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def start(self, job: Job, runner: Callable[[Job], Awaitable[None]]) -> asyncio.Task:
+        async def run():
+            job.status = "running"
+            try:
+                await runner(job)
+                job.status = "completed"
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+                job.errors.append(str(e))
+                job.status = "failed"
+            finally:
+                job.finished_at = datetime.now()
+                self._tasks.pop(job.id, None)
+
+        task = asyncio.create_task(run())
+        self._tasks[job.id] = task  # 태스크가 GC되지 않도록 참조를 유지
+        return task
+
+    def _evict(self):
+        while len(self._jobs) > self.max_jobs:
+            for job_id, job in self._jobs.items():
+                if job.status in ("completed", "failed"):
+                    del self._jobs[job_id]
+                    break
+            else:
+                return
+
+jobs = JobRegistry()
@@ -0,0 +1,19 @@
+# app/utils/link_utils.py
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 기사를 가리키지만 추적 목적 등으로 달라지는 쿼리 파라미터
+IGNORED_QUERY_PARAMS = {"oc", "fbclid", "gclid"}
+
+def normalize_link(link: str) -> str:
+    """
+    기사 링크를 비교 가능한 형태로 정규화합니다.
+    스킴/호스트 소문자화, fragment 및 추적용 파라미터(utm_* 등) 제거, 쿼리 정렬, 끝의 '/' 제거를 수행합니다.
+    """
+    parts = urlsplit(link.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in IGNORED_QUERY_PARAMS and not key.startswith("utm_")
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
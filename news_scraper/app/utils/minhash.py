@@ -0,0 +1,105 @@
+# app/utils/minhash.py
+"""
+뉴스 제목의 유사 중복 탐지를 위한 MinHash / LSH 유틸리티입니다.
+
+한국어 제목은 띄어쓰기가 일정하지 않아 단어 단위보다 문자 n-gram이 잘 맞습니다.
+서명은 NUM_PERM 개의 32비트 최솟값이며, LSH_BANDS 개의 밴드로 나눠 버킷 키를 만듭니다.
+같은 버킷을 하나라도 공유하는 기사만 후보로 비교하므로 전체 이력 대비 조회 비용이 거의 일정합니다.
+"""
+import re
+import struct
+import zlib
+from typing import Iterable, List, Optional, Set
+
+NGRAM_SIZE = 3
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+# 추정 Jaccard 유사도가 이 값 이상이면 같은 기사로 봅니다.
+DUPLICATE_THRESHOLD = 0.6
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+def _permutations(count: int):
+    # 결정적인 난수로 해시 계수를 만들어, 저장된 서명과 새 서명이 항상 같은 함수를 쓰도록 합니다.
+    state = 0x9E3779B97F4A7C15
+    params = []
+    for _ in range(count):
+        state = (state * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+        a = (state >> 3) % (_MERSENNE_PRIME - 1) + 1
+        state = (state * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+        b = (state >> 3) % _MERSENNE_PRIME
+        params.append((a, b))
+    return params
+
+_PERMUTATIONS = _permutations(NUM_PERM)
+
+# " - 연합뉴스" 처럼 Google News 제목 끝에 붙는 언론사 이름
+_SOURCE_SUFFIX = re.compile(r"\s+-\s+[^-]+$")
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+def normalize_title(title: str) -> str:
+    title = _SOURCE_SUFFIX.sub("", title.strip())
+    return _NON_WORD.sub("", title).lower()
+
+def shingles(title: str, size: int = NGRAM_SIZE) -> Set[bytes]:
+    text = normalize_title(title)
+    if len(text) <= size:
+        return {text.encode("utf-8")} if text else set()
+    return {text[i:i + size].encode("utf-8") for i in range(len(text) - size + 1)}
+
+def signature(title: str) -> List[int]:
+    hashes = [zlib.crc32(shingle) for shingle in shingles(title)]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in _PERMUTATIONS]
+
+def pack_signature(values: List[int]) -> bytes:
+    return struct.pack(f"<{NUM_PERM}I", *values)
+
+def unpack_signature(data: bytes) -> List[int]:
+    return list(struct.unpack(f"<{NUM_PERM}I", data))
+
+def similarity(first: List[int], second: List[int]) -> float:
+    """두 서명으로 추정한 Jaccard 유사도."""
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERM
+
+def band_buckets(values: List[int]) -> List[int]:
+    """
+    밴드별 버킷 키를 반환합니다. 키의 상위 비트에 밴드 번호를 넣어 서로 다른 밴드끼리 충돌하지 않게 하며,
+    SQLite INTEGER(부호 있는 64비트)에 들어가도록 63비트 이내로 만듭니다.
+    """
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = values[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = zlib.crc32(struct.pack(f"<{LSH_ROWS}I", *rows))
+        buckets.append((band << 32) | digest)
+    return buckets
+
+class MinHashLSH:
+    """한 번의 수집 배치 안에서 쓰는 메모리 LSH 인덱스입니다."""
+
+    def __init__(self):
+        self._buckets = {}
+        self._signatures = {}
+
+    def insert(self, key, values: List[int]):
+        self._signatures[key] = values
+        for bucket in band_buckets(values):
+            self._buckets.setdefault(bucket, []).append(key)
+
+    def query(self, values: List[int], threshold: float = DUPLICATE_THRESHOLD) -> Optional[object]:
+        """threshold 이상으로 유사한, 가장 먼저 넣은 키를 반환합니다."""
+        candidates = []
+        for bucket in band_buckets(values):
+            candidates.extend(self._buckets.get(bucket, ()))
+        for key in dict.fromkeys(candidates):
+            if similarity(values, self._signatures[key]) >= threshold:
+                return key
+        return None
+
+def find_duplicate(values: List[int], candidates: Iterable, threshold: float = DUPLICATE_THRESHOLD) -> Optional[object]:
+    """(key, 서명) 후보 중 threshold 이상으로 유사한 키 중 가장 작은 값을 반환합니다."""
+    matches = [key for key, other in candidates if similarity(values, other) >= threshold]
+    return min(matches) if matches else None
@@ -0,0 +1,181 @@
+# app/utils/query_plan_audit.py
+"""
+CRUD 쿼리의 실행 계획을 검사합니다. CI에서 `python -m app.utils.query_plan_audit` 로 실행합니다.
+
+임시 DB를 모델 스키마로 만들고 데이터를 채운 뒤 ANALYZE 하고, CRUD 함수를 실제로 호출하면서 실행된 SQL을 모아
+각각 EXPLAIN QUERY PLAN 으로 확인합니다. 인덱스 없이 테이블 전체를 읽는 단계(`SCAN <table>`)나
+ORDER BY 를 위한 임시 B-tree 정렬이 나오면 0이 아닌 코드로 종료합니다.
+"""
+import argparse
+import asyncio
+import re
+from fastapi import HTTPException
+from datetime import datetime, timedelta
+from sqlalchemy import event, insert, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import Base
+from app.models.community import CommunityPost, CommunityPostLike, Comment
+from app.models.ev_registration import EVRegistration
+from app.models.news import News, NewsLSHBucket, Region, Vote
+from app.models.users import User
+from app.models.vehicle import VehicleSpec
+from app.crud import community, counters, ev_registration, news, search, users, vehicle
+from app.schemas.ev_registration import EVRegistrationCreate
+from app.schemas.news import NewsCreate
+from app.schemas.vehicle import VehicleSpecCreate
+from app.utils.minhash import band_buckets, pack_signature, signature
+from app.utils.temp_database import temporary_database
+
+REGIONS = ("서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주")
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")  # "SCAN t USING INDEX ..." 나 가상 테이블 스캔은 제외
+TEMP_SORT = "USE TEMP B-TREE FOR ORDER BY"
+ALLOW_SORT = "ORDER BY"
+
+def audited_calls():
+    """
+    (이름, CRUD 호출, 허용 목록) 목록. 전체 스캔이 의도된 쿼리는 테이블 이름을, 정렬이 불가피한 쿼리는 ALLOW_SORT를 허용 목록에 둡니다.
+    """
+    after = (datetime(2030, 1, 1), 10 ** 9)
+    # 1번 기사는 이미 저장된 링크, 두 번째는 새 기사입니다.
+    feed_items = [
+        NewsCreate(title="전기차 보조금 기사 1", source="audit", link="https://news.test/1?utm_source=feed"),
+        NewsCreate(title="충전소 확충 계획 발표", source="audit", link="https://news.test/new"),
+    ]
+    return [
+        ("news.get_news", lambda db: news.get_news(db, limit=20), ()),
+        ("news.get_news(after)", lambda db: news.get_news(db, limit=20, after=after), ()),
+        ("news.get_news_by_id", lambda db: news.get_news_by_id(db, 1), ()),
+        ("news.get_news_count", lambda db: news.get_news_count(db), ()),
+        ("news.get_news_count(estimate)", lambda db: news.get_news_count(db, estimate=True), ()),
+        ("news.get_news_without_content", lambda db: news.get_news_without_content(db, limit=20, max_attempts=3), ()),
+        ("news.get_feed_watermarks", lambda db: news.get_feed_watermarks(db, ["https://feed.test/rss"]), ()),
+        # 내보내기는 모든 행을 id 순서(rowid)로 읽으므로 전체 스캔이 맞습니다.
+        ("news.news_export_query", lambda db: db.execute(news.news_export_query()), ("news",)),
+        ("news.bulk_create_news", lambda db: news.bulk_create_news(db, feed_items), ()),
+        ("news.update_news", lambda db: news.update_news(db, 6, NewsCreate(title="급속충전기 설치 확대", source="audit", link="https://news.test/6")), ()),
+        ("news.delete_news", lambda db: news.delete_news(db, 5), ()),
+        ("news.vote_news", lambda db: news.vote_news(db, 2, 1, user_id=1), ()),
+        # BM25 점수는 검색어마다 계산되므로 정렬은 피할 수 없습니다(LIMIT 만큼만 유지).
+        ("search.search_news", lambda db: search.search_news(db, "전기차 보조금"), (ALLOW_SORT,)),
+        ("search.search_community_posts", lambda db: search.search_community_posts(db, "충전소", sort="recent"), ()),
+        ("community.get_community_posts_with_count", lambda db: community.get_community_posts_with_count(db, limit=20), ()),
+        ("community.get_community_posts_with_count(after)", lambda db: community.get_community_posts_with_count(db, limit=20, after=after), ()),
+        # 첫 댓글 페이지(최대 FIRST_COMMENTS_PAGE_SIZE 행)만 정렬합니다.
+        ("community.get_community_post_detail", lambda db: community.get_community_post_detail(db, 3), (ALLOW_SORT,)),
+        ("community.get_comments_by_post_id", lambda db: community.get_comments_by_post_id(db, 3, after=after), ()),
+        ("community.get_comment_counts", lambda db: community.get_comment_counts(db, [1, 2, 3]), ()),
+        ("community.get_like_count", lambda db: community.get_like_count(db, 3), ()),
+        ("community.like_community_post", lambda db: community.like_community_post(db, 4), ()),
+        ("users.get_user_by_email", lambda db: users.get_user_by_email(db, "user1@audit.test"), ()),
+        ("users.get_users", lambda db: users.get_users(db, after_id=1), ()),
+        ("users.get_user_posts", lambda db: users.get_user_posts(db, user_id=1, after=after), ()),
+        ("ev_registration.get_ev_registrations", lambda db: ev_registration.get_ev_registrations(db), ("ev_registrations",)),
+        ("ev_registration.ev_registrations_export_query", lambda db: db.execute(ev_registration.ev_registrations_export_query()), ()),
+        ("ev_registration.get_ev_registrations_by_date(region)", lambda db: ev_registration.get_ev_registrations_by_date(db, region="서울"), ()),
+        ("ev_registration.get_ev_registrations_by_date(region, year, month)", lambda db: ev_registration.get_ev_registrations_by_date(db, year=2023, month=6, region="서울"), ()),
+        ("ev_registration.get_ev_registrations_by_date(year)", lambda db: ev_registration.get_ev_registrations_by_date(db, year=2023), ()),
+        ("ev_registration.get_ev_registrations_by_date(month)", lambda db: ev_registration.get_ev_registrations_by_date(db, month=6), ()),
+        ("ev_registration.get_ev_registrations_by_date(year, month)", lambda db: ev_registration.get_ev_registrations_by_date(db, year=2023, month=6), ()),
+        # 롤업 테이블은 (지역 수 x 연도 수) 행뿐이라 전체를 읽어 집계합니다.
+        ("ev_registration.get_totals_by_region", lambda db: ev_registration.get_totals_by_region(db), ("ev_registration_yearly_rollups", ALLOW_SORT)),
+        ("ev_registration.get_totals_by_region(year)", lambda db: ev_registration.get_totals_by_region(db, year=2023), (ALLOW_SORT,)),
+        ("ev_registration.get_year_over_year", lambda db: ev_registration.get_year_over_year(db), ("ev_registration_yearly_rollups", ALLOW_SORT)),
+        ("ev_registration.get_year_over_year(region)", lambda db: ev_registration.get_year_over_year(db, region="서울"), ()),
+        ("ev_registration.get_totals_by_month(year)", lambda db: ev_registration.get_totals_by_month(db, year=2023), ()),
+        ("ev_registration.create_ev_registration", lambda db: ev_registration.create_ev_registration(db, EVRegistrationCreate(region="서울", year=2025, month=1, count=1)), ()),
+        ("vehicle.get_vehicle_specs", lambda db: vehicle.get_vehicle_specs(db), ("vehicle_specs",)),
+        ("vehicle.get_vehicle_specs_by_manufacturer", lambda db: vehicle.get_vehicle_specs_by_manufacturer(db, "maker1"), ()),
+        ("vehicle.get_vehicle_spec_by_model", lambda db: vehicle.get_vehicle_spec_by_model(db, "model1-1"), ()),
+        ("vehicle.upsert_vehicle_spec", lambda db: vehicle.upsert_vehicle_spec(db, VehicleSpecCreate(manufacturer="maker1", model="model1-1")), ()),
+        ("counters.ensure_counters", lambda db: counters.ensure_counters(db), ()),
+    ]
+
+async def seed(db: AsyncSession, rows: int):
+    now = datetime.now()
+    await db.execute(insert(User), [
+        {'id': i, 'username': f"user{i}", 'email': f"user{i}@audit.test", 'hashed_password': "-"} for i in range(1, 51)
+    ])
+    await db.execute(insert(News), [
+        {'id': i, 'title': f"전기차 보조금 기사 {i}", 'source': "audit", 'link': f"https://news.test/{i}",
+         'normalized_link': f"https://news.test/{i}", 'published_at': now - timedelta(minutes=i)}
+        for i in range(1, rows + 1)
+    ])
+    # 기사마다 16개 버킷. 5번 기사는 삭제 테스트용으로 실제 서명과 버킷을 둡니다.
+    await db.execute(insert(NewsLSHBucket), [
+        {'bucket': (band << 32) | i, 'news_id': i} for i in range(1, rows + 1) if i != 5 for band in range(16)
+    ])
+    values = signature("전기차 보조금 기사 5")
+    await db.execute(update(News).where(News.id == 5).values(minhash=pack_signature(values)))
+    await db.execute(insert(NewsLSHBucket), [{'bucket': bucket, 'news_id': 5} for bucket in band_buckets(values)])
+    await db.execute(insert(Vote), [{'news_id': i, 'user_id': i % 50 + 1, 'vote_value': 1} for i in range(1, rows + 1)])
+    await db.execute(insert(CommunityPost), [
+        {'id': i, 'title': f"충전소 후기 {i}", 'content': "-", 'user_id': i % 50 + 1, 'created_at': now - timedelta(minutes=i)}
+        for i in range(1, rows + 1)
+    ])
+    await db.execute(insert(CommunityPostLike), [{'post_id': post_id} for post_id in range(5, rows + 1)])  # 4번 글은 좋아요 테스트용
+    await db.execute(insert(Comment), [{'post_id': i % rows + 1, 'content': "comment", 'created_at': now} for i in range(rows * 3)])
+    await db.execute(insert(Region), [{'id': i, 'name': region} for i, region in enumerate(REGIONS, start=1)])
+    await db.execute(insert(EVRegistration), [
+        {'region_id': region_id, 'period': year * 100 + month, 'count': 100}
+        for region_id in range(1, len(REGIONS) + 1) for year in range(2015, 2025) for month in range(1, 13)
+    ])
+    await db.execute(insert(VehicleSpec), [
+        {'manufacturer': f"maker{i % 20}", 'model': f"model{i % 20}-{i}"} for i in range(rows // 10)
+    ])
+    await db.flush()
+    await ev_registration.refresh_rollups(db, range(2015, 2025))
+    await db.commit()
+    await counters.ensure_counters(db)
+
+async def run(rows: int, verbose: bool) -> int:
+    problems = []
+    async with temporary_database('audit.db') as (engine, Session):
+        async with Session() as db:
+            await seed(db, rows)
+        async with engine.begin() as conn:
+            await conn.execute(text("ANALYZE"))
+
+        executed = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+                executed.append((statement, parameters))
+
+        for name, call, allowed in audited_calls():
+            executed.clear()
+            async with Session() as db:
+                try:
+                    await call(db)
+                except HTTPException:
+                    pass  # 404/409 응답도 실행된 쿼리는 그대로 검사합니다.
+            statements = list(executed)
+            async with engine.connect() as conn:
+                for statement, parameters in statements:
+                    plan = [row[3] for row in (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()]
+                    for step in plan:
+                        scan = FULL_SCAN.match(step.strip())
+                        # 서브쿼리 결과나 sqlite_master 같은 내부 테이블 스캔은 제외합니다.
+                        if scan and scan.group(1) in Base.metadata.tables and scan.group(1) not in allowed:
+                            problems.append(f"{name}: full table scan of {scan.group(1)}\n    {' '.join(statement.split())}")
+                        elif TEMP_SORT in step and ALLOW_SORT not in allowed:
+                            problems.append(f"{name}: sorts with a temp B-tree\n    {' '.join(statement.split())}")
+                    if verbose:
+                        print(f"{name}\n  " + "\n  ".join(plan))
+
+    for problem in problems:
+        print(problem)
+    if not problems:
+        print(f"{len(audited_calls())} CRUD calls use indexes for every filter and sort")
+    return 1 if problems else 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail if a CRUD query regresses to a full table scan.")
+    parser.add_argument("--rows", type=int, default=2000, help="rows seeded into the news and community tables")
+    parser.add_argument("--verbose", action="store_true", help="print every query plan")
+    args = parser.parse_args()
+    return asyncio.run(run(args.rows, args.verbose))
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,13 +2,14 @@
 import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import urlencode
+from .http_client import get_http_session
 
 async def fetch_html(url: str) -> str:
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, verify_ssl=False) as response:
-                response.raise_for_status()
-                return await response.text()
+        session = await get_http_session()
+        async with session.get(url, ssl=False) as response:
+            response.raise_for_status()
+            return await response.text()
     except aiohttp.ClientError as e:
         # Log the specific client error and return a meaningful error message or None
         print(f"Client error: {e}")
@@ -0,0 +1,137 @@
+# app/utils/snapshot_archive.py
+"""
+스크래핑한 원본 HTML을 zstd로 압축해 내용 주소(content-addressed) 방식으로 보관합니다.
+
+- blobs/<sha256[:2]>/<sha256>.zst : 압축된 원본 페이지. 같은 내용의 페이지는 한 번만 저장됩니다.
+- index/<region>.json            : 지역별 스냅샷 목록 (timestamp, sha256, url, size), 오래된 순.
+
+보존 기간(SNAPSHOT_RETENTION_DAYS)과 지역별 최대 개수(SNAPSHOT_MAX_PER_REGION)를 넘는 항목은
+아카이브할 때 정리되며, 더 이상 참조되지 않는 blob도 함께 삭제됩니다.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional
+import zstandard
+from app.config import get_logger
+from app.core.config import settings
+
+logger = get_logger()
+
+_lock = threading.Lock()
+
+def _archive_dir() -> str:
+    return settings.SNAPSHOT_ARCHIVE_DIR
+
+def _blob_path(sha256: str) -> str:
+    return os.path.join(_archive_dir(), "blobs", sha256[:2], f"{sha256}.zst")
+
+def _index_path(region: str) -> str:
+    return os.path.join(_archive_dir(), "index", f"{region}.json")
+
+def _read_index(region: str) -> List[dict]:
+    try:
+        with open(_index_path(region), "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return []
+
+def _write_index(region: str, entries: List[dict]):
+    path = _index_path(region)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(entries, file, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def _referenced_blobs() -> set:
+    index_dir = os.path.join(_archive_dir(), "index")
+    if not os.path.isdir(index_dir):
+        return set()
+    referenced = set()
+    for name in os.listdir(index_dir):
+        if name.endswith(".json"):
+            referenced.update(entry["sha256"] for entry in _read_index(name[:-len(".json")]))
+    return referenced
+
+def _apply_retention(entries: List[dict]) -> tuple:
+    cutoff = (datetime.now() - timedelta(days=settings.SNAPSHOT_RETENTION_DAYS)).isoformat()
+    kept = [entry for entry in entries if entry["timestamp"] >= cutoff]
+    kept = kept[-settings.SNAPSHOT_MAX_PER_REGION:]
+    kept_ids = {id(entry) for entry in kept}
+    dropped = [entry for entry in entries if id(entry) not in kept_ids]
+    return kept, dropped
+
+def _archive_sync(region: str, url: str, html: str) -> dict:
+    raw = html.encode("utf-8")
+    sha256 = hashlib.sha256(raw).hexdigest()
+    entry = {
+        "timestamp": datetime.now().isoformat(),
+        "sha256": sha256,
+        "url": url,
+        "size": len(raw),
+    }
+    with _lock:
+        blob_path = _blob_path(sha256)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            tmp_path = f"{blob_path}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(zstandard.ZstdCompressor(level=settings.SNAPSHOT_ZSTD_LEVEL).compress(raw))
+            os.replace(tmp_path, blob_path)
+
+        entries, dropped = _apply_retention(_read_index(region) + [entry])
+        _write_index(region, entries)
+
+        if dropped:
+            referenced = _referenced_blobs()
+            for stale in {item["sha256"] for item in dropped} - referenced:
+                try:
+                    os.remove(_blob_path(stale))
+                except FileNotFoundError:
+                    pass
+    return entry
+
+async def archive_page(region: str, url: str, html: str) -> Optional[dict]:
+    """원본 페이지를 아카이브합니다. 실패해도 스크래핑에는 영향을 주지 않도록 None을 반환합니다."""
+    if not settings.SNAPSHOT_ARCHIVE_ENABLED or not region or not html:
+        return None
+    try:
+        return await asyncio.to_thread(_archive_sync, region, url, html)
+    except Exception as e:
+        logger.error(f"Failed to archive snapshot for {region}: {e}")
+        return None
+
+def list_snapshots(region: str) -> List[dict]:
+    """지역의 스냅샷 목록을 최신 순으로 반환합니다."""
+    return list(reversed(_read_index(region)))
+
+def load_snapshot(sha256: str) -> str:
+    with open(_blob_path(sha256), "rb") as file:
+        return zstandard.ZstdDecompressor().decompress(file.read()).decode("utf-8")
+
+async def replay(scraper, region: str, since: Optional[datetime] = None, until: Optional[datetime] = None, limit: Optional[int] = None) -> List[dict]:
+    """
+    아카이브된 페이지에 현재 scraper.scrape_specific 파서를 다시 적용합니다. 네트워크를 사용하지 않습니다.
+    결과는 최신 스냅샷부터 반환됩니다.
+    """
+    snapshots = list_snapshots(region)
+    if since is not None:
+        snapshots = [entry for entry in snapshots if entry["timestamp"] >= since.isoformat()]
+    if until is not None:
+        snapshots = [entry for entry in snapshots if entry["timestamp"] <= until.isoformat()]
+    if limit is not None:
+        snapshots = snapshots[:limit]
+
+    results = []
+    for entry in snapshots:
+        try:
+            html = await asyncio.to_thread(load_snapshot, entry["sha256"])
+        except FileNotFoundError:
+            logger.error(f"Snapshot blob missing: {entry['sha256']}")
+            continue
+        results.append({**entry, "announcements": await scraper.scrape_specific(html)})
+    return results
@@ -0,0 +1,30 @@
+# app/utils/temp_database.py
+"""
+벤치마크와 점검 CLI(`app.utils.*`)가 함께 쓰는 임시 SQLite DB입니다.
+임시 디렉터리에 DB 파일을 만들고, 끝나면 엔진을 닫고 디렉터리째 지웁니다.
+"""
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, install_sqlite_pragmas, sqlite_pragmas
+
+@asynccontextmanager
+async def temporary_database(filename: str, profile: Optional[str] = None, create_schema: bool = True, **engine_options) -> AsyncIterator[Tuple[AsyncEngine, sessionmaker]]:
+    """
+    (엔진, 세션 팩토리)를 반환합니다. profile을 주면 해당 DB 프로필의 PRAGMA를 적용하고,
+    create_schema가 참이면 모델 스키마(Base.metadata)를 만듭니다.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, filename)}", **engine_options)
+        if profile is not None:
+            install_sqlite_pragmas(engine, sqlite_pragmas(profile=profile))
+        try:
+            if create_schema:
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
+            yield engine, sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        finally:
+            await engine.dispose()
@@ -0,0 +1,83 @@
+# app/utils/vote_load_test.py
+"""
+투표 경로 부하 테스트입니다. `python -m app.utils.vote_load_test` 로 실행하며,
+임시 DB에서 수천 개의 동시 투표를 보낸 뒤 news.vote_count가 기대값과 같은지 확인합니다.
+불일치가 있으면 0이 아닌 코드로 종료합니다.
+"""
+import argparse
+import asyncio
+import random
+import time
+from sqlalchemy import select, func
+from app.models.news import News, Vote
+from app.models.users import User
+from app.crud.news import vote_news
+from app.utils.temp_database import temporary_database
+
+async def run(anonymous_votes: int, users: int, concurrency: int, news_count: int) -> int:
+    async with temporary_database('votes.db', profile="production") as (_, Session):
+        async with Session() as db:
+            db.add_all(News(title=f"news {i}", source="load-test", link=f"http://load.test/{i}") for i in range(news_count))
+            db.add_all(User(username=f"user{i}", email=f"user{i}@load.test", hashed_password="-") for i in range(users))
+            await db.commit()
+
+        random.seed(7)
+        expected = {news_id: 0 for news_id in range(1, news_count + 1)}
+        requests = []
+        for _ in range(anonymous_votes):
+            news_id, value = random.randint(1, news_count), random.choice((1, -1))
+            expected[news_id] += value
+            requests.append((news_id, value, None))
+        # 로그인 사용자는 같은 기사에 여러 번 투표해도 마지막 한 표만 남습니다 (동시에 보내지 않도록 사용자별로 순서대로 실행).
+        user_votes = {}
+        for user_id in range(1, users + 1):
+            votes = [(random.randint(1, news_count), random.choice((1, -1, 0))) for _ in range(5)]
+            user_votes[user_id] = votes
+            final = {}
+            for news_id, value in votes:
+                final[news_id] = value
+            for news_id, value in final.items():
+                expected[news_id] += value
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(news_id, value, user_id):
+            async with semaphore:
+                async with Session() as db:
+                    await vote_news(db, news_id, value, user_id=user_id)
+
+        async def send_user(user_id):
+            for news_id, value in user_votes[user_id]:
+                await send(news_id, value, user_id)
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(send(*request) for request in requests),
+            *(send_user(user_id) for user_id in user_votes),
+        )
+        elapsed = time.perf_counter() - started
+
+        async with Session() as db:
+            counts = dict((await db.execute(select(News.id, News.vote_count))).all())
+            user_sums = dict((await db.execute(select(Vote.news_id, func.sum(Vote.vote_value)).group_by(Vote.news_id))).all())
+
+    total = anonymous_votes + sum(len(votes) for votes in user_votes.values())
+    mismatches = {news_id: (counts[news_id], value) for news_id, value in expected.items() if counts[news_id] != value}
+    print(f"{total} votes in {elapsed:.2f} s ({total / elapsed:.0f} votes/s), {len(user_sums)} news items with user votes")
+    if mismatches:
+        print(f"vote_count mismatch (actual, expected): {mismatches}")
+        return 1
+    print("all vote counts match")
+    return 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Send concurrent votes and verify news.vote_count.")
+    parser.add_argument("--anonymous-votes", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--news", type=int, default=20)
+    args = parser.parse_args()
+    return asyncio.run(run(args.anonymous_votes, args.users, args.concurrency, args.news))
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,31 +1,193 @@
 # app/utils/xls_to_database.py
-import pandas as pd
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.ev_registration import EVRegistration
-
-async def load_excel_to_db(file_path: str, db: AsyncSession):
-    # 엑셀 파일 읽기
-    df = pd.read_excel(file_path, header=0)
-
-    # 엑셀 파일의 열 이름을 출력하여 확인
-    print(df.columns)
-
-    # '년월'을 'year'와 'month'로 분리
-    df['year'] = df['년월'].apply(lambda x: int(str(x)[:4]))
-    df['month'] = df['년월'].apply(lambda x: int(str(x)[5:7]))
-
-    # 각 지역별 데이터를 변환하여 삽입
-    regions = df.columns[1:-1]  # '년월'과 '합계'를 제외한 나머지 열 이름
-    for region in regions:
-        region_df = df[['year', 'month', region]]
-        region_df.columns = ['year', 'month', 'count']
-        region_df['count'] = pd.to_numeric(region_df['count'], errors='coerce').fillna(0).astype(int)  # NaN을 0으로 채우고 정수형으로 변환
-        for _, row in region_df.iterrows():
-            registration = EVRegistration(
-                region=region,
-                year=int(row["year"]),
-                month=int(row["month"]),
-                count=int(row["count"])
-            )
-            db.add(registration)
-    await db.commit()
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, List, Optional, Tuple
+from app.config import get_logger
+from app.core.config import settings
+from app.crud.ev_registration import bulk_upsert_ev_registrations
+from app.database import SessionLocal
+from app.utils.jobs import Job, jobs
+
+logger = get_logger()
+
+PERIOD_COLUMN = '년월'
+TOTAL_COLUMN = '합계'
+EXCEL_SUFFIXES = ('.xls', '.xlsx', '.xlsm')  # pandas는 .xls를 xlrd로, .xlsx/.xlsm을 openpyxl로 읽습니다.
+UPLOAD_FIELD = b'file'
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # 경계 문자열과 파트 헤더 여유분
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+class UploadTooLargeError(ValueError):
+    pass
+
+def parse_registrations(df) -> List[dict]:
+    """
+    '년월' 행 x 지역 열로 된 넓은 시트를 (region, year, month, count) 행 목록으로 바꿉니다.
+    모든 변환과 검증은 열 단위 pandas 연산으로 처리하며, 잘못된 값이 있으면 해당 행 번호와 함께 ValueError를 냅니다.
+    """
+    import pandas as pd  # pandas는 무거우므로 업로드 시점에만 로드합니다.
+
+    if PERIOD_COLUMN not in df.columns:
+        raise ValueError(f"'{PERIOD_COLUMN}' column is missing")
+    df = df.dropna(how='all')
+    regions = [column for column in df.columns if column not in (PERIOD_COLUMN, TOTAL_COLUMN)]
+    if not regions:
+        raise ValueError("No region columns found")
+
+    # '2023-06', '2023.06', '202306', 날짜 셀 모두 앞의 연도 4자리와 월 1~2자리로 읽습니다.
+    period = df[PERIOD_COLUMN].astype(str).str.extract(r'^(\d{4})\D?(\d{1,2})')
+    year = pd.to_numeric(period[0], errors='coerce')
+    month = pd.to_numeric(period[1], errors='coerce')
+    invalid = year.isna() | ~month.between(1, 12)
+    if invalid.any():
+        raise ValueError(f"Invalid '{PERIOD_COLUMN}' values in rows {_sheet_rows(df.index[invalid])}")
+
+    counts = df[regions].apply(pd.to_numeric, errors='coerce')
+    # 빈 칸은 0으로 보고, 숫자가 아닌 값이나 음수는 거부합니다.
+    bad = (counts.isna() & df[regions].notna()) | (counts < 0)
+    if bad.to_numpy().any():
+        raise ValueError(f"Invalid registration counts in rows {_sheet_rows(df.index[bad.any(axis=1)])}")
+
+    long = (
+        counts.fillna(0).astype('int64')
+        .assign(year=year.astype('int64'), month=month.astype('int64'))
+        .melt(id_vars=['year', 'month'], var_name='region', value_name='count')
+    )
+    duplicated = long.duplicated(['region', 'year', 'month'])
+    if duplicated.any():
+        periods = sorted({f"{y}-{m:02d}" for y, m in long.loc[duplicated, ['year', 'month']].itertuples(index=False)})
+        raise ValueError(f"Duplicate periods in sheet: {', '.join(periods)}")
+    long['region'] = long['region'].astype(str)
+    return long[['region', 'year', 'month', 'count']].to_dict('records')
+
+def _sheet_rows(index, limit: int = 10) -> str:
+    # 헤더가 1행이므로 DataFrame 인덱스 0이 엑셀 2행입니다.
+    rows = [str(position + 2) for position in list(index)[:limit]]
+    return ', '.join(rows) + (' ...' if len(index) > limit else '')
+
+def read_registrations(file_path: str) -> List[dict]:
+    """엑셀 파일을 읽어 (region, year, month, count) 행 목록으로 바꿉니다. 프로세스 풀에서 실행됩니다."""
+    import pandas as pd  # pandas는 무거우므로 업로드 시점에만 로드합니다.
+
+    return parse_registrations(pd.read_excel(file_path, header=0))
+
+async def save_upload(stream: AsyncIterator[bytes], content_type: str, max_bytes: int) -> Tuple[str, str]:
+    """
+    multipart/form-data 요청 본문을 받는 대로 파싱해 'file' 파트를 임시 파일에 바로 씁니다.
+    본문 전체를 먼저 받아 두지 않으므로, Content-Length가 없는 요청도 파일이 max_bytes를 넘는 순간
+    쓰던 파일을 지우고 UploadTooLargeError를 냅니다. 파일 쓰기는 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    (임시 파일 경로, 업로드된 파일 이름)을 반환합니다.
+    """
+    from python_multipart.multipart import MultipartParser, parse_options_header
+
+    media_type, options = parse_options_header(content_type)
+    if media_type != b'multipart/form-data' or not options.get(b'boundary'):
+        raise ValueError("Expected a multipart/form-data body")
+
+    upload = {'path': None, 'filename': None, 'target': None, 'active': False}
+    headers, field, value, pending = {}, bytearray(), bytearray(), []
+
+    def on_header_field(data, start, end):
+        field.extend(data[start:end])
+
+    def on_header_value(data, start, end):
+        value.extend(data[start:end])
+
+    def on_header_end():
+        headers[bytes(field).lower()] = bytes(value)
+        field.clear()
+        value.clear()
+
+    def on_headers_finished():
+        _, disposition = parse_options_header(headers.pop(b'content-disposition', b''))
+        headers.clear()
+        if disposition.get(b'name') != UPLOAD_FIELD or b'filename' not in disposition or upload['path']:
+            return
+        filename = disposition[b'filename'].decode('utf-8', errors='replace')
+        suffix = os.path.splitext(filename)[1].lower()
+        if suffix not in EXCEL_SUFFIXES:
+            raise ValueError(f"Unsupported file type; expected one of {', '.join(EXCEL_SUFFIXES)}")
+        # 사용자가 보낸 파일 이름은 경로에 쓰지 않습니다.
+        fd, upload['path'] = tempfile.mkstemp(prefix='ev-upload-', suffix=suffix)
+        upload['target'] = os.fdopen(fd, 'wb')
+        upload['filename'] = filename
+        upload['active'] = True
+
+    def on_part_data(data, start, end):
+        if upload['active']:
+            pending.append(data[start:end])
+
+    def on_part_end():
+        upload['active'] = False
+
+    parser = MultipartParser(options[b'boundary'], {
+        'on_header_field': on_header_field,
+        'on_header_value': on_header_value,
+        'on_header_end': on_header_end,
+        'on_headers_finished': on_headers_finished,
+        'on_part_data': on_part_data,
+        'on_part_end': on_part_end,
+    })
+    received = size = 0
+    try:
+        async for chunk in stream:
+            received += len(chunk)
+            # 파일이 아닌 필드로 본문을 키우는 요청도 같은 한도로 막습니다.
+            if received > max_bytes + MULTIPART_OVERHEAD_BYTES:
+                raise UploadTooLargeError(f"File exceeds the {max_bytes} byte upload limit")
+            parser.write(chunk)
+            if pending:
+                data = b''.join(pending)
+                pending.clear()
+                size += len(data)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"File exceeds the {max_bytes} byte upload limit")
+                await asyncio.to_thread(upload['target'].write, data)
+        parser.finalize()
+        if upload['path'] is None:
+            raise ValueError("A file field is required")
+    except BaseException:
+        if upload['target'] is not None:
+            upload['target'].close()
+            os.remove(upload['path'])
+        raise
+    upload['target'].close()
+    return upload['path'], upload['filename']
+
+def _executor_instance() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 이벤트 루프와 스레드가 도는 서버 프로세스를 fork하지 않도록 spawn으로 작업 프로세스를 만듭니다.
+        _executor = ProcessPoolExecutor(max_workers=settings.EV_IMPORT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+def shutdown_import_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+async def run_ev_import_job(job: Job, file_path: str, filename: Optional[str] = None):
+    def progress(written: int):
+        job.completed += written
+
+    try:
+        # 엑셀 파싱은 CPU 작업이므로 프로세스 풀에서 실행하고, 쓰기는 청크마다 진행률을 갱신합니다.
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(_executor_instance(), read_registrations, file_path)
+        job.total = len(rows)
+        async with SessionLocal() as session:
+            imported = await bulk_upsert_ev_registrations(session, rows, on_chunk=progress)
+        job.result = {'filename': filename, 'rows': imported}
+        logger.info(f"EV registrations imported: {imported} rows (job {job.id})")
+    finally:
+        os.remove(file_path)
+
+def start_ev_import_job(file_path: str, filename: Optional[str] = None) -> Job:
+    job = jobs.create("ev_registration_import")
+    jobs.start(job, lambda job: run_ev_import_job(job, file_path, filename))
+    return job
@@ -0,0 +1,38 @@
+# app/vehicle_scrapers/scrape_jobs.py
+from typing import List, Optional
+from app.config import get_logger
+from app.crud.vehicle import upsert_vehicle_spec
+from app.database import SessionLocal
+from app.schemas.vehicle import VehicleSpecCreate
+from app.utils.jobs import Job, jobs
+from app.vehicle_scrapers.tesla_scraper import scrape_tesla_specs_batch
+
+logger = get_logger()
+
+def to_vehicle_spec(specs: dict) -> VehicleSpecCreate:
+    # 스크래퍼는 찾지 못한 값을 0 또는 빈 문자열로 돌려주므로, 저장 전에 비어 있는 값으로 취급합니다.
+    cleaned = {key: value for key, value in specs.items() if value not in (None, '', 0, 0.0)}
+    return VehicleSpecCreate(**cleaned)
+
+async def run_vehicle_scrape_job(job: Job, urls: List[str], concurrency: int):
+    async def store(url: str, specs: Optional[dict], error: Optional[Exception]):
+        if error is not None or specs is None:
+            job.mark_failed(f"{url}: {error or 'no data'}")
+            return
+        try:
+            vehicle_spec = to_vehicle_spec(specs)
+            async with SessionLocal() as session:
+                await upsert_vehicle_spec(session, vehicle_spec)
+            job.mark_done()
+        except Exception as e:
+            logger.error(f"Failed to store specs for {url}: {e}")
+            job.mark_failed(f"{url}: {e}")
+
+    await scrape_tesla_specs_batch(urls, concurrency=concurrency, on_result=store)
+
+def start_vehicle_scrape_job(urls: List[str], concurrency: int) -> Job:
+    # 같은 URL이 여러 번 들어와도 한 번만 스크래핑합니다.
+    unique_urls = list(dict.fromkeys(urls))
+    job = jobs.create("vehicle_scrape", total=len(unique_urls))
+    jobs.start(job, lambda job: run_vehicle_scrape_job(job, unique_urls, concurrency))
+    return job
@@ -1,63 +1,138 @@
-from playwright.async_api import async_playwright
 import asyncio
 import re
+from typing import Awaitable, Callable, Dict, List, Optional
 from app.config import get_logger
 
 logger = get_logger()
 
+# 스펙 표의 모든 행을 한 번의 evaluate로 {라벨: 값} 형태로 수집합니다.
+SPECS_TABLE_SCRIPT = """
+() => {
+    const heading = document.querySelector('h2.tcl-specs-table__heading strong');
+    const rows = {};
+    document.querySelectorAll('.tcl-specs-table h6').forEach((label) => {
+        const key = (label.textContent || '').trim();
+        if (!key || key in rows) return;
+        let sibling = label.nextElementSibling;
+        while (sibling && sibling.tagName !== 'DIV') sibling = sibling.nextElementSibling;
+        const value = sibling ? sibling.querySelector('p') : null;
+        rows[key] = value ? (value.textContent || '').trim() : '';
+    });
+    return { model: heading ? (heading.textContent || '').trim() : '', rows };
+}
+"""
+
+DEFAULT_CONCURRENCY = 4
+
+def parse_float(text: str) -> float:
+    try:
+        match = re.search(r'\d+(\.\d+)?', text.replace(',', ''))
+        return float(match.group()) if match else 0.0
+    except ValueError:
+        logger.error(f"Failed to parse float from text: {text}")
+        return 0.0
+
+def parse_int(text: str) -> int:
+    try:
+        match = re.search(r'\d+', text.replace(',', ''))
+        return int(match.group()) if match else 0
+    except ValueError:
+        logger.error(f"Failed to parse int from text: {text}")
+        return 0
+
+def find_value(rows: Dict[str, str], keyword: str) -> str:
+    """라벨에 keyword가 포함된 첫 번째 행의 값을 반환합니다. 없으면 빈 문자열."""
+    for label, value in rows.items():
+        if keyword in label:
+            return value
+    logger.warning(f"Spec row not found for label: {keyword}")
+    return ''
+
+def parse_tesla_specs(model_name: str, rows: Dict[str, str]) -> dict:
+    """evaluate로 수집한 {라벨: 값} 맵을 VehicleSpec 필드로 변환합니다."""
+    return {
+        "manufacturer": "Tesla",
+        "model": model_name.strip(),
+        "drive_type": find_value(rows, "드라이브"),
+        "battery_type": find_value(rows, "배터리"),
+        "range_km": parse_float(find_value(rows, "주행 가능 거리")),
+        "acceleration": parse_float(find_value(rows, "도달시간")),
+        "weight_kg": parse_float(find_value(rows, "중량")),
+        "storage_l": parse_int(find_value(rows, "적재공간").replace('L', '')),
+        "wheel_size": find_value(rows, "휠"),
+        "seating_capacity": parse_int(find_value(rows, "좌석수")),
+        "display_inch": parse_float(find_value(rows, "디스플레이")),
+        "minimum_ground_clearance_mm": parse_int(find_value(rows, "최저 지상고").replace('mm', '')),
+        "width_mm": parse_int(find_value(rows, "전폭").split(':')[-1].replace('m', '')),
+        "height_mm": parse_int(find_value(rows, "전고").replace(' mm', '')),
+        "length_mm": parse_int(find_value(rows, "전장").replace(' mm', '')),
+        "track_mm_front": parse_int(find_value(rows, "트랙 - 전면").split(' 및')[0].replace('mm', '')),
+        "track_mm_rear": parse_int(find_value(rows, "트랙 - 후면").split(' 및')[-1].replace('mm', '')),
+    }
+
+async def extract_specs(page, url: str) -> dict:
+    await page.goto(url, wait_until='networkidle')
+    try:
+        await page.wait_for_selector('.tcl-specs-table', timeout=10000)
+    except Exception as e:
+        logger.error(f"Specs table not found on {url}: {str(e)}")
+    data = await page.evaluate(SPECS_TABLE_SCRIPT)
+    return parse_tesla_specs(data.get('model', ''), data.get('rows', {}))
+
 async def scrape_tesla_specs(url: str):
+    from playwright.async_api import async_playwright  # Playwright는 실제로 사용할 때만 로드합니다.
     async with async_playwright() as p:
         browser = await p.firefox.launch(headless=True)
-        page = await browser.new_page()
-        
-        await page.goto(url, wait_until='networkidle')
-
-        async def safe_text(selector):
-            try:
-                element = await page.wait_for_selector(selector, timeout=10000)
-                return await element.text_content() or ''
-            except Exception as e:
-                logger.error(f"Error extracting text for {selector}: {str(e)}")
-                return ''
-
-        def parse_float(text: str) -> float:
-            try:
-                match = re.search(r'\d+(\.\d+)?', text)
-                return float(match.group()) if match else 0.0
-            except ValueError:
-                logger.error(f"Failed to parse float from text: {text}")
-                return 0.0
-
-        def parse_int(text: str) -> int:
-            try:
-                match = re.search(r'\d+', text)
-                return int(match.group()) if match else 0
-            except ValueError:
-                logger.error(f"Failed to parse int from text: {text}")
-                return 0
-
-        # Extracting the model name using the specific selector provided
-        model_name = await safe_text('h2.tcl-specs-table__heading strong')
-
-        specs = {
-            "manufacturer": "Tesla",
-            "model": model_name.strip(),
-            "drive_type": (await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "드라이브")]/following-sibling::div/p')),
-            "battery_type": (await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "배터리")]/following-sibling::div/p')),
-            "range_km": parse_float(await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "주행 가능 거리")]/following-sibling::div/p')),
-            "acceleration": parse_float(await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "도달시간")]/following-sibling::div/p')),
-            "weight_kg": parse_float(await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "중량")]/following-sibling::div/p')),
-            "storage_l": parse_int((await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "적재공간")]/following-sibling::div/p')).replace('L', '')),
-            "wheel_size": (await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "휠")]/following-sibling::div/p')),
-            "seating_capacity": parse_int(await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "좌석수")]/following-sibling::div/p')),
-            "display_inch": parse_float(await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "디스플레이")]/following-sibling::div/p')),
-            "minimum_ground_clearance_mm": parse_int((await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "최저 지상고")]/following-sibling::div/p')).replace('mm', '')),
-            "width_mm": parse_int((await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "전폭")]/following-sibling::div/p')).split(':')[-1].replace('m', '')),
-            "height_mm": parse_int((await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "전고")]/following-sibling::div/p')).replace(' mm', '')),
-            "length_mm": parse_int((await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "전장")]/following-sibling::div/p')).replace(' mm', '')),
-            "track_mm_front": parse_int((await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "트랙 - 전면")]/following-sibling::div/p')).split(' 및')[0].replace('mm', '')),
-            "track_mm_rear": parse_int((await safe_text('.tcl-specs-table >> xpath=//h6[contains(text(), "트랙 - 후면")]/following-sibling::div/p')).split(' 및')[-1].replace('mm', ''))
-        }
-
-        await browser.close()
-        return specs
+        try:
+            page = await browser.new_page()
+            return await extract_specs(page, url)
+        finally:
+            await browser.close()
+
+async def scrape_tesla_specs_batch(
+    urls: List[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_result: Optional[Callable[[str, Optional[dict], Optional[Exception]], Awaitable[None]]] = None,
+) -> List[Optional[dict]]:
+    """
+    여러 모델 URL을 하나의 브라우저에서 동시에 스크래핑합니다.
+    concurrency 개의 브라우저 컨텍스트를 만들어 워커들이 공유하며, 결과는 입력 순서대로 반환합니다.
+    실패한 URL의 결과는 None 입니다. on_result가 주어지면 URL마다 (url, specs, error)로 호출됩니다.
+    """
+    results: List[Optional[dict]] = [None] * len(urls)
+    if not urls:
+        return results
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, url in enumerate(urls):
+        queue.put_nowait((index, url))
+
+    from playwright.async_api import async_playwright
+    async with async_playwright() as p:
+        browser = await p.firefox.launch(headless=True)
+        try:
+            async def worker():
+                context = await browser.new_context()
+                page = await context.new_page()
+                try:
+                    while True:
+                        try:
+                            index, url = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        error = None
+                        try:
+                            results[index] = await extract_specs(page, url)
+                        except Exception as e:
+                            logger.error(f"Error scraping {url}: {str(e)}")
+                            error = e
+                        if on_result is not None:
+                            await on_result(url, results[index], error)
+                finally:
+                    await context.close()
+
+            await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(urls))))))
+        finally:
+            await browser.close()
+
+    return results
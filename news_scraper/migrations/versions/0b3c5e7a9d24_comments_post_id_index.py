@@ -0,0 +1,29 @@
+"""composite index for paginated comments and normalized comment timestamps
+
+Revision ID: 0b3c5e7a9d24
+Revises: f2b6d8a47c19
+Create Date: 2026-10-19 20:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b3c5e7a9d24'
+down_revision: Union[str, None] = 'f2b6d8a47c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CURRENT_TIMESTAMP로 저장된 초 단위 값('YYYY-MM-DD HH:MM:SS')을 SQLAlchemy 형식(마이크로초 포함)으로 맞춰,
+    # 키셋 커서의 (created_at, id) 비교가 문자열 비교로도 정확하도록 합니다.
+    op.execute("UPDATE comments SET created_at = created_at || '.000000' WHERE length(created_at) = 19")
+    op.create_index('ix_comments_post_id_created_at_id', 'comments', ['post_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_post_id_created_at_id', table_name='comments')
@@ -0,0 +1,38 @@
+"""index audit: likes, ev registrations and vehicle specs lookups
+
+Revision ID: 1c7e9a3f5b62
+Revises: 0b3c5e7a9d24
+Create Date: 2026-10-19 21:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c7e9a3f5b62'
+down_revision: Union[str, None] = '0b3c5e7a9d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_community_post_likes_post_id', 'community_post_likes', ['post_id'], unique=False)
+    # (region, year, month)가 region 단일 인덱스를 대신합니다.
+    op.create_index('ix_ev_registrations_region_year_month', 'ev_registrations', ['region', 'year', 'month'], unique=False)
+    op.create_index('ix_ev_registrations_year_month', 'ev_registrations', ['year', 'month'], unique=False)
+    op.drop_index('ix_ev_registrations_region', table_name='ev_registrations')
+    op.create_index('ix_vehicle_specs_manufacturer_model', 'vehicle_specs', ['manufacturer', 'model'], unique=False)
+    op.create_index('ix_vehicle_specs_model', 'vehicle_specs', ['model'], unique=False)
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicle_specs_model', table_name='vehicle_specs')
+    op.drop_index('ix_vehicle_specs_manufacturer_model', table_name='vehicle_specs')
+    op.create_index('ix_ev_registrations_region', 'ev_registrations', ['region'], unique=False)
+    op.drop_index('ix_ev_registrations_year_month', table_name='ev_registrations')
+    op.drop_index('ix_ev_registrations_region_year_month', table_name='ev_registrations')
+    op.drop_index('ix_community_post_likes_post_id', table_name='community_post_likes')
@@ -0,0 +1,49 @@
+"""ev registration yearly and monthly rollups
+
+Revision ID: 2e8a4c6d1f93
+Revises: 1c7e9a3f5b62
+Create Date: 2026-10-19 21:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e8a4c6d1f93'
+down_revision: Union[str, None] = '1c7e9a3f5b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ev_registration_yearly_rollups',
+    sa.Column('region', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('region', 'year')
+    )
+    op.create_index(op.f('ix_ev_registration_yearly_rollups_year'), 'ev_registration_yearly_rollups', ['year'], unique=False)
+    op.create_table('ev_registration_monthly_rollups',
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('year', 'month')
+    )
+    # 기존 등록 데이터로 롤업을 채웁니다.
+    op.execute(
+        "INSERT INTO ev_registration_yearly_rollups (region, year, total) "
+        "SELECT region, year, coalesce(sum(count), 0) FROM ev_registrations GROUP BY region, year"
+    )
+    op.execute(
+        "INSERT INTO ev_registration_monthly_rollups (year, month, total) "
+        "SELECT year, month, coalesce(sum(count), 0) FROM ev_registrations GROUP BY year, month"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ev_registration_monthly_rollups')
+    op.drop_index(op.f('ix_ev_registration_yearly_rollups_year'), table_name='ev_registration_yearly_rollups')
+    op.drop_table('ev_registration_yearly_rollups')
@@ -0,0 +1,68 @@
+"""news normalized link unique index and feed watermarks
+
+Revision ID: 3b8e1f2a9c4d
+Revises: 262f5a679881
+Create Date: 2026-10-19 16:10:00.000000
+
+"""
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e1f2a9c4d'
+down_revision: Union[str, None] = '262f5a679881'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.utils.link_utils.normalize_link as of this revision. Copied so that later changes to the
+# app module do not change what this migration does on a fresh database.
+IGNORED_QUERY_PARAMS = {"oc", "fbclid", "gclid"}
+
+def normalize_link(link: str) -> str:
+    parts = urlsplit(link.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in IGNORED_QUERY_PARAMS and not key.startswith("utm_")
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('news') as batch_op:
+        batch_op.add_column(sa.Column('normalized_link', sa.String(), nullable=True))
+
+    # Backfill the normalized link and drop duplicate articles, keeping the oldest row
+    conn = op.get_bind()
+    has_votes = sa.inspect(conn).has_table('votes')
+    rows = conn.execute(sa.text('SELECT id, link FROM news ORDER BY id')).fetchall()
+    kept = {}
+    for news_id, link in rows:
+        key = normalize_link(link)
+        if key in kept:
+            if has_votes:
+                conn.execute(sa.text('UPDATE votes SET news_id = :kept WHERE news_id = :dup'), {'kept': kept[key], 'dup': news_id})
+            conn.execute(sa.text('DELETE FROM news WHERE id = :id'), {'id': news_id})
+        else:
+            kept[key] = news_id
+            conn.execute(sa.text('UPDATE news SET normalized_link = :key WHERE id = :id'), {'key': key, 'id': news_id})
+
+    op.create_index(op.f('ix_news_normalized_link'), 'news', ['normalized_link'], unique=True)
+
+    op.create_table('feed_watermarks',
+    sa.Column('feed_url', sa.String(), nullable=False),
+    sa.Column('last_published_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('feed_url')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('feed_watermarks')
+    op.drop_index(op.f('ix_news_normalized_link'), table_name='news')
+    with op.batch_alter_table('news') as batch_op:
+        batch_op.drop_column('normalized_link')
@@ -0,0 +1,44 @@
+"""unique (region, year, month) on ev_registrations for idempotent imports
+
+Revision ID: 3f1b5d7e9a20
+Revises: 2e8a4c6d1f93
+Create Date: 2026-10-19 22:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1b5d7e9a20'
+down_revision: Union[str, None] = '2e8a4c6d1f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 예전 업로드는 매번 행을 추가했으므로 (region, year, month)마다 가장 최근 행만 남깁니다.
+    op.execute(
+        "DELETE FROM ev_registrations WHERE id NOT IN "
+        "(SELECT max(id) FROM ev_registrations GROUP BY region, year, month)"
+    )
+    op.drop_index('ix_ev_registrations_region_year_month', table_name='ev_registrations')
+    op.create_index('ix_ev_registrations_region_year_month', 'ev_registrations', ['region', 'year', 'month'], unique=True)
+    # 중복이 빠진 합계로 롤업을 다시 채웁니다.
+    op.execute("DELETE FROM ev_registration_yearly_rollups")
+    op.execute("DELETE FROM ev_registration_monthly_rollups")
+    op.execute(
+        "INSERT INTO ev_registration_yearly_rollups (region, year, total) "
+        "SELECT region, year, coalesce(sum(count), 0) FROM ev_registrations GROUP BY region, year"
+    )
+    op.execute(
+        "INSERT INTO ev_registration_monthly_rollups (year, month, total) "
+        "SELECT year, month, coalesce(sum(count), 0) FROM ev_registrations GROUP BY year, month"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ev_registrations_region_year_month', table_name='ev_registrations')
+    op.create_index('ix_ev_registrations_region_year_month', 'ev_registrations', ['region', 'year', 'month'], unique=False)
@@ -0,0 +1,114 @@
+"""dictionary-encoded region and yyyymm period on ev_registrations
+
+Revision ID: 4a2c6e8b0d35
+Revises: 3f1b5d7e9a20
+Create Date: 2026-10-19 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a2c6e8b0d35'
+down_revision: Union[str, None] = '3f1b5d7e9a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # regions: 이름 PK -> 정수 id PK. 작은 사전 테이블이므로 새로 만들어 옮깁니다.
+    op.drop_index('ix_regions_name', table_name='regions')
+    op.rename_table('regions', '_regions_old')
+    op.create_table('regions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_regions_name'), 'regions', ['name'], unique=True)
+    op.execute(
+        "INSERT INTO regions (name) SELECT name FROM _regions_old "
+        "UNION SELECT region FROM ev_registrations WHERE region IS NOT NULL ORDER BY 1"
+    )
+    op.drop_table('_regions_old')
+
+    op.add_column('ev_registrations', sa.Column('region_id', sa.Integer(), nullable=True))
+    op.add_column('ev_registrations', sa.Column('period', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE ev_registrations SET "
+        "region_id = (SELECT id FROM regions WHERE regions.name = ev_registrations.region), "
+        "period = year * 100 + month"
+    )
+    # ev_registrations에는 FTS 트리거가 없으므로 batch 모드로 다시 만들어도 됩니다.
+    with op.batch_alter_table('ev_registrations', schema=None) as batch_op:
+        batch_op.drop_index('ix_ev_registrations_region_year_month')
+        batch_op.drop_index('ix_ev_registrations_year_month')
+        batch_op.drop_column('region')
+        batch_op.drop_column('year')
+        batch_op.drop_column('month')
+        batch_op.create_foreign_key('fk_ev_registrations_region_id_regions', 'regions', ['region_id'], ['id'])
+        batch_op.create_index('ix_ev_registrations_region_id_period', ['region_id', 'period'], unique=True)
+        batch_op.create_index('ix_ev_registrations_period', ['period'], unique=False)
+
+    op.drop_index(op.f('ix_ev_registration_yearly_rollups_year'), table_name='ev_registration_yearly_rollups')
+    op.drop_table('ev_registration_yearly_rollups')
+    op.create_table('ev_registration_yearly_rollups',
+    sa.Column('region_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['region_id'], ['regions.id'], name='fk_ev_registration_yearly_rollups_region_id_regions'),
+    sa.PrimaryKeyConstraint('region_id', 'year')
+    )
+    op.create_index(op.f('ix_ev_registration_yearly_rollups_year'), 'ev_registration_yearly_rollups', ['year'], unique=False)
+    op.execute(
+        "INSERT INTO ev_registration_yearly_rollups (region_id, year, total) "
+        "SELECT region_id, period / 100, coalesce(sum(count), 0) FROM ev_registrations "
+        "WHERE region_id IS NOT NULL AND period IS NOT NULL GROUP BY region_id, period / 100"
+    )
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ev_registration_yearly_rollups_year'), table_name='ev_registration_yearly_rollups')
+    op.drop_table('ev_registration_yearly_rollups')
+    op.create_table('ev_registration_yearly_rollups',
+    sa.Column('region', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('region', 'year')
+    )
+    op.create_index(op.f('ix_ev_registration_yearly_rollups_year'), 'ev_registration_yearly_rollups', ['year'], unique=False)
+
+    op.add_column('ev_registrations', sa.Column('region', sa.String(), nullable=True))
+    op.add_column('ev_registrations', sa.Column('year', sa.Integer(), nullable=True))
+    op.add_column('ev_registrations', sa.Column('month', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE ev_registrations SET "
+        "region = (SELECT name FROM regions WHERE regions.id = ev_registrations.region_id), "
+        "year = period / 100, month = period % 100"
+    )
+    with op.batch_alter_table('ev_registrations', schema=None) as batch_op:
+        batch_op.drop_index('ix_ev_registrations_period')
+        batch_op.drop_index('ix_ev_registrations_region_id_period')
+        batch_op.drop_constraint('fk_ev_registrations_region_id_regions', type_='foreignkey')
+        batch_op.drop_column('period')
+        batch_op.drop_column('region_id')
+        batch_op.create_index('ix_ev_registrations_region_year_month', ['region', 'year', 'month'], unique=True)
+        batch_op.create_index('ix_ev_registrations_year_month', ['year', 'month'], unique=False)
+    op.execute(
+        "INSERT INTO ev_registration_yearly_rollups (region, year, total) "
+        "SELECT region, year, coalesce(sum(count), 0) FROM ev_registrations "
+        "WHERE region IS NOT NULL AND year IS NOT NULL GROUP BY region, year"
+    )
+
+    op.drop_index(op.f('ix_regions_name'), table_name='regions')
+    op.rename_table('regions', '_regions_new')
+    op.create_table('regions',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_index(op.f('ix_regions_name'), 'regions', ['name'], unique=False)
+    op.execute("INSERT INTO regions (name) SELECT name FROM _regions_new")
+    op.drop_table('_regions_new')
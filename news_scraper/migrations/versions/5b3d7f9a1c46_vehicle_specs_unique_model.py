@@ -0,0 +1,33 @@
+"""unique (manufacturer, model) on vehicle_specs for idempotent upserts
+
+Revision ID: 5b3d7f9a1c46
+Revises: 4a2c6e8b0d35
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b3d7f9a1c46'
+down_revision: Union[str, None] = '4a2c6e8b0d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 동시에 실행된 스크래핑 작업이 만든 중복 스펙은 가장 최근 행만 남깁니다.
+    op.execute(
+        "DELETE FROM vehicle_specs WHERE id NOT IN "
+        "(SELECT max(id) FROM vehicle_specs GROUP BY manufacturer, model)"
+    )
+    op.drop_index('ix_vehicle_specs_manufacturer_model', table_name='vehicle_specs')
+    op.create_index('ix_vehicle_specs_manufacturer_model', 'vehicle_specs', ['manufacturer', 'model'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicle_specs_manufacturer_model', table_name='vehicle_specs')
+    op.create_index('ix_vehicle_specs_manufacturer_model', 'vehicle_specs', ['manufacturer', 'model'], unique=False)
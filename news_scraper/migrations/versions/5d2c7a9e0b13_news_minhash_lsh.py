@@ -0,0 +1,113 @@
+"""news minhash signatures, lsh buckets and duplicate links
+
+Revision ID: 5d2c7a9e0b13
+Revises: 3b8e1f2a9c4d
+Create Date: 2026-10-19 16:30:00.000000
+
+"""
+import re
+import struct
+import zlib
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c7a9e0b13'
+down_revision: Union[str, None] = '3b8e1f2a9c4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The signature and bucket functions of app.utils.minhash as of this revision. Copied so that later
+# changes to the app module do not change what this migration writes on a fresh database.
+NGRAM_SIZE = 3
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+def _permutations(count: int):
+    state = 0x9E3779B97F4A7C15
+    params = []
+    for _ in range(count):
+        state = (state * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+        a = (state >> 3) % (_MERSENNE_PRIME - 1) + 1
+        state = (state * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+        b = (state >> 3) % _MERSENNE_PRIME
+        params.append((a, b))
+    return params
+
+_PERMUTATIONS = _permutations(NUM_PERM)
+_SOURCE_SUFFIX = re.compile(r"\s+-\s+[^-]+$")
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+def signature(title: str) -> List[int]:
+    text = _NON_WORD.sub("", _SOURCE_SUFFIX.sub("", title.strip())).lower()
+    if len(text) <= NGRAM_SIZE:
+        shingles = {text.encode("utf-8")} if text else set()
+    else:
+        shingles = {text[i:i + NGRAM_SIZE].encode("utf-8") for i in range(len(text) - NGRAM_SIZE + 1)}
+    hashes = [zlib.crc32(shingle) for shingle in shingles]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in _PERMUTATIONS]
+
+def pack_signature(values: List[int]) -> bytes:
+    return struct.pack(f"<{NUM_PERM}I", *values)
+
+def band_buckets(values: List[int]) -> List[int]:
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = values[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        buckets.append((band << 32) | zlib.crc32(struct.pack(f"<{LSH_ROWS}I", *rows)))
+    return buckets
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('news') as batch_op:
+        batch_op.add_column(sa.Column('minhash', sa.LargeBinary(), nullable=True))
+
+    op.create_table('news_lsh_buckets',
+    sa.Column('bucket', sa.Integer(), nullable=False),
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('bucket', 'news_id')
+    )
+    op.create_table('news_duplicates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('story_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('link', sa.String(), nullable=False),
+    sa.Column('normalized_link', sa.String(), nullable=True),
+    sa.Column('published_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['story_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_news_duplicates_id'), 'news_duplicates', ['id'], unique=False)
+    op.create_index(op.f('ix_news_duplicates_story_id'), 'news_duplicates', ['story_id'], unique=False)
+    op.create_index(op.f('ix_news_duplicates_normalized_link'), 'news_duplicates', ['normalized_link'], unique=True)
+
+    # Backfill signatures and buckets for the existing news
+    conn = op.get_bind()
+    for news_id, title in conn.execute(sa.text('SELECT id, title FROM news')).fetchall():
+        values = signature(title)
+        conn.execute(sa.text('UPDATE news SET minhash = :minhash WHERE id = :id'), {'minhash': pack_signature(values), 'id': news_id})
+        conn.execute(
+            sa.text('INSERT OR IGNORE INTO news_lsh_buckets (bucket, news_id) VALUES (:bucket, :news_id)'),
+            [{'bucket': bucket, 'news_id': news_id} for bucket in band_buckets(values)],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_news_duplicates_normalized_link'), table_name='news_duplicates')
+    op.drop_index(op.f('ix_news_duplicates_story_id'), table_name='news_duplicates')
+    op.drop_index(op.f('ix_news_duplicates_id'), table_name='news_duplicates')
+    op.drop_table('news_duplicates')
+    op.drop_table('news_lsh_buckets')
+    with op.batch_alter_table('news') as batch_op:
+        batch_op.drop_column('minhash')
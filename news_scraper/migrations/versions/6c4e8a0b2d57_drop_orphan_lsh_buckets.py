@@ -0,0 +1,27 @@
+"""drop LSH buckets left behind by deleted news
+
+Revision ID: 6c4e8a0b2d57
+Revises: 5b3d7f9a1c46
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c4e8a0b2d57'
+down_revision: Union[str, None] = '5b3d7f9a1c46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite는 외래 키를 강제하지 않아 삭제된 기사의 버킷이 남아 있을 수 있습니다.
+    op.execute("DELETE FROM news_lsh_buckets WHERE news_id NOT IN (SELECT id FROM news)")
+
+
+def downgrade() -> None:
+    pass
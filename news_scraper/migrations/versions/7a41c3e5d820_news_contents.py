@@ -0,0 +1,39 @@
+"""news contents for extracted article bodies
+
+Revision ID: 7a41c3e5d820
+Revises: 5d2c7a9e0b13
+Create Date: 2026-10-19 16:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a41c3e5d820'
+down_revision: Union[str, None] = '5d2c7a9e0b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('news_contents',
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('body', sa.LargeBinary(), nullable=True),
+    sa.Column('summary', sa.Text(), nullable=True),
+    sa.Column('image_url', sa.String(), nullable=True),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('fetched_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('news_id')
+    )
+    op.create_index(op.f('ix_news_contents_status'), 'news_contents', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_news_contents_status'), table_name='news_contents')
+    op.drop_table('news_contents')
@@ -0,0 +1,27 @@
+"""drop article contents left behind by deleted news
+
+Revision ID: 7d5f9b1c3e68
+Revises: 6c4e8a0b2d57
+Create Date: 2026-10-20 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d5f9b1c3e68'
+down_revision: Union[str, None] = '6c4e8a0b2d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite는 외래 키를 강제하지 않아 삭제된 기사의 본문이 남아 있을 수 있습니다.
+    op.execute("DELETE FROM news_contents WHERE news_id NOT IN (SELECT id FROM news)")
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,27 @@
+"""next_attempt_at on news_contents for delayed article retries
+
+Revision ID: 8e6a0c2d4f79
+Revises: 7d5f9b1c3e68
+Create Date: 2026-10-20 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e6a0c2d4f79'
+down_revision: Union[str, None] = '7d5f9b1c3e68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # news_contents는 batch 모드로 다시 만들면 FTS 트리거가 사라지므로 ALTER TABLE ADD COLUMN을 그대로 사용합니다.
+    op.add_column('news_contents', sa.Column('next_attempt_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('news_contents', 'next_attempt_at')
@@ -0,0 +1,34 @@
+"""composite indexes for keyset pagination
+
+Revision ID: a9d4e6b21f07
+Revises: 7a41c3e5d820
+Create Date: 2026-10-19 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e6b21f07'
+down_revision: Union[str, None] = '7a41c3e5d820'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CURRENT_TIMESTAMP로 저장된 초 단위 값('YYYY-MM-DD HH:MM:SS')을 SQLAlchemy 형식(마이크로초 포함)으로 맞춰,
+    # 키셋 커서의 (published_at, id) / (created_at, id) 비교가 문자열 비교로도 정확하도록 합니다.
+    for table, column in (('community_posts', 'created_at'), ('news', 'published_at')):
+        op.execute(f"UPDATE {table} SET {column} = {column} || '.000000' WHERE length({column}) = 19")
+    op.create_index('ix_news_published_at_id', 'news', ['published_at', 'id'], unique=False)
+    op.create_index('ix_community_posts_created_at_id', 'community_posts', ['created_at', 'id'], unique=False)
+    op.create_index('ix_community_posts_user_id_created_at_id', 'community_posts', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_community_posts_user_id_created_at_id', table_name='community_posts')
+    op.drop_index('ix_community_posts_created_at_id', table_name='community_posts')
+    op.drop_index('ix_news_published_at_id', table_name='news')
@@ -0,0 +1,36 @@
+"""counters table for maintained row counts
+
+Revision ID: c3f7b8d05e92
+Revises: a9d4e6b21f07
+Create Date: 2026-10-19 18:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f7b8d05e92'
+down_revision: Union[str, None] = 'a9d4e6b21f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('counters',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # 기존 행 수로 카운터를 채웁니다.
+    op.execute(
+        "INSERT INTO counters (name, value) "
+        "SELECT 'news', count(*) FROM news "
+        "UNION ALL SELECT 'community_posts', count(*) FROM community_posts"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('counters')
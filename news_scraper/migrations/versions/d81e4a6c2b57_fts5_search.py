@@ -0,0 +1,80 @@
+"""fts5 trigram search for news and community posts
+
+Revision ID: d81e4a6c2b57
+Revises: c3f7b8d05e92
+Create Date: 2026-10-19 18:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81e4a6c2b57'
+down_revision: Union[str, None] = 'c3f7b8d05e92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.models.search 의 DDL을 이 리비전 시점 그대로 복사해 둡니다.
+# 앱 모듈이 나중에 바뀌어도 새 DB에서 이 마이그레이션이 만드는 스키마는 달라지지 않습니다.
+FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(title, summary, tokenize='trigram')",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news BEGIN
+        INSERT INTO news_fts(rowid, title, summary) VALUES (new.id, new.title, '');
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_au AFTER UPDATE OF title ON news BEGIN
+        UPDATE news_fts SET title = new.title WHERE rowid = new.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_ad AFTER DELETE ON news BEGIN
+        DELETE FROM news_fts WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_contents_fts_ai AFTER INSERT ON news_contents BEGIN
+        UPDATE news_fts SET summary = coalesce(new.summary, '') WHERE rowid = new.news_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_contents_fts_au AFTER UPDATE OF summary ON news_contents BEGIN
+        UPDATE news_fts SET summary = coalesce(new.summary, '') WHERE rowid = new.news_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_contents_fts_ad AFTER DELETE ON news_contents BEGIN
+        UPDATE news_fts SET summary = '' WHERE rowid = old.news_id;
+    END""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS community_posts_fts USING fts5(
+        title, content, content='community_posts', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS community_posts_fts_ai AFTER INSERT ON community_posts BEGIN
+        INSERT INTO community_posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS community_posts_fts_ad AFTER DELETE ON community_posts BEGIN
+        INSERT INTO community_posts_fts(community_posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS community_posts_fts_au AFTER UPDATE OF title, content ON community_posts BEGIN
+        INSERT INTO community_posts_fts(community_posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO community_posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+]
+
+# 이미 있는 데이터로 색인을 채웁니다.
+FTS_REBUILD = [
+    "DELETE FROM news_fts",
+    """INSERT INTO news_fts(rowid, title, summary)
+        SELECT news.id, news.title, coalesce(news_contents.summary, '')
+        FROM news LEFT JOIN news_contents ON news_contents.news_id = news.id""",
+    "INSERT INTO community_posts_fts(community_posts_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    for statement in FTS_DDL + FTS_REBUILD:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for trigger in (
+        'news_fts_ai', 'news_fts_au', 'news_fts_ad',
+        'news_contents_fts_ai', 'news_contents_fts_au', 'news_contents_fts_ad',
+        'community_posts_fts_ai', 'community_posts_fts_ad', 'community_posts_fts_au',
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS community_posts_fts")
+    op.execute("DROP TABLE IF EXISTS news_fts")
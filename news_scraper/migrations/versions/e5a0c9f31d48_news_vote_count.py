@@ -0,0 +1,42 @@
+"""persisted news vote_count and per-user votes
+
+Revision ID: e5a0c9f31d48
+Revises: d81e4a6c2b57
+Create Date: 2026-10-19 19:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a0c9f31d48'
+down_revision: Union[str, None] = 'd81e4a6c2b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # news는 batch 모드로 다시 만들면 FTS 트리거가 사라지므로 ALTER TABLE ADD COLUMN을 그대로 사용합니다.
+    op.add_column('news', sa.Column('vote_count', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('votes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('user_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_votes_user_id_users', 'users', ['user_id'], ['id'])
+        batch_op.create_unique_constraint('uq_votes_news_id_user_id', ['news_id', 'user_id'])
+
+    # 기존 투표 합계로 vote_count를 채웁니다.
+    op.execute(
+        "UPDATE news SET vote_count = coalesce((SELECT sum(vote_value) FROM votes WHERE votes.news_id = news.id), 0)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('votes', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_votes_news_id_user_id', type_='unique')
+        batch_op.drop_constraint('fk_votes_user_id_users', type_='foreignkey')
+        batch_op.drop_column('user_id')
+
+    op.drop_column('news', 'vote_count')
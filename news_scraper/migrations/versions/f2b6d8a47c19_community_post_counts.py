@@ -0,0 +1,37 @@
+"""persisted like_count and comment_count on community posts
+
+Revision ID: f2b6d8a47c19
+Revises: e5a0c9f31d48
+Create Date: 2026-10-19 19:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d8a47c19'
+down_revision: Union[str, None] = 'e5a0c9f31d48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # community_posts는 FTS 트리거가 있어 batch 모드(테이블 재생성) 대신 ALTER TABLE을 사용합니다.
+    op.add_column('community_posts', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('community_posts', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE community_posts SET "
+        "like_count = (SELECT count(*) FROM community_post_likes WHERE community_post_likes.post_id = community_posts.id), "
+        "comment_count = (SELECT count(*) FROM comments WHERE comments.post_id = community_posts.id)"
+    )
+    op.drop_column('community_posts', 'likeCount')
+
+
+def downgrade() -> None:
+    op.add_column('community_posts', sa.Column('likeCount', sa.Integer(), nullable=True))
+    op.execute('UPDATE community_posts SET "likeCount" = like_count')
+    op.drop_column('community_posts', 'comment_count')
+    op.drop_column('community_posts', 'like_count')